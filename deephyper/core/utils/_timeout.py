@@ -1,6 +1,7 @@
 import multiprocessing
 import multiprocessing.pool
-
+import signal
+import threading
 
 from deephyper.core.exceptions import SearchTerminationError
 
@@ -17,3 +18,37 @@ def terminate_on_timeout(timeout, func, *args, **kwargs):
         raise SearchTerminationError(f"Search timeout expired after: {timeout}")
     finally:
         pool.terminate()
+
+
+def run_with_timeout(timeout, func, *args, **kwargs):
+    """Execute ``func`` and interrupt it with a ``TimeoutError`` after ``timeout`` seconds.
+
+    The interruption relies on ``SIGALRM`` and can only happen in the main thread of a Unix process (e.g., in the workers of a process pool or in MPI ranks), otherwise ``func`` is executed without being interrupted.
+
+    Args:
+        timeout (float): time budget in seconds, ``None`` for no time budget.
+        func (callable): the function to execute.
+
+    Returns:
+        the value returned by ``func``.
+    """
+    if (
+        timeout is None
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        return func(*args, **kwargs)
+
+    if timeout <= 0:
+        raise TimeoutError("The time budget of the job expired before it started.")
+
+    def handler(signum, frame):
+        raise TimeoutError(f"The job was interrupted after its time budget: {timeout}")
+
+    previous_handler = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
@@ -27,11 +27,12 @@ The return value of the ``run``-function respect the following standards (but th
     # tuple of float for multi-objective optimization (will appear as "objective_0" and "objective_1" in the resulting dataframe)
     return 42.0, 0.42
 
+The ``run``-function can also report intermediate objectives (e.g., after each training epoch) to the ``Stopper`` of the ``Evaluator`` (see ``Evaluator.set_stopper``) which decides if the evaluation is stopped early, such as the ``SuccessiveHalvingStopper``.
 
 """
 
 from deephyper.evaluator._evaluator import EVALUATORS, Evaluator
-from deephyper.evaluator._job import Job
+from deephyper.evaluator._job import Job, JobConfig
 from deephyper.evaluator._process_pool import ProcessPoolEvaluator
 from deephyper.evaluator._serial import SerialEvaluator
 from deephyper.evaluator._subprocess import SubprocessEvaluator
@@ -39,16 +40,30 @@ from deephyper.evaluator._thread_pool import ThreadPoolEvaluator
 from deephyper.evaluator._queued import queued
 from deephyper.evaluator._decorator import profile
 from deephyper.evaluator._encoder import to_json, parse_subprocess_result
+from deephyper.evaluator._stopper import Stopper, SuccessiveHalvingStopper
+from deephyper.evaluator._sink import (
+    RESULTS_SINKS,
+    ArrowResultsSink,
+    CSVResultsSink,
+    ResultsSink,
+)
 
 __all__ = [
+    "ArrowResultsSink",
+    "CSVResultsSink",
     "Evaluator",
     "EVALUATORS",
     "Job",
+    "JobConfig",
     "ProcessPoolEvaluator",
     "profile",
     "queued",
+    "ResultsSink",
+    "RESULTS_SINKS",
     "SerialEvaluator",
+    "Stopper",
     "SubprocessEvaluator",
+    "SuccessiveHalvingStopper",
     "ThreadPoolEvaluator",
     "to_json",
     "parse_subprocess_result",
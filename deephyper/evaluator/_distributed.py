@@ -1,10 +1,23 @@
 import logging
+import random
 import time
 import pickle
 
 from typing import List, Tuple
 
 from deephyper.evaluator import Job
+from deephyper.evaluator._exchange import (
+    EXCHANGES,
+    ReceivedMessages,
+    binomial_tree_children,
+    decode_jobs,
+    decode_message,
+    default_gossip_hops,
+    encode_jobs,
+    encode_message,
+    gossip_peers,
+    with_hops,
+)
 
 import mpi4py
 
@@ -15,6 +28,7 @@ from mpi4py import MPI  # noqa: E402
 
 TAG_INIT = 20
 TAG_DATA = 30
+TAG_DATA_LARGE = 31
 
 
 def distributed(backend: str):
@@ -30,6 +44,10 @@ def distributed(backend: str):
     Args:
         comm: An MPI communicator. Defaults to ``None`` for ``MPI.COMM_WORLD``.
         share_freq (int): The frequency at which data should be shared between ranks of the distributed evaluator.
+        exchange (str): How completed jobs are disseminated by ``broadcast`` with the ``"mpi"`` backend. With ``"all"`` a rank sends its jobs directly to every other rank. With ``"tree"`` the jobs are forwarded along a binomial tree rooted at their rank of origin so that a rank sends at most ``ceil(log2(size))`` messages per broadcast. With ``"gossip"`` each rank forwards new messages to ``gossip_fanout`` random peers (delivery to all ranks is then probabilistic). Defaults to ``"all"``.
+        gossip_fanout (int): Number of random peers to which a message is forwarded when ``exchange="gossip"``. Defaults to ``2``.
+        gossip_hops (int): Maximum number of hops of a message when ``exchange="gossip"``. Defaults to ``None`` for ``ceil(log(size)/log(gossip_fanout)) + 2``.
+        recv_buffer_size (int): Size in bytes of the buffer of the persistent receive request. Larger messages are received separately with matched probes. Defaults to ``1 MiB``.
     """
 
     def wrapper(evaluator_class):
@@ -42,7 +60,17 @@ def distributed(backend: str):
 
         if backend == "mpi":
 
-            def __init__(self, *args, comm=None, share_freq=1, **kwargs):
+            def __init__(
+                self,
+                *args,
+                comm=None,
+                share_freq=1,
+                exchange="all",
+                gossip_fanout=2,
+                gossip_hops=None,
+                recv_buffer_size=2**20,
+                **kwargs,
+            ):
                 evaluator_class.__init__(self, *args, **kwargs)
                 if not MPI.Is_initialized():
                     MPI.Init_thread()
@@ -57,6 +85,32 @@ def distributed(backend: str):
                 self.rank = self.comm.Get_rank()
                 self.num_total_workers = self.num_workers * self.size
 
+                if not (exchange in EXCHANGES):
+                    raise ValueError(
+                        f"Unknown exchange={exchange} for distributed Evaluator, it should be in {EXCHANGES}!"
+                    )
+                self.exchange = exchange
+                self.gossip_fanout = gossip_fanout
+                self.gossip_hops = (
+                    default_gossip_hops(self.size, gossip_fanout)
+                    if gossip_hops is None
+                    else gossip_hops
+                )
+                self._gossip_rng = random.Random(self.rank)
+                # gossiped messages already received
+                self._gossip_seen = ReceivedMessages()
+                self._sequence = 0
+
+                # send requests not completed yet with their buffers
+                self._pending_sends = []
+
+                # a single persistent request receives the messages of any rank
+                self._recv_buffer = bytearray(recv_buffer_size)
+                self._recv_request = self.comm.Recv_init(
+                    [self._recv_buffer, MPI.BYTE], source=MPI.ANY_SOURCE, tag=TAG_DATA
+                )
+                self._recv_request.Start()
+
         elif backend == "s4m":
 
             def __init__(self, *args, comm=None, share_freq=1, **kwargs):
@@ -100,12 +154,12 @@ def distributed(backend: str):
         def allgather(self, jobs: List[Job]) -> List[Job]:
             logging.info("Broadcasting to all...")
             t1 = time.time()
-            all_data = self.comm.allgather(jobs)
+            all_data = self.comm.allgather(encode_jobs(jobs))
             received_jobs = []
 
             for i, chunk in enumerate(all_data):
                 if i != self.rank:
-                    received_jobs.extend(chunk)
+                    received_jobs.extend(decode_jobs(chunk))
 
             n_received = len(received_jobs)
 
@@ -117,18 +171,85 @@ def distributed(backend: str):
 
         if backend == "mpi":
 
+            def _send(self, dest: int, message: bytes):
+                if len(message) <= len(self._recv_buffer):
+                    tag = TAG_DATA
+                else:
+                    tag = TAG_DATA_LARGE
+                request = self.comm.Isend([message, MPI.BYTE], dest=dest, tag=tag)
+                # the buffer must be kept alive until the request is completed
+                self._pending_sends.append((request, message))
+
+            def _complete_sends(self):
+                self._pending_sends = [
+                    (request, message)
+                    for request, message in self._pending_sends
+                    if not (request.Test())
+                ]
+
+            def _forward(self, message: bytes):
+                """Forward a message received (or created) by the current rank."""
+                origin, sequence, hops, _ = decode_message(message)
+                if self.exchange == "all":
+                    if origin == self.rank:
+                        for i in range(self.size):
+                            if i != self.rank:
+                                self._send(i, message)
+                elif self.exchange == "tree":
+                    for i in binomial_tree_children(self.rank, origin, self.size):
+                        self._send(i, message)
+                else:
+                    if hops < self.gossip_hops:
+                        message = with_hops(message, hops + 1)
+                        for i in gossip_peers(
+                            self.rank, self.size, self.gossip_fanout, self._gossip_rng
+                        ):
+                            if i != origin:
+                                self._send(i, message)
+
+            def _on_message(self, message: bytes) -> List[Job]:
+                """Decode a received message and forward it, returns the new jobs."""
+                try:
+                    origin, sequence, hops, payload = decode_message(message)
+                except Exception:
+                    logging.error("Received a malformed message")
+                    return []
+                if self.exchange == "gossip":
+                    if origin == self.rank or not (
+                        self._gossip_seen.add(origin, sequence)
+                    ):
+                        return []
+                self._forward(message)
+                try:
+                    return decode_jobs(payload)
+                except pickle.UnpicklingError:
+                    logging.error(f"UnpicklingError for message from rank {origin}")
+                    return []
+
+            def close_exchange(self):
+                """Cancel the persistent receive request, messages sent after are not received anymore."""
+                if self._recv_request is not None:
+                    self._recv_request.Cancel()
+                    self._recv_request.Wait()
+                    self._recv_request.Free()
+                    self._recv_request = None
+                self._complete_sends()
+
+            def __exit__(self, type, value, traceback):
+                evaluator_class.__exit__(self, type, value, traceback)
+                self.close_exchange()
+
             def broadcast(self, jobs: List[Job]):
                 logging.info("Broadcasting jobs to all...")
                 t1 = time.time()
 
-                data = MPI.pickle.dumps(jobs)
-
-                req_send = [
-                    self.comm.Isend(data, dest=i, tag=TAG_DATA)
-                    for i in range(self.size)
-                    if i != self.rank
-                ]
-                MPI.Request.waitall(req_send)
+                self._complete_sends()
+                if self.size > 1 and len(jobs) > 0:
+                    message = encode_message(
+                        self.rank, self._sequence, 0, encode_jobs(jobs)
+                    )
+                    self._sequence += 1
+                    self._forward(message)
 
                 logging.info(f"Broadcasting to all done in {time.time() - t1:.4f} sec.")
 
@@ -136,28 +257,30 @@ def distributed(backend: str):
                 logging.info("Receiving jobs from any...")
                 t1 = time.time()
 
-                received_any = self.size > 1
                 received_jobs = []
-                while received_any:
-
-                    received_any = False
-                    req_recv = [
-                        self.comm.irecv(source=i, tag=TAG_DATA)
-                        for i in range(self.size)
-                        if i != self.rank
-                    ]
-
-                    # asynchronous
-                    for i, req in enumerate(req_recv):
-                        try:
-                            done, jobs = req.test()
-                            if done:
-                                received_any = True
-                                received_jobs.extend(jobs)
-                            else:
-                                req.cancel()
-                        except pickle.UnpicklingError:
-                            logging.error(f"UnpicklingError for request {i}")
+                status = MPI.Status()
+
+                # messages which fit in the buffer of the persistent request
+                while self._recv_request is not None and self._recv_request.Test(
+                    status
+                ):
+                    count = status.Get_count(MPI.BYTE)
+                    message = bytes(self._recv_buffer[:count])
+                    self._recv_request.Start()
+                    received_jobs.extend(self._on_message(message))
+
+                # larger messages are received with matched probes
+                while True:
+                    msg = self.comm.Improbe(
+                        source=MPI.ANY_SOURCE, tag=TAG_DATA_LARGE, status=status
+                    )
+                    if msg is None:
+                        break
+                    message = bytearray(status.Get_count(MPI.BYTE))
+                    msg.Recv([message, MPI.BYTE])
+                    received_jobs.extend(self._on_message(bytes(message)))
+
+                self._complete_sends()
 
                 self.jobs_done.extend(received_jobs)
                 logging.info(
@@ -172,7 +295,7 @@ def distributed(backend: str):
                 logging.info("Broadcasting jobs to all...")
                 t1 = time.time()
 
-                data = MPI.pickle.dumps(jobs)
+                data = encode_jobs(jobs)
 
                 self._s4m_service.broadcast(data)
 
@@ -197,7 +320,7 @@ def distributed(backend: str):
                     else:
                         source_rank, data = data
                         try:
-                            jobs = MPI.pickle.loads(data)
+                            jobs = decode_jobs(data)
                         except pickle.UnpicklingError:
                             logging.error(
                                 f"UnpicklingError for request source {source_rank}"
@@ -215,6 +338,7 @@ def distributed(backend: str):
             self, jobs: List[Job], sync_communication=False
         ) -> Tuple[List[Job], List[Job]]:
 
+            other_jobs = []
             if self.num_local_done % self.share_freq == 0:
                 if sync_communication:
                     other_jobs = self.allgather(jobs)
@@ -244,6 +368,17 @@ def distributed(backend: str):
             "gather": gather,
             "dump_evals": dump_evals,
         }
+        if backend == "mpi":
+            cls_attrs.update(
+                {
+                    "_send": _send,
+                    "_complete_sends": _complete_sends,
+                    "_forward": _forward,
+                    "_on_message": _on_message,
+                    "close_exchange": close_exchange,
+                    "__exit__": __exit__,
+                }
+            )
 
         distributed_evaluator_class = type(
             f"Distributed{evaluator_class.__name__}", (evaluator_class,), cls_attrs
@@ -1,5 +1,6 @@
 import json
 import re
+from collections.abc import Mapping
 import types
 import uuid
 from inspect import isclass
@@ -27,6 +28,8 @@ class Encoder(json.JSONEncoder):
             return bool(obj)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
+        elif isinstance(obj, Mapping):
+            return dict(obj)
         elif isinstance(obj, types.FunctionType) or isclass(obj):
             return f"{obj.__module__}.{obj.__name__}"
         elif isinstance(obj, deephyper.skopt.space.Dimension):
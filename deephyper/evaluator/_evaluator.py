@@ -1,7 +1,4 @@
 import asyncio
-import copy
-import csv
-import functools
 import importlib
 import json
 import logging
@@ -13,9 +10,11 @@ from typing import Dict, List
 
 import numpy as np
 from deephyper.evaluator._job import Job
+from deephyper.evaluator._sink import create_results_sink
+from deephyper.evaluator._stopper import STOPPER_KEY
 from deephyper.skopt.optimizer import OBJECTIVE_VALUE_FAILURE
 from deephyper.core.utils._introspection import get_init_params_as_json
-from deephyper.core.utils._timeout import terminate_on_timeout
+from deephyper.core.exceptions import SearchTerminationError
 
 EVALUATORS = {
     "mpipool": "_mpi_pool.MPIPoolEvaluator",
@@ -63,6 +62,7 @@ class Evaluator:
     """
 
     FAIL_RETURN_VALUE = OBJECTIVE_VALUE_FAILURE
+    TIMEOUT_RETURN_VALUE = f"{OBJECTIVE_VALUE_FAILURE}_timeout"
     NEST_ASYNCIO_PATCHED = False
     PYTHON_EXE = os.environ.get("DEEPHYPER_PYTHON_BACKEND", sys.executable)
     assert os.path.isfile(PYTHON_EXE)
@@ -83,24 +83,28 @@ class Evaluator:
         self.num_workers = num_workers
         self.jobs = []  # Job objects currently submitted.
         self.n_jobs = 0
-        self._tasks_running = []  # List of AsyncIO Task objects currently running.
-        self._tasks_done = []  # Temp list to hold completed tasks from asyncio.
-        self._tasks_pending = []  # Temp list to hold pending tasks from asyncio.
+        self._tasks_running = set()  # AsyncIO Task objects currently running.
+        self._tasks_done = None  # Queue of completed tasks not yet gathered.
         self.jobs_done = []  # List used to store all jobs completed by the evaluator.
         self.timestamp = (
             time.time()
         )  # Recorded time of when this evaluator interface was created.
         self.loop = None  # Event loop for asyncio.
-        self._start_dumping = False
+        self._results_sink = create_results_sink("csv")  # Where evaluations are dumped.
         self.num_objective = None  # record if multi-objective are recorded
 
         self._callbacks = [] if callbacks is None else callbacks
 
         self._lock = asyncio.Lock()
 
-        # manage timeout of the search
+        # manage timeout of the search and of the jobs
         self._time_timeout_set = None
         self._timeout = None
+        self._job_timeout = None
+
+        # early stopping of the jobs from their intermediate objectives
+        self._stopper = None
+        self._stopper_params = None
 
         # to avoid "RuntimeError: This event loop is already running"
         if not (Evaluator.NEST_ASYNCIO_PATCHED) and _test_ipython_interpretor():
@@ -116,15 +120,58 @@ class Evaluator:
         return self
 
     def __exit__(self, type, value, traceback):
+        self._results_sink.close()
         if hasattr(self, "executor"):
             self.executor.__exit__(type, value, traceback)
 
     def set_timeout(self, timeout):
-        """Set a timeout for the Evaluator. It will create task with a "time budget" and will kill the the task if this budget
-        is exhausted."""
+        """Set a timeout for the Evaluator. When this time budget is exhausted the running jobs are cancelled (their computation is killed when the backend supports it) and reported with the ``"F_timeout"`` result, then ``gather`` and ``submit`` raise a ``SearchTerminationError``.
+
+        Args:
+            timeout (float): the time budget in seconds, ``None`` to remove it.
+        """
         self._time_timeout_set = time.time()
         self._timeout = timeout
 
+    def set_job_timeout(self, job_timeout):
+        """Set a timeout for each job. A job still running after this time budget (counted from its submission) is cancelled (its computation is killed when the backend supports it) and reported with the ``"F_timeout"`` result.
+
+        Args:
+            job_timeout (float): the time budget of each job in seconds, ``None`` to remove it.
+        """
+        self._job_timeout = job_timeout
+
+    def set_stopper(self, stopper):
+        """Set a stopper deciding if jobs are stopped early from the intermediate objectives that the run-function reports (see ``Stopper``). The parameters of the stopper are added to the configuration passed to the run-function in the ``"stopper"`` key, which is removed from the configuration of the completed jobs.
+
+        Args:
+            stopper (Stopper): the stopper, ``None`` to remove it.
+
+        Raises:
+            ValueError: if the stopper has no ``path`` where the jobs share their objectives.
+        """
+        if stopper is not None and stopper.path is None:
+            raise ValueError(
+                "The stopper has no path to share the reported objectives!"
+            )
+        self._stopper = stopper
+        self._stopper_params = None if stopper is None else stopper.to_json()
+
+    def _timeout_expired(self) -> bool:
+        return (
+            self._timeout is not None
+            and time.time() - self._time_timeout_set >= self._timeout
+        )
+
+    def set_results_sink(self, sink):
+        """Set the sink where ``dump_evals`` writes the evaluations.
+
+        Args:
+            sink (str|ResultsSink): a value in ``["csv", "arrow"]`` or a ``ResultsSink`` instance. The ``"arrow"`` sink appends Arrow record batches to a ``results.arrow`` file and requires ``pyarrow``.
+        """
+        self._results_sink.close()
+        self._results_sink = create_results_sink(sink)
+
     def to_json(self):
         """Returns a json version of the evaluator."""
         out = {"type": type(self).__name__, **get_init_params_as_json(self)}
@@ -167,39 +214,54 @@ class Evaluator:
         return evaluator
 
     async def _get_at_least_n_tasks(self, n):
+        num_tasks = len(self._tasks_running) + self._tasks_done.qsize()
+
         # If a user requests a batch size larger than the number of currently-running tasks, set n to the number of tasks running.
-        if n > len(self._tasks_running):
+        if n > num_tasks:
             warnings.warn(
-                f"Requested a batch size ({n}) larger than currently running tasks ({len(self._tasks_running)}). Batch size has been set to the count of currently running tasks."
+                f"Requested a batch size ({n}) larger than currently running tasks ({num_tasks}). Batch size has been set to the count of currently running tasks."
             )
-            n = len(self._tasks_running)
+            n = num_tasks
 
-        # wait for all running tasks (sync.)
-        if n == len(self._tasks_running):
-            try:
-                self._tasks_done, self._tasks_pending = await asyncio.wait(
-                    self._tasks_running, return_when="ALL_COMPLETED"
-                )
-            except ValueError:
-                raise ValueError("No jobs pending, call Evaluator.submit(jobs)!")
-        else:
-            while len(self._tasks_done) < n:
-                self._tasks_done, self._tasks_pending = await asyncio.wait(
-                    self._tasks_running, return_when="FIRST_COMPLETED"
-                )
+        if num_tasks == 0:
+            raise ValueError("No jobs pending, call Evaluator.submit(jobs)!")
+
+        # wait for at least n completed tasks then collect all the completed ones
+        tasks = []
+        while len(tasks) < n:
+            tasks.append(await self._tasks_done.get())
+        while not self._tasks_done.empty():
+            tasks.append(self._tasks_done.get_nowait())
+        return tasks
+
+    def _on_task_done(self, task):
+        """Called by asyncio when a task is completed."""
+        self._tasks_running.discard(task)
+        self._tasks_done.put_nowait(task)
 
     async def _run_jobs(self, configs):
+        # the queue is created in the event loop of the evaluator
+        if self._tasks_done is None:
+            self._tasks_done = asyncio.Queue()
+
         for config in configs:
 
+            if self._stopper_params is not None:
+                config = dict(config, **{STOPPER_KEY: self._stopper_params})
+
             # Create a Job object from the input configuration
             new_job = Job(self.n_jobs, config, self.run_function)
 
-            if self._timeout:
-                time_consumed = time.time() - self._time_timeout_set
-                time_left = self._timeout - time_consumed
-                logging.info(f"Submitting job with {time_left} sec. time budget")
-                new_job.run_function = functools.partial(
-                    terminate_on_timeout, time_left, new_job.run_function
+            # the deadline of the job is the earliest of the search and job timeouts
+            deadlines = []
+            if self._timeout is not None:
+                deadlines.append(self._time_timeout_set + self._timeout)
+            if self._job_timeout is not None:
+                deadlines.append(time.time() + self._job_timeout)
+            if len(deadlines) > 0:
+                new_job.deadline = min(deadlines)
+                logging.info(
+                    f"Submitting job with {new_job.time_left()} sec. time budget"
                 )
 
             self.n_jobs += 1
@@ -207,7 +269,8 @@ class Evaluator:
 
             self._on_launch(new_job)
             task = self.loop.create_task(self._execute(new_job))
-            self._tasks_running.append(task)
+            task.add_done_callback(self._on_task_done)
+            self._tasks_running.add(task)
 
     def _on_launch(self, job):
         """Called after a job is started."""
@@ -222,7 +285,7 @@ class Evaluator:
     def _on_done(self, job):
         """Called after a job has completed."""
         job.status = job.DONE
-        job.config.pop("job_id")
+        job.config = job.config.without("job_id", STOPPER_KEY)
 
         job.timestamp_gather = time.time() - self.timestamp
 
@@ -236,7 +299,16 @@ class Evaluator:
 
     async def _execute(self, job):
 
-        job = await self.execute(job)
+        if job.deadline is None:
+            job = await self.execute(job)
+        else:
+            try:
+                job = await asyncio.wait_for(
+                    self.execute(job), timeout=max(job.time_left(), 0)
+                )
+            except asyncio.TimeoutError:
+                job.result = Evaluator.TIMEOUT_RETURN_VALUE
+                return job
 
         # code to manage the profile decorator
         profile_keys = ["objective", "timestamp_start", "timestamp_end"]
@@ -268,6 +340,10 @@ class Evaluator:
             configs (List[Dict]): A list of dict which will be passed to the run function to be executed.
         """
         logging.info(f"submit {len(configs)} job(s) starts...")
+        if self._timeout_expired():
+            raise SearchTerminationError(
+                f"Search timeout expired after: {self._timeout}"
+            )
         if self.loop is None:
             try:
                 # works if `timeout` is not set and code is running in main thread
@@ -301,19 +377,40 @@ class Evaluator:
 
         results = []
 
+        if self._tasks_done is None:
+            raise ValueError("No jobs pending, call Evaluator.submit(jobs)!")
+
         if type == "ALL":
-            size = len(self._tasks_running)  # Get all tasks.
+            # Get all tasks.
+            size = len(self._tasks_running) + self._tasks_done.qsize()
 
-        self.loop.run_until_complete(self._get_at_least_n_tasks(size))
-        for task in self._tasks_done:
+        tasks = self.loop.run_until_complete(self._get_at_least_n_tasks(size))
+
+        # the jobs still running are being cancelled, wait for them to be reported
+        timeout_expired = self._timeout_expired()
+        num_tasks = len(self._tasks_running) + self._tasks_done.qsize()
+        if timeout_expired and num_tasks > 0:
+            tasks.extend(
+                self.loop.run_until_complete(self._get_at_least_n_tasks(num_tasks))
+            )
+        for i, task in enumerate(tasks):
+            if task.cancelled() or task.exception() is not None:
+                # the other completed tasks can still be gathered later
+                for other_task in tasks[:i] + tasks[i + 1 :]:
+                    self._tasks_done.put_nowait(other_task)
+                task.result()
+
+        for task in tasks:
             job = task.result()
             self._on_done(job)
             results.append(job)
             self.jobs_done.append(job)
-            self._tasks_running.remove(task)
 
-        self._tasks_done = []
-        self._tasks_pending = []
+        if timeout_expired:
+            raise SearchTerminationError(
+                f"Search timeout expired after: {self._timeout}"
+            )
+
         logging.info("gather done")
         return results
 
@@ -338,29 +435,33 @@ class Evaluator:
         else:
             return val
 
-    def dump_evals(self, saved_keys=None, log_dir: str = ".", filename="results.csv"):
-        """Dump evaluations to a CSV file.
+    def _results_path(self, log_dir: str, filename: str = None) -> str:
+        if filename is None:
+            filename = f"results{self._results_sink.extension}"
+        return os.path.join(log_dir, filename)
+
+    def dump_evals(self, saved_keys=None, log_dir: str = ".", filename: str = None):
+        """Dump evaluations to the results sink (a CSV file by default, see ``set_results_sink``). Rows are appended to the sink and the list of completed jobs is emptied.
 
         Args:
             saved_keys (list|callable): If ``None`` the whole ``job.config`` will be added as row of the CSV file. If a ``list`` filtered keys will be added as a row of the CSV file. If a ``callable`` the output dictionnary will be added as a row of the CSV file.
             log_dir (str): directory where to dump the CSV file.
-            filename (str): name of the file where to write the data.
+            filename (str): name of the file where to write the data. Defaults to ``None`` for ``"results"`` followed by the extension of the sink (e.g., ``"results.csv"``).
         """
         logging.info("dump_evals starts...")
         resultsList = []
 
         for job in self.jobs_done:
 
+            # rows are new dicts, values are not mutated so no copy is required
             if saved_keys is None:
-                result = copy.deepcopy(job.config)
+                result = {f"p:{k}": v for k, v in job.config.items()}
             elif type(saved_keys) is list:
-                decoded_key = copy.deepcopy(job.config)
-                result = {k: self.convert_for_csv(decoded_key[k]) for k in saved_keys}
+                result = {
+                    f"p:{k}": self.convert_for_csv(job.config[k]) for k in saved_keys
+                }
             elif callable(saved_keys):
-                result = copy.deepcopy(saved_keys(job))
-
-            # add prefix for all keys found in "config"
-            result = {f"p:{k}": v for k, v in result.items()}
+                result = {f"p:{k}": v for k, v in saved_keys(job).items()}
 
             # when the returned value of the run-function is a dict we flatten it to add in csv
             if isinstance(job.result, dict):
@@ -412,14 +513,21 @@ class Evaluator:
 
         self.jobs_done = []
 
-        if len(resultsList) != 0:
-            mode = "a" if self._start_dumping else "w"
-            with open(os.path.join(log_dir, filename), mode) as fp:
-                columns = resultsList[0].keys()
-                writer = csv.DictWriter(fp, columns)
-                if not (self._start_dumping):
-                    writer.writeheader()
-                    self._start_dumping = True
-                writer.writerows(resultsList)
+        path = self._results_path(log_dir, filename)
+        if self._results_sink.path != path:
+            self._results_sink.open(path)
+        self._results_sink.write(resultsList)
 
         logging.info("dump_evals done")
+
+    def load_evals(self, log_dir: str = ".", filename: str = None):
+        """Load the evaluations dumped by ``dump_evals``.
+
+        Args:
+            log_dir (str): directory where the evaluations were dumped.
+            filename (str): name of the file where the evaluations were dumped. Defaults to ``None`` for the default name of the sink.
+
+        Returns:
+            DataFrame: a ``pandas.DataFrame`` of the evaluations or ``None`` if no evaluation was dumped.
+        """
+        return self._results_sink.load(self._results_path(log_dir, filename))
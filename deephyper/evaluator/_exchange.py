@@ -0,0 +1,175 @@
+"""Encoding of completed jobs and dissemination topologies used to share them between the ranks of a distributed evaluator.
+
+A message exchanged between ranks is made of a fixed size header ``(origin, sequence, hops)`` followed by a payload of encoded jobs. Only what is needed to fit a surrogate model and to dump the evaluations is encoded (no ``Job`` objects, no ``run_function``): the tuples of keys of the configurations are stored once per message and each job is stored as a flat tuple of values.
+"""
+import math
+import pickle
+import struct
+
+from deephyper.evaluator._job import Job, JobConfig
+
+#: header of a message: rank of origin, sequence number at the origin, number of hops from the origin.
+HEADER = struct.Struct("!iIH")
+
+EXCHANGES = ["all", "tree", "gossip"]
+
+
+def encode_jobs(jobs) -> bytes:
+    """Encode completed jobs in a compact binary payload.
+
+    Args:
+        jobs (list): a list of ``Job``.
+
+    Returns:
+        bytes: the encoded jobs.
+    """
+    keys_index = {}
+    rows = []
+    for job in jobs:
+        config = job.config
+        if not (isinstance(config, JobConfig)):
+            config = JobConfig(config)
+        key_id = keys_index.setdefault(config._keys, len(keys_index))
+        rows.append(
+            (
+                key_id,
+                config._values,
+                job.result,
+                job.id,
+                job.rank,
+                job.timestamp_submit,
+                job.timestamp_gather,
+                job.timestamp_start,
+                job.timestamp_end,
+                job.other,
+            )
+        )
+    return pickle.dumps((tuple(keys_index), rows), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_jobs(data) -> list:
+    """Decode jobs encoded with ``encode_jobs``.
+
+    Args:
+        data (bytes): the encoded jobs.
+
+    Returns:
+        list: a list of completed ``Job`` without ``run_function``.
+    """
+    keys, rows = pickle.loads(data)
+    jobs = []
+    for (
+        key_id,
+        values,
+        result,
+        job_id,
+        rank,
+        timestamp_submit,
+        timestamp_gather,
+        timestamp_start,
+        timestamp_end,
+        other,
+    ) in rows:
+        job = Job(job_id, {}, None)
+        job.config = JobConfig._from_tuples(keys[key_id], values)
+        job.rank = rank
+        job.result = result
+        job.status = Job.DONE
+        job.timestamp_submit = timestamp_submit
+        job.timestamp_gather = timestamp_gather
+        job.timestamp_start = timestamp_start
+        job.timestamp_end = timestamp_end
+        job.other = other
+        jobs.append(job)
+    return jobs
+
+
+def encode_message(origin: int, sequence: int, hops: int, payload: bytes) -> bytes:
+    """Prefix a payload with the header of a message."""
+    return HEADER.pack(origin, sequence, hops) + payload
+
+
+def decode_message(message):
+    """Split a message in ``(origin, sequence, hops, payload)``."""
+    origin, sequence, hops = HEADER.unpack_from(message)
+    return origin, sequence, hops, message[HEADER.size :]
+
+
+def with_hops(message, hops: int) -> bytes:
+    """Returns a copy of the message with a new number of hops."""
+    origin, sequence, _ = HEADER.unpack_from(message)
+    return HEADER.pack(origin, sequence, hops) + bytes(message[HEADER.size :])
+
+
+def binomial_tree_children(rank: int, root: int, size: int) -> list:
+    """Ranks to which ``rank`` forwards the messages of ``root`` in a binomial tree. Each rank receives a message exactly once and sends it at most ``ceil(log2(size))`` times.
+
+    Args:
+        rank (int): the current rank.
+        root (int): the rank of origin of the message.
+        size (int): the number of ranks.
+
+    Returns:
+        list: the children of ``rank``.
+    """
+    relative = (rank - root) % size
+    step = 1
+    while step <= relative:
+        step <<= 1
+    children = []
+    while relative + step < size:
+        children.append((relative + step + root) % size)
+        step <<= 1
+    return children
+
+
+def gossip_peers(rank: int, size: int, fanout: int, rng) -> list:
+    """Sample ``fanout`` ranks different from ``rank`` (in ``O(fanout)``).
+
+    Args:
+        rank (int): the current rank.
+        size (int): the number of ranks.
+        fanout (int): the number of peers to sample.
+        rng (random.Random): the random generator.
+
+    Returns:
+        list: the sampled ranks.
+    """
+    peers = rng.sample(range(size - 1), min(fanout, size - 1))
+    return [p if p < rank else p + 1 for p in peers]
+
+
+def default_gossip_hops(size: int, fanout: int) -> int:
+    """Default maximum number of hops of a gossiped message: enough for ``fanout**hops`` to cover the ranks with a margin."""
+    if size <= 2 or fanout <= 1:
+        return max(size - 1, 1)
+    return math.ceil(math.log(size) / math.log(fanout)) + 2
+
+
+class ReceivedMessages:
+    """Messages already received from each origin, to drop the duplicates of gossiped messages.
+
+    For each origin only the highest sequence received and a bit mask of the ``window`` sequences below it are kept (sequences are increasing at each origin), so that the memory does not grow with the number of messages. Messages can arrive out of order through different paths, a message older than ``window`` sequences below the highest received is considered a duplicate.
+
+    Args:
+        window (int, optional): the number of sequences below the highest received which are tracked. Defaults to ``1024``.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        # origin -> (highest sequence, bit i set if "highest - i" was received)
+        self._received = {}
+
+    def add(self, origin: int, sequence: int) -> bool:
+        """Record a message, returns ``False`` if it was already received."""
+        highest, mask = self._received.get(origin, (-1, 0))
+        if sequence > highest:
+            shift = sequence - highest
+            mask = (mask << shift | 1) if shift < self.window else 1
+            self._received[origin] = (sequence, mask & ((1 << self.window) - 1))
+            return True
+        offset = highest - sequence
+        if offset >= self.window or mask >> offset & 1:
+            return False
+        self._received[origin] = (highest, mask | 1 << offset)
+        return True
@@ -1,4 +1,95 @@
-import copy
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+
+class JobConfig(Mapping):
+    """Immutable configuration of a ``Job``.
+
+    It behaves as a read-only ``dict``. The values are stored in a tuple and the keys in a tuple shared by all the configurations with the same keys (in the same order), so that reading a configuration does not require any copy and pickling a list of configurations (e.g., to broadcast jobs between ranks) stores their keys only once.
+
+    Args:
+        config (dict, optional): the key-value pairs of the configuration. Defaults to ``None``.
+        **kwargs: additional key-value pairs.
+    """
+
+    __slots__ = ("_keys", "_values", "_index")
+
+    # shared tuple of keys -> (tuple of keys, mapping from keys to positions), the
+    # least recently used keys are dropped beyond _MAX_SHARED_KEYS entries
+    _SHARED_KEYS = OrderedDict()
+    _MAX_SHARED_KEYS = 1024
+
+    def __init__(self, config: dict = None, **kwargs):
+        items = dict({} if config is None else config, **kwargs)
+        self._set(tuple(items.keys()), tuple(items.values()))
+
+    def _set(self, keys, values):
+        shared = JobConfig._SHARED_KEYS.get(keys)
+        if shared is None:
+            shared = (keys, {k: i for i, k in enumerate(keys)})
+            JobConfig._SHARED_KEYS[keys] = shared
+            if len(JobConfig._SHARED_KEYS) > JobConfig._MAX_SHARED_KEYS:
+                JobConfig._SHARED_KEYS.popitem(last=False)
+        else:
+            JobConfig._SHARED_KEYS.move_to_end(keys)
+        object.__setattr__(self, "_keys", shared[0])
+        object.__setattr__(self, "_index", shared[1])
+        object.__setattr__(self, "_values", values)
+
+    @classmethod
+    def _from_tuples(cls, keys, values):
+        config = cls.__new__(cls)
+        config._set(keys, values)
+        return config
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __eq__(self, other):
+        if isinstance(other, JobConfig):
+            return self._keys == other._keys and self._values == other._values
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(dict(zip(self._keys, self._values)))
+
+    def __reduce__(self):
+        return (JobConfig._from_tuples, (self._keys, self._values))
+
+    def values(self):
+        return self._values
+
+    def items(self):
+        return tuple(zip(self._keys, self._values))
+
+    def without(self, *keys):
+        """Returns a new configuration without the given keys.
+
+        Args:
+            *keys: the keys to remove.
+
+        Returns:
+            JobConfig: the new configuration.
+        """
+        pairs = [(k, v) for k, v in zip(self._keys, self._values) if k not in keys]
+        return JobConfig._from_tuples(
+            tuple(k for k, _ in pairs), tuple(v for _, v in pairs)
+        )
 
 
 class Job:
@@ -6,7 +97,7 @@ class Job:
 
     Args:
         id (Any): unique identifier of the job. Usually an integer.
-        config (dict): argument dictionnary of the ``run_function``.
+        config (dict): argument dictionnary of the ``run_function``. It is stored as an immutable ``JobConfig`` (without copying the values) to which the ``"job_id"`` key is added.
         run_function (callable): function executed by the ``Evaluator``
     """
 
@@ -18,13 +109,13 @@ class Job:
     def __init__(self, id, config: dict, run_function):
         self.id = id
         self.rank = None
-        self.config = copy.deepcopy(config)
-        self.config["job_id"] = self.id
+        self.config = JobConfig(config, job_id=self.id)
         self.run_function = run_function
         self.timestamp_start = None  # in seconds
         self.timestamp_end = None  # in seconds
         self.timestamp_submit = None  # in seconds
         self.timestamp_gather = None  # in seconds
+        self.deadline = None  # absolute time (see ``time.time()``) in seconds
         self.status = self.READY
         self.result = None
         self.other = None
@@ -36,5 +127,10 @@ class Job:
             return f"Job(id={self.id}, status={self.status}, config={self.config})"
 
     def __getitem__(self, index):
-        cfg = copy.deepcopy(self.config)
-        return (cfg, self.result)[index]
+        return (self.config, self.result)[index]
+
+    def time_left(self):
+        """Time left (in seconds) before the deadline of the job or ``None`` if it does not have a deadline."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.time()
@@ -124,7 +124,7 @@ class MochiEvaluator(Evaluator):
                 self._protocol,
                 target_address,
                 job.run_function,
-                job.config,
+                dict(job.config),
                 **self.run_function_kwargs,
             )
 
@@ -4,6 +4,7 @@ import logging
 import sys
 import traceback
 from deephyper.core.exceptions import RunFunctionError
+from deephyper.core.utils._timeout import run_with_timeout
 from deephyper.evaluator._evaluator import Evaluator
 
 import mpi4py
@@ -85,8 +86,13 @@ class MPICommEvaluator(Evaluator):
     async def execute(self, job):
         async with self.sem:
 
+            # the remote rank interrupts the job if it exceeds its deadline
             run_function = functools.partial(
-                job.run_function, job.config, **self.run_function_kwargs
+                run_with_timeout,
+                job.time_left(),
+                job.run_function,
+                dict(job.config),
+                **self.run_function_kwargs,
             )
 
             code, sol = await self.loop.run_in_executor(
@@ -2,6 +2,7 @@ import logging
 import asyncio
 import functools
 
+from deephyper.core.utils._timeout import run_with_timeout
 from deephyper.evaluator._evaluator import Evaluator
 
 from concurrent.futures import ProcessPoolExecutor
@@ -41,8 +42,13 @@ class ProcessPoolEvaluator(Evaluator):
 
         async with self.sem:
 
+            # the worker interrupts the job if it exceeds its deadline
             run_function = functools.partial(
-                job.run_function, job.config, **self.run_function_kwargs
+                run_with_timeout,
+                job.time_left(),
+                job.run_function,
+                dict(job.config),
+                **self.run_function_kwargs,
             )
 
             sol = await self.loop.run_in_executor(self.executor, run_function)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import ray
 from deephyper.evaluator._evaluator import Evaluator
@@ -84,9 +85,15 @@ class RayEvaluator(Evaluator):
 
     async def execute(self, job):
 
-        sol = await self._remote_run_function.remote(
-            job.config, **self.run_function_kwargs
+        ref = self._remote_run_function.remote(
+            dict(job.config), **self.run_function_kwargs
         )
+        try:
+            sol = await ref
+        except asyncio.CancelledError:
+            # the job timed out, the remote task is killed
+            ray.cancel(ref, force=True)
+            raise
 
         job.result = sol
 
@@ -37,7 +37,9 @@ class SerialEvaluator(Evaluator):
 
     async def execute(self, job):
 
-        sol = self.run_function(copy.deepcopy(job.config), **self.run_function_kwargs)
+        sol = self.run_function(
+            copy.deepcopy(dict(job.config)), **self.run_function_kwargs
+        )
 
         job.result = sol
 
@@ -0,0 +1,299 @@
+"""Destinations where the ``Evaluator`` dumps the evaluations it has completed.
+
+A ``ResultsSink`` receives rows (one ``dict`` per evaluation) in append-only batches and can load them back, either all at once as a ``pandas.DataFrame`` or lazily batch by batch. The ``"csv"`` sink is the default and writes the historical ``results.csv`` file. The ``"arrow"`` sink writes an Arrow IPC stream where each batch becomes a record batch, it requires ``pyarrow``.
+"""
+import abc
+import csv
+import numbers
+import os
+
+import numpy as np
+import pandas as pd
+
+import deephyper.core.exceptions
+
+
+class ResultsSink(abc.ABC):
+    """Append-only destination of the rows dumped by ``Evaluator.dump_evals``.
+
+    A sink is bound to a file path with ``open(path)``. The file is truncated lazily by the first call to ``write`` so that opening an existing path to load it does not erase it.
+    """
+
+    #: default file extension of the sink.
+    extension = None
+
+    def __init__(self):
+        self.path = None
+        self._started = False
+
+    def open(self, path: str):
+        """Bind the sink to a new file path, previous writers are closed.
+
+        Args:
+            path (str): path of the file where rows are written.
+        """
+        self.close()
+        self.path = path
+        self._started = False
+
+    @abc.abstractmethod
+    def write(self, rows: list):
+        """Append rows to the sink.
+
+        Args:
+            rows (list): a list of ``dict`` where keys are column names.
+        """
+
+    @abc.abstractmethod
+    def iter_batches(self, batch_size: int = 10_000, path: str = None):
+        """Lazily iterate over the content of the sink.
+
+        Args:
+            batch_size (int, optional): maximum number of rows per batch. Defaults to ``10_000``.
+            path (str, optional): path of a file written by a sink of the same kind to read instead of the file of the sink. Defaults to ``None``.
+
+        Returns:
+            Iterator[DataFrame]: an iterator over ``pandas.DataFrame`` batches.
+        """
+
+    def load(self, path: str = None):
+        """Load the whole content of the sink.
+
+        Args:
+            path (str, optional): path of a file written by a sink of the same kind to read instead of the file of the sink. Defaults to ``None``.
+
+        Returns:
+            DataFrame: a ``pandas.DataFrame`` or ``None`` if nothing was written at ``path``.
+        """
+        path = self.path if path is None else path
+        if path is None or not (os.path.exists(path)):
+            return None
+        batches = list(self.iter_batches(path=path))
+        if len(batches) == 0:
+            return None
+        return pd.concat(batches, ignore_index=True)
+
+    def close(self):
+        """Release the resources held by the sink."""
+        ...
+
+
+class CSVResultsSink(ResultsSink):
+    """Sink writing rows to a CSV file. The columns are defined by the first row written."""
+
+    extension = ".csv"
+
+    def __init__(self):
+        super().__init__()
+        self._columns = None
+
+    def open(self, path: str):
+        super().open(path)
+        self._columns = None
+
+    def write(self, rows: list):
+        if len(rows) == 0:
+            return
+
+        mode = "a" if self._started else "w"
+        with open(self.path, mode) as fp:
+            if self._columns is None:
+                self._columns = list(rows[0].keys())
+            writer = csv.DictWriter(fp, self._columns)
+            if not (self._started):
+                writer.writeheader()
+                self._started = True
+            writer.writerows(rows)
+
+    def iter_batches(self, batch_size: int = 10_000, path: str = None):
+        path = self.path if path is None else path
+        if path is None or not (os.path.exists(path)):
+            return
+        yield from pd.read_csv(path, chunksize=batch_size)
+
+    def load(self, path: str = None):
+        path = self.path if path is None else path
+        if path is None or not (os.path.exists(path)):
+            return None
+        return pd.read_csv(path)
+
+
+def _is_objective_column(name: str) -> bool:
+    return name == "objective" or name.startswith("objective_")
+
+
+class ArrowResultsSink(ResultsSink):
+    """Sink writing rows to an Arrow IPC stream, each call to ``write`` appends a record batch without rewriting previous ones.
+
+    The schema is inferred from the first batch: booleans, integers and floats are stored natively, other values are stored as strings. Objective columns are always stored as strings because failed evaluations return ``"F..."`` markers, they are converted back to numbers on load when possible (the same way ``pandas.read_csv`` would).
+    """
+
+    extension = ".arrow"
+
+    def __init__(self):
+        super().__init__()
+        try:
+            import pyarrow
+            import pyarrow.ipc  # noqa: F401
+        except ModuleNotFoundError:
+            raise deephyper.core.exceptions.MissingRequirementError(
+                "Installing 'pyarrow' is required to use the 'arrow' results sink please run 'pip install pyarrow'"
+            )
+        self._pa = pyarrow
+        self._file = None
+        self._writer = None
+        self._schema = None
+
+    def open(self, path: str):
+        super().open(path)
+        self._schema = None
+
+    def _infer_type(self, name, values):
+        pa = self._pa
+        if _is_objective_column(name):
+            return pa.string()
+        values = [v for v in values if v is not None]
+        if len(values) > 0 and all(isinstance(v, (bool, np.bool_)) for v in values):
+            return pa.bool_()
+        elif len(values) > 0 and all(
+            isinstance(v, numbers.Integral) and not (isinstance(v, (bool, np.bool_)))
+            for v in values
+        ):
+            return pa.int64()
+        elif len(values) > 0 and all(isinstance(v, numbers.Real) for v in values):
+            return pa.float64()
+        else:
+            return pa.string()
+
+    def _to_array(self, name, values, type):
+        pa = self._pa
+        if type == pa.string():
+            values = [
+                None
+                if v is None
+                else (repr(float(v)) if isinstance(v, np.floating) else str(v))
+                for v in values
+            ]
+        else:
+            for v in values:
+                if v is not None and not (
+                    isinstance(v, numbers.Real)
+                    and (type != pa.int64() or float(v).is_integer())
+                ):
+                    raise ValueError(
+                        f"Column '{name}' of the results was inferred as '{type}' but received the value {v!r}!"
+                    )
+            if type == pa.int64():
+                values = [None if v is None else int(v) for v in values]
+            elif type == pa.float64():
+                values = [None if v is None else float(v) for v in values]
+            else:
+                values = [None if v is None else bool(v) for v in values]
+        return pa.array(values, type=type)
+
+    def write(self, rows: list):
+        if len(rows) == 0:
+            return
+
+        pa = self._pa
+
+        if self._schema is None:
+            names = list(rows[0].keys())
+            self._schema = pa.schema(
+                [(k, self._infer_type(k, [row.get(k) for row in rows])) for k in names]
+            )
+
+        unknown = set().union(*(row.keys() for row in rows)) - set(self._schema.names)
+        if len(unknown) > 0:
+            raise ValueError(
+                f"Results contain columns {sorted(unknown)} which are not in the schema of the sink!"
+            )
+
+        columns = [
+            self._to_array(
+                field.name, [row.get(field.name) for row in rows], field.type
+            )
+            for field in self._schema
+        ]
+        batch = pa.RecordBatch.from_arrays(columns, schema=self._schema)
+
+        if self._writer is None:
+            mode = "ab" if self._started else "wb"
+            self._file = open(self.path, mode)
+            self._writer = pa.ipc.new_stream(self._file, self._schema)
+            self._started = True
+        self._writer.write_batch(batch)
+        self._file.flush()
+
+    def _to_pandas(self, batch):
+        df = batch.to_pandas()
+        for name in df.columns:
+            if df[name].dtype == object:
+                try:
+                    df[name] = pd.to_numeric(df[name])
+                except (ValueError, TypeError):
+                    pass
+        return df
+
+    def _read_batches(self, path):
+        pa = self._pa
+        if self._file is not None and path == self.path:
+            self._file.flush()
+        with open(path, "rb") as fp:
+            size = os.fstat(fp.fileno()).st_size
+            # the file holds one stream per writer opened on it (e.g., after ``close``)
+            while fp.tell() < size:
+                yield from pa.ipc.open_stream(fp)
+
+    def iter_batches(self, batch_size: int = 10_000, path: str = None):
+        path = self.path if path is None else path
+        if path is None or not (os.path.exists(path)):
+            return
+        for batch in self._read_batches(path):
+            for offset in range(0, batch.num_rows, batch_size):
+                yield self._to_pandas(batch.slice(offset, batch_size))
+
+    def load(self, path: str = None):
+        path = self.path if path is None else path
+        if path is None or not (os.path.exists(path)):
+            return None
+        batches = list(self._read_batches(path))
+        if len(batches) == 0:
+            return None
+        return self._to_pandas(self._pa.Table.from_batches(batches))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+RESULTS_SINKS = {
+    "arrow": ArrowResultsSink,
+    "csv": CSVResultsSink,
+}
+
+
+def create_results_sink(sink="csv") -> ResultsSink:
+    """Create a results sink.
+
+    Args:
+        sink (str|ResultsSink, optional): a value in ``["csv", "arrow"]`` or an already created ``ResultsSink``. Defaults to ``"csv"``.
+
+    Raises:
+        ValueError: if ``sink`` is not acceptable.
+
+    Returns:
+        ResultsSink: the created sink.
+    """
+    if isinstance(sink, ResultsSink):
+        return sink
+    if sink not in RESULTS_SINKS:
+        val = ", ".join(RESULTS_SINKS)
+        raise ValueError(
+            f'The sink "{sink}" is not a valid results sink! Choose among the following sinks: {val}.'
+        )
+    return RESULTS_SINKS[sink]()
@@ -0,0 +1,170 @@
+"""Early stopping of the evaluations from the intermediate objectives they report (e.g., after each training epoch).
+
+When a ``Stopper`` is set on the ``Evaluator`` (see ``Evaluator.set_stopper``), its parameters are added to the configuration passed to the run-function in the ``"stopper"`` key (like ``"job_id"``). The run-function creates the stopper of its evaluation with ``Stopper.from_config`` and reports its objectives with ``report``, which returns ``True`` when the evaluation should stop:
+
+.. code-block:: python
+
+    def run(config: dict) -> float:
+        stopper = Stopper.from_config(config)
+        for epoch in range(1, 101):
+            objective = train_one_epoch(config)
+            if stopper is not None and stopper.report(epoch, objective):
+                break
+        return objective
+
+The objectives reported by the evaluations are shared through files of the ``path`` directory of the stopper, so that the evaluations executed in different processes (or machines with a shared file system) compete with each other. A stopped evaluation returns early and its worker receives a new configuration from the search.
+"""
+import abc
+import importlib
+import os
+
+import numpy as np
+
+from deephyper.core.utils._introspection import get_init_params_as_json
+
+#: key of the configurations where the parameters of the stopper are passed.
+STOPPER_KEY = "stopper"
+
+
+def _to_float(objective) -> float:
+    """Objective as a ``float``, failures (e.g., ``"F_..."`` or NaN) being ``-inf``."""
+    if isinstance(objective, str):
+        return -float("inf")
+    objective = float(objective)
+    if np.isnan(objective):
+        return -float("inf")
+    return objective
+
+
+class Stopper(abc.ABC):
+    """Policy deciding if an evaluation is stopped early from the objectives it reports for increasing budgets. The objective is maximized.
+
+    Args:
+        path (str, optional): directory where the reported objectives are shared between the evaluations. Defaults to ``None``, set by the search to the ``stopper`` directory of its ``log_dir``.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.job_id = None
+        self.budget = None
+        self.objective = None
+        self.stopped = False
+
+    def to_json(self) -> dict:
+        """Returns the type and parameters of the stopper passed to the run-function."""
+        cls = type(self)
+        return {
+            "type": f"{cls.__module__}.{cls.__qualname__}",
+            **get_init_params_as_json(self),
+        }
+
+    @staticmethod
+    def from_config(config: dict):
+        """Create the stopper of the evaluation of a configuration.
+
+        Args:
+            config (dict): the configuration received by the run-function.
+
+        Returns:
+            Stopper: the stopper of the evaluation or ``None`` if the evaluator has no stopper.
+        """
+        params = config.get(STOPPER_KEY)
+        if params is None:
+            return None
+        params = dict(params)
+        mod_name, cls_name = params.pop("type").rsplit(".", 1)
+        stopper = getattr(importlib.import_module(mod_name), cls_name)(**params)
+        stopper.job_id = config.get("job_id")
+        return stopper
+
+    def report(self, budget, objective) -> bool:
+        """Report the objective of the evaluation for a budget (e.g., a number of epochs).
+
+        Args:
+            budget (float): the budget consumed by the evaluation, increasing between reports.
+            objective (float): the objective for this budget, a failure (``"F_..."`` or NaN) stops the evaluation.
+
+        Returns:
+            bool: ``True`` if the evaluation should stop.
+        """
+        if not self.stopped:
+            objective = _to_float(objective)
+            self.stopped = not np.isfinite(objective) or self._stop(budget, objective)
+            self.budget = budget
+            self.objective = objective
+        return self.stopped
+
+    @abc.abstractmethod
+    def _stop(self, budget, objective) -> bool:
+        """Decision of ``report`` for a finite objective, the previous budget being ``self.budget``. To be implemented by the policies."""
+
+    def _record(self, name: str, objective: float) -> np.ndarray:
+        """Append the objective of the evaluation to the records ``name`` shared by the evaluations, returns all the objectives recorded."""
+        if self.path is None:
+            raise ValueError(
+                "The stopper has no path to share the reported objectives!"
+            )
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, f"{name}.txt")
+        # a single short write in append mode is not interleaved with the others
+        with open(path, "a") as f:
+            f.write(f"{self.job_id},{objective!r}\n")
+        with open(path, "r") as f:
+            lines = f.read().splitlines()
+        return np.array([float(line.rsplit(",", 1)[1]) for line in lines if line])
+
+
+class SuccessiveHalvingStopper(Stopper):
+    """Asynchronous successive halving (`ASHA <https://arxiv.org/abs/1810.05934>`_).
+
+    The budgets ``min_budget * reduction_factor**(min_early_stopping_rate + k)`` are rungs. When an evaluation reaches a rung its objective is recorded and it continues only if it is in the top ``1/reduction_factor`` of the objectives recorded at this rung (or the best while less than ``reduction_factor`` are recorded). The decision does not wait for the other evaluations so that workers are never idle. Evaluations are stopped when they reach ``max_budget``.
+
+    Args:
+        max_budget (float): the maximum budget of an evaluation (e.g., the number of epochs of a training).
+        min_budget (float, optional): the budget of the first rung. Defaults to ``1``.
+        reduction_factor (float, optional): the inverse of the fraction of evaluations continuing at each rung. Defaults to ``3``.
+        min_early_stopping_rate (int, optional): the number of rungs skipped. Defaults to ``0``.
+        path (str, optional): directory where the reported objectives are shared between the evaluations. Defaults to ``None``, set by the search to the ``stopper`` directory of its ``log_dir``.
+    """
+
+    def __init__(
+        self,
+        max_budget: float,
+        min_budget: float = 1,
+        reduction_factor: float = 3,
+        min_early_stopping_rate: int = 0,
+        path: str = None,
+    ):
+        super().__init__(path)
+        if not (0 < min_budget <= max_budget):
+            raise ValueError(
+                f"Parameters min_budget={min_budget} and max_budget={max_budget} should verify 0 < min_budget <= max_budget!"
+            )
+        if not (reduction_factor > 1):
+            raise ValueError(
+                f"Parameter reduction_factor={reduction_factor} should be > 1!"
+            )
+        self.max_budget = max_budget
+        self.min_budget = min_budget
+        self.reduction_factor = reduction_factor
+        self.min_early_stopping_rate = min_early_stopping_rate
+
+    def rung(self, budget) -> int:
+        """Index of the highest rung reached with ``budget``, ``-1`` if none."""
+        if budget < self.min_budget:
+            return -1
+        k = np.log(budget / self.min_budget) / np.log(self.reduction_factor)
+        # tolerance for the budgets which are exact powers of the reduction factor
+        return int(np.floor(k + 1e-9)) - self.min_early_stopping_rate
+
+    def _stop(self, budget, objective) -> bool:
+        if budget >= self.max_budget:
+            return True
+
+        rung = self.rung(budget)
+        if rung < 0 or (self.budget is not None and self.rung(self.budget) >= rung):
+            return False
+
+        competing = self._record(f"rung_{rung}", objective)
+        k = max(int(len(competing) // self.reduction_factor), 1)
+        return objective < np.partition(competing, -k)[-k]
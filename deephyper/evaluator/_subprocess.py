@@ -5,9 +5,11 @@ import inspect
 import re
 import json
 import os
+import pickle
 
 from deephyper.evaluator._evaluator import Evaluator
 from deephyper.evaluator._encoder import Encoder
+from deephyper.evaluator import _subprocess_worker
 
 logger = logging.getLogger(__name__)
 
@@ -16,13 +18,46 @@ def encode_dict(d: dict):
     return json.loads(json.dumps(d, cls=Encoder))
 
 
+class _SubprocessWorker:
+    """A long-lived worker process executing the ``run_function`` (see ``_subprocess_worker``)."""
+
+    def __init__(self, proc):
+        self.proc = proc
+        self.num_jobs = 0
+        self.memory_start = None
+
+    async def send(self, obj):
+        self.proc.stdin.write(_subprocess_worker.encode_frame(obj))
+        await self.proc.stdin.drain()
+
+    async def receive(self):
+        header = await self.proc.stdout.readexactly(_subprocess_worker.HEADER.size)
+        (size,) = _subprocess_worker.HEADER.unpack(header)
+        return pickle.loads(await self.proc.stdout.readexactly(size))
+
+    async def close(self):
+        if self.proc.returncode is None:
+            self.proc.stdin.close()
+        await self.proc.wait()
+
+    async def kill(self):
+        if self.proc.returncode is None:
+            self.proc.kill()
+        await self.proc.wait()
+
+
 class SubprocessEvaluator(Evaluator):
     """This evaluator uses the ``asyncio.create_subprocess_exec`` as backend.
 
+    By default a new Python interpreter is started for each job. With ``persistent=True`` up to ``num_workers`` long-lived worker processes are kept, they import the ``run_function`` once and then receive configurations and send back results through their standard input/output as length-prefixed pickled messages. The ``run_function`` and its results must then be picklable.
+
     Args:
         run_function (callable): functions to be executed by the ``Evaluator``.
         num_workers (int, optional): Number of parallel processes used to compute the ``run_function``. Defaults to 1.
         callbacks (list, optional): A list of callbacks to trigger custom actions at the creation or completion of jobs. Defaults to None.
+        persistent (bool, optional): Keep long-lived worker processes instead of starting a new process for each job. Defaults to ``False``.
+        max_jobs_per_worker (int, optional): Number of jobs after which a persistent worker is replaced by a new one. Defaults to ``None`` for no limit.
+        max_memory_growth (float, optional): Growth of the peak resident memory (in MB) of a persistent worker, since it imported the ``run_function``, after which it is replaced by a new one. Defaults to ``None`` for no limit.
     """
 
     def __init__(
@@ -31,10 +66,24 @@ class SubprocessEvaluator(Evaluator):
         num_workers: int = 1,
         callbacks: list = None,
         run_function_kwargs: dict = None,
+        persistent: bool = False,
+        max_jobs_per_worker: int = None,
+        max_memory_growth: float = None,
     ):
         super().__init__(run_function, num_workers, callbacks, run_function_kwargs)
         self.sem = asyncio.Semaphore(num_workers)
 
+        if max_jobs_per_worker is not None and not (
+            isinstance(max_jobs_per_worker, int) and max_jobs_per_worker > 0
+        ):
+            raise ValueError(
+                f"Parameter 'max_jobs_per_worker={max_jobs_per_worker}' should be an int > 0 or None!"
+            )
+        self.persistent = persistent
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_memory_growth = max_memory_growth
+        self._idle_workers = []  # persistent workers waiting for a job
+
         if hasattr(run_function, "__name__") and hasattr(run_function, "__module__"):
             logger.info(
                 f"Subprocess Evaluator will execute {self.run_function.__name__}() from module {self.run_function.__module__}"
@@ -42,17 +91,104 @@ class SubprocessEvaluator(Evaluator):
         else:
             logger.info(f"Subprocess Evaluator will execute {self.run_function}")
 
+    def __exit__(self, type, value, traceback):
+        super().__exit__(type, value, traceback)
+        self.close_workers()
+
+    def close_workers(self):
+        """Stop the idle persistent workers."""
+        workers, self._idle_workers = self._idle_workers, []
+        if len(workers) > 0:
+            self.loop.run_until_complete(
+                asyncio.gather(*(worker.close() for worker in workers))
+            )
+
     def _encode(self, job):
-        return encode_dict(job.config)
+        return encode_dict(dict(job.config))
+
+    def _run_function_location(self):
+        # Retrieve the path of the module holding the user-defined function given to the async evaluator.
+        script_file = inspect.getfile(sys.modules[self.run_function.__module__])
+        module_path = os.path.dirname(script_file)
+        module_name = os.path.basename(script_file)[:-3]
+        return module_path, module_name, self.run_function.__name__
+
+    async def _start_worker(self):
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            _subprocess_worker.__file__,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        worker = _SubprocessWorker(proc)
+        try:
+            await worker.send(
+                (*self._run_function_location(), self.run_function_kwargs)
+            )
+            status, retval, memory = await worker.receive()
+        except asyncio.CancelledError:
+            await worker.kill()
+            raise
+        if status != "ready":
+            await worker.close()
+            raise RuntimeError(
+                f"{retval}\n\n Could not import the run_function in the worker process."
+            )
+        worker.memory_start = memory
+        return worker
+
+    def _is_worker_exhausted(self, worker, memory):
+        if (
+            self.max_jobs_per_worker is not None
+            and worker.num_jobs >= self.max_jobs_per_worker
+        ):
+            return True
+        if (
+            self.max_memory_growth is not None
+            and memory - worker.memory_start > self.max_memory_growth
+        ):
+            return True
+        return False
+
+    async def _execute_persistent(self, job):
+        worker = self._idle_workers.pop() if self._idle_workers else None
+        if worker is None:
+            worker = await self._start_worker()
+
+        try:
+            await worker.send(dict(job.config))
+            status, retval, memory = await worker.receive()
+        except asyncio.CancelledError:
+            # the job timed out while the worker was executing it
+            await worker.kill()
+            raise
+        except (asyncio.IncompleteReadError, BrokenPipeError, ConnectionResetError):
+            await worker.close()
+            raise RuntimeError(
+                f"The worker process terminated unexpectedly with exit code {worker.proc.returncode} while executing the run_function."
+            )
+
+        worker.num_jobs += 1
+        if self._is_worker_exhausted(worker, memory):
+            await worker.close()
+        else:
+            self._idle_workers.append(worker)
+
+        if status == "error":
+            raise RuntimeError(
+                f"{retval}\n\n Could not collect any result from the run_function in the main process because an error happened in the subprocess."
+            )
+        return retval
 
     async def execute(self, job):
         async with self.sem:
 
-            # Retrieve the path of the module holding the user-defined function given to the async evaluator.
+            if self.persistent:
+                job.result = await self._execute_persistent(job)
+                return job
+
             # Pass this module path to the subprocess to add to its python path and use.
-            script_file = inspect.getfile(sys.modules[self.run_function.__module__])
-            module_path = os.path.dirname(script_file)
-            module_name = os.path.basename(script_file)[:-3]
+            module_path, module_name, _ = self._run_function_location()
             # Code that will run on the subprocess.
             code = f"import sys; sys.path.insert(1, '{module_path}'); from {module_name} import {self.run_function.__name__}; print('DH-OUTPUT:' + str({self.run_function.__name__}({self._encode(job)}, **{encode_dict(self.run_function_kwargs)})))"
             logger.debug(f"executing:  {code}")
@@ -64,7 +200,13 @@ class SubprocessEvaluator(Evaluator):
                 stderr=asyncio.subprocess.PIPE,
             )
             # Retrieve the stdout byte array from the (stdout, stderr) tuple returned from the subprocess.
-            stdout, stderr = await proc.communicate()
+            try:
+                stdout, stderr = await proc.communicate()
+            except asyncio.CancelledError:
+                # the job timed out, the subprocess is killed
+                proc.kill()
+                await proc.wait()
+                raise
             # Search through the byte array using a regular expression and collect the return value of the user-defined function.
             try:
                 retval_bytes = re.search(b"DH-OUTPUT:(.+)\n", stdout).group(1)
@@ -0,0 +1,86 @@
+"""Long-lived worker process of the ``SubprocessEvaluator`` when ``persistent=True``.
+
+The worker is executed as a script (it does not import ``deephyper``) and exchanges messages with the evaluator on its standard input/output. Each message is a frame made of an 8 bytes big-endian length header followed by a pickled payload:
+
+1. the evaluator sends ``(module_path, module_name, function_name, run_function_kwargs)``;
+2. the worker imports the run-function once and answers ``("ready", None, memory)``;
+3. then for each configuration received the worker answers ``("ok", result, memory)`` or ``("error", traceback, memory)``;
+4. the worker exits when its standard input is closed.
+
+``memory`` is the peak resident set size of the worker in MB. What the run-function prints is redirected to the standard error so that it does not corrupt the messages.
+"""
+import importlib
+import os
+import pickle
+import struct
+import sys
+import traceback
+
+HEADER = struct.Struct("!Q")
+
+
+def read_frame(fp):
+    """Read a frame from a binary file, returns ``None`` when the file is closed."""
+    header = fp.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    (size,) = HEADER.unpack(header)
+    return pickle.loads(fp.read(size))
+
+
+def encode_frame(obj) -> bytes:
+    """Encode an object as a frame."""
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return HEADER.pack(len(payload)) + payload
+
+
+def peak_memory() -> float:
+    """Peak resident set size of the current process in MB."""
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return 0.0
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS and kilobytes on Linux
+    return maxrss / 1024**2 if sys.platform == "darwin" else maxrss / 1024
+
+
+def main():
+    # the directory of this script should not shadow the modules of the user
+    if sys.path and os.path.abspath(sys.path[0]) == os.path.dirname(
+        os.path.abspath(__file__)
+    ):
+        sys.path.pop(0)
+
+    # messages are written on the original stdout, prints go to stderr
+    fin = os.fdopen(os.dup(0), "rb")
+    fout = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+
+    def write(frame):
+        fout.write(frame)
+        fout.flush()
+
+    module_path, module_name, function_name, run_function_kwargs = read_frame(fin)
+    try:
+        sys.path.insert(1, module_path)
+        run_function = getattr(importlib.import_module(module_name), function_name)
+    except Exception:
+        write(encode_frame(("error", traceback.format_exc(), peak_memory())))
+        return
+    write(encode_frame(("ready", None, peak_memory())))
+
+    while True:
+        config = read_frame(fin)
+        if config is None:
+            break
+        try:
+            result = run_function(config, **run_function_kwargs)
+            frame = encode_frame(("ok", result, peak_memory()))
+        except Exception:
+            frame = encode_frame(("error", traceback.format_exc(), peak_memory()))
+        write(frame)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import functools
 import logging
 from concurrent.futures import ThreadPoolExecutor
@@ -40,8 +41,11 @@ class ThreadPoolEvaluator(Evaluator):
     async def execute(self, job):
         async with self.sem:
 
+            # the run-function may modify its configuration in place
             run_function = functools.partial(
-                job.run_function, job.config, **self.run_function_kwargs
+                job.run_function,
+                copy.deepcopy(dict(job.config)),
+                **self.run_function_kwargs,
             )
 
             sol = await self.loop.run_in_executor(self.executor, run_function)
@@ -2,6 +2,7 @@ from deephyper.keras.callbacks.utils import import_callback
 from deephyper.keras.callbacks.stop_if_unfeasible import StopIfUnfeasible
 from deephyper.keras.callbacks.csv_extended_logger import CSVExtendedLogger
 from deephyper.keras.callbacks.time_stopping import TimeStopping
+from deephyper.keras.callbacks.stopper import StopperCallback
 from deephyper.keras.callbacks.learning_rate_warmup import (
     LearningRateScheduleCallback,
     LearningRateWarmupCallback,
@@ -12,6 +13,7 @@ __all__ = [
     "StopIfUnfeasible",
     "CSVExtendedLogger",
     "TimeStopping",
+    "StopperCallback",
     "LearningRateScheduleCallback",
     "LearningRateWarmupCallback",
 ]
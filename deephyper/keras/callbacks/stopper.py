@@ -0,0 +1,28 @@
+import tensorflow as tf
+
+
+class StopperCallback(tf.keras.callbacks.Callback):
+    """Report the objective of the training to a ``Stopper`` after each epoch and stop the training when the stopper decides it.
+
+    Args:
+        stopper (Stopper): the stopper of the evaluation (see ``deephyper.evaluator.Stopper.from_config``).
+        objective (callable): function computing the objective from the history of the epochs trained so far, a ``dict`` mapping the name of each logged metric to the list of its values.
+    """
+
+    def __init__(self, stopper, objective):
+        super().__init__()
+        self.stopper = stopper
+        self.objective = objective
+        self.history = {}
+        self.num_epochs = 0
+        self.stopped_epoch = None
+
+    def on_epoch_end(self, epoch, logs=None):
+        # the epochs are counted over the successive calls to fit
+        self.num_epochs += 1
+        for name, value in (logs or {}).items():
+            self.history.setdefault(name, []).append(value)
+
+        if self.stopper.report(self.num_epochs, self.objective(self.history)):
+            self.model.stop_training = True
+            self.stopped_epoch = epoch
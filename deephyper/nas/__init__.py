@@ -1,4 +1,5 @@
 from ._nx_search_space import NxSearchSpace
 from ._keras_search_space import KSearchSpace
+from ._compiled_search_space import CompiledSearchSpace
 
-__all__ = ["NxSearchSpace", "KSearchSpace"]
+__all__ = ["NxSearchSpace", "KSearchSpace", "CompiledSearchSpace"]
@@ -0,0 +1,227 @@
+import copy
+
+from deephyper.core.exceptions import DeephyperRuntimeError
+from deephyper.core.exceptions.nas.space import (
+    StructureHasACycle,
+    WrongSequenceToSetOperations,
+)
+from deephyper.nas.node import ConstantNode, MimeNode, MirrorNode, VariableNode
+
+
+class CompiledSearchSpace:
+    """Immutable representation of a built ``KSearchSpace`` from which the tensors of an architecture are created without copying the graph of the search space.
+
+    The nodes of the graph are stored in a table with the indexes of their predecessors and their candidate operations. The edges created by the ``init`` of each candidate operation of the ``VariableNode`` and ``MimeNode`` nodes (e.g., ``Connect``) are recorded once at compilation, the graph being left unchanged. For an architecture, the nodes leading to the outputs are ordered topologically and only their chosen operations are copied (the search space and its nodes being shared by the copies) so that each model gets new layers.
+
+    Args:
+        search_space (KSearchSpace): the built search space.
+    """
+
+    def __init__(self, search_space):
+        if not self.supports(search_space):
+            raise ValueError(
+                "The search space can only have ConstantNode, VariableNode, MimeNode "
+                "and MirrorNode nodes whose sources are in the search space."
+            )
+        graph = search_space.graph
+        self.nodes = tuple(graph.nodes)
+        index = {node: i for i, node in enumerate(self.nodes)}
+        self._preds = tuple(
+            tuple(index[p] for p in graph.predecessors(node)) for node in self.nodes
+        )
+        self.variable_nodes = tuple(search_space.variable_nodes)
+        self._variables = tuple(index[node] for node in self.variable_nodes)
+        self._mimes = tuple(index[node] for node in search_space.mime_nodes)
+        self._inputs = tuple(index[node] for node in search_space.input_nodes)
+        self._sources = {
+            i: index[node._node if isinstance(node, MirrorNode) else node.node]
+            for i, node in enumerate(self.nodes)
+            if isinstance(node, (MirrorNode, MimeNode))
+        }
+
+        output_node = search_space.output_node
+        if output_node is None:
+            self._outputs = None
+        elif type(output_node) is list:
+            self._outputs = tuple(index[node] for node in output_node)
+        else:
+            self._outputs = index[output_node]
+
+        # edges (or errors) created by the init of the candidate operations
+        edges = set(graph.edges)
+        self._init_edges = {}
+        for i in self._variables + self._mimes:
+            for k, op in enumerate(self.nodes[i].ops):
+                self._init_edges[i, k] = self._record_init(graph, edges, index, i, op)
+
+        # objects shared by the copies of the operations
+        self._memo = {id(search_space): search_space, id(graph): graph}
+        self._memo.update({id(node): node for node in self.nodes})
+
+    @staticmethod
+    def supports(search_space) -> bool:
+        """Whether the nodes of a search space can be compiled."""
+        nodes = set(search_space.graph.nodes)
+        for node in nodes:
+            if isinstance(node, MirrorNode):
+                if node._node not in nodes:
+                    return False
+            elif isinstance(node, MimeNode):
+                if node.node not in nodes or not isinstance(node.node, VariableNode):
+                    return False
+            elif not isinstance(node, (ConstantNode, VariableNode)):
+                return False
+        return True
+
+    def _record_init(self, graph, edges, index, i, op):
+        """Call ``op.init`` on the node ``i`` and remove the edges it created from the graph (of initial ``edges``), returns the created edges or the raised exception."""
+        n_nodes = graph.number_of_nodes()
+        try:
+            op.init(self.nodes[i])
+            error = None
+        except Exception as e:
+            error = e
+        if graph.number_of_nodes() != n_nodes:
+            raise ValueError(
+                f"The operation '{op}' of {self.nodes[i]} adds nodes to the graph."
+            )
+        added = []
+        if graph.number_of_edges() != len(edges):
+            added = [
+                (p, node)
+                for node in self.nodes
+                for p in graph.predecessors(node)
+                if (p, node) not in edges
+            ]
+            graph.remove_edges_from(added)
+        if error is not None:
+            return error
+        return tuple((index[p], index[node]) for p, node in added)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of variable nodes, i.e., length of an architecture sequence."""
+        return len(self._variables)
+
+    def _chosen_ops(self, choice):
+        """Index of the chosen operation of each variable and mime node."""
+        if len(choice) != len(self._variables):
+            raise WrongSequenceToSetOperations(choice, list(self.variable_nodes))
+
+        chosen = {}
+        for op_i, i in zip(choice, self._variables):
+            chosen[i] = self.nodes[i].op_index(op_i)
+        for i in self._mimes:
+            node = self.nodes[i]
+            if node.num_ops != node.node.num_ops:
+                raise DeephyperRuntimeError(
+                    f"{str(node)} and {str(node.node)} should have the same number of opertions, when {str(node)} has {node.num_ops} and {str(node.node)} has {node.node.num_ops}!"
+                )
+            chosen[i] = chosen[self._sources[i]]
+        return chosen
+
+    def _op(self, i, chosen):
+        """Operation of the node ``i`` and key of the node owning it (``"<node index>"`` or ``"<node index>_<operation index>"``)."""
+        while i in self._sources and isinstance(self.nodes[i], MirrorNode):
+            i = self._sources[i]
+        if i in chosen:
+            return self.nodes[i].ops[chosen[i]], f"{i}_{chosen[i]}"
+        return self.nodes[i].op, f"{i}"
+
+    def _order(self, preds, outputs):
+        """Nodes leading to ``outputs`` in the order in which their tensors are created (depth-first from the outputs following the predecessors in order)."""
+        order, state = [], [0] * len(self.nodes)
+        for root in outputs:
+            if state[root] == 2:
+                continue
+            state[root] = 1
+            stack = [(root, iter(preds[root]))]
+            while stack:
+                i, it = stack[-1]
+                for j in it:
+                    if state[j] == 1:
+                        raise StructureHasACycle(
+                            f"the connection {self.nodes[j]} -> {self.nodes[i]} is "
+                            "creating a cycle in the search_space's graph."
+                        )
+                    if state[j] == 0:
+                        state[j] = 1
+                        stack.append((j, iter(preds[j])))
+                        break
+                else:
+                    stack.pop()
+                    state[i] = 2
+                    order.append(i)
+        return order
+
+    def create_tensors(self, choice, train=None, node_layers=None):
+        """Create the tensors of the architecture corresponding to ``choice``.
+
+        Args:
+            choice (list): A list of decision for the operations of the search space.
+            train (bool, optional): passed to the operations. Defaults to ``None``.
+            node_layers (dict, optional): if given, it is filled with the Keras layer of the operation of each node which has one, keyed by ``"<node index>"`` for constant nodes and ``"<node index>_<operation index>"`` for variable and mime nodes. The same key designates the same layer in all the architectures of the search space. Defaults to ``None``.
+
+        Raises:
+            WrongSequenceToSetOperations: raised when ``choice`` is of a wrong length.
+            StructureHasACycle: raised when the chosen operations create a cycle.
+
+        Returns:
+            (list, tensor or list): the input tensors and the output tensor(s), a list if the architecture has several outputs.
+        """
+        chosen = self._chosen_ops(choice)
+
+        # predecessors of the nodes with the edges of the chosen operations, in
+        # the order in which the operations are initialized
+        preds = list(self._preds)
+        for i in self._variables + self._mimes:
+            edges = self._init_edges[i, chosen[i]]
+            if isinstance(edges, Exception):
+                raise edges
+            for src, dst in edges:
+                if src not in preds[dst]:
+                    preds[dst] = preds[dst] + (src,)
+
+        outputs = self._outputs
+        if outputs is None:
+            has_successor = [False] * len(self.nodes)
+            for i_preds in preds:
+                for j in i_preds:
+                    has_successor[j] = True
+            outputs = [i for i, s in enumerate(has_successor) if not s]
+            if len(outputs) == 1:
+                outputs = outputs[0]
+        output_list = list(outputs) if type(outputs) in (list, tuple) else [outputs]
+
+        memo = dict(self._memo)
+        tensors = {}
+        for i in self._order(preds, output_list + list(self._inputs)):
+            node = self.nodes[i]
+            op, key = self._op(i, chosen)
+            op = copy.deepcopy(op, memo)
+            try:
+                if len(preds[i]) == 0:
+                    try:
+                        tensors[i] = op(train=train, seed=None)
+                    except TypeError:
+                        raise RuntimeError(
+                            f'Verify if node: "{node}" has incoming connexions!'
+                        )
+                else:
+                    inputs = []
+                    for j in preds[i]:
+                        if type(tensors[j]) is list:
+                            inputs.extend(tensors[j])
+                        else:
+                            inputs.append(tensors[j])
+                    tensors[i] = op(inputs, train=train)
+            except TypeError:
+                raise RuntimeError(f"Failed to build tensors from :{node}")
+            layer = getattr(op, "_layer", None)
+            if node_layers is not None and hasattr(layer, "get_weights"):
+                node_layers[key] = layer
+
+        input_tensors = [tensors[i] for i in self._inputs]
+        if type(outputs) in (list, tuple):
+            return input_tensors, [tensors[i] for i in outputs]
+        return input_tensors, tensors[outputs]
@@ -9,6 +9,7 @@ from deephyper.core.exceptions.nas.space import (
     InputShapeOfWrongType,
     WrongSequenceToSetOperations,
 )
+from deephyper.nas._compiled_search_space import CompiledSearchSpace
 from deephyper.nas._nx_search_space import NxSearchSpace
 from deephyper.nas.node import ConstantNode
 from deephyper.nas.operation import Tensor
@@ -99,6 +100,8 @@ class KSearchSpace(NxSearchSpace):
         self.output_node = None
 
         self._model = None
+        self._compiled = None
+        self._compiled_signature = None
 
     @property
     def input(self):
@@ -159,7 +162,16 @@ class KSearchSpace(NxSearchSpace):
             output_tensors = [
                 self.create_tensor_aux(self.graph, out) for out in self.output_node
             ]
+        else:
+            output_tensors = self.create_tensor_aux(self.graph, self.output_node)
+
+        input_tensors = [inode._tensor for inode in self.input_nodes]
 
+        self._model = self._create_keras_model(input_tensors, output_tensors)
+        return self._model
+
+    def _create_keras_model(self, input_tensors, output_tensors):
+        if type(output_tensors) is list:
             for out_T in output_tensors:
                 output_n = int(out_T.name.split("/")[0].split("_")[-1])
                 out_S = self.output_shape[output_n]
@@ -171,11 +183,8 @@ class KSearchSpace(NxSearchSpace):
                             RuntimeWarning,
                         )
 
-            input_tensors = [inode._tensor for inode in self.input_nodes]
-
-            self._model = keras.Model(inputs=input_tensors, outputs=output_tensors)
+            return keras.Model(inputs=input_tensors, outputs=output_tensors)
         else:
-            output_tensors = self.create_tensor_aux(self.graph, self.output_node)
             if tf.keras.backend.is_keras_tensor(output_tensors):
                 output_tensors_shape = output_tensors.type_spec.shape
                 if output_tensors_shape[1:] != self.output_shape:
@@ -184,11 +193,29 @@ class KSearchSpace(NxSearchSpace):
                         RuntimeWarning,
                     )
 
-            input_tensors = [inode._tensor for inode in self.input_nodes]
+            return keras.Model(inputs=input_tensors, outputs=[output_tensors])
 
-            self._model = keras.Model(inputs=input_tensors, outputs=[output_tensors])
+    def compile(self):
+        """Compile the search space once it is built. The compiled search space is kept and reused by ``sample`` as long as the graph is not modified.
 
-        return self._model
+        Returns:
+            CompiledSearchSpace: the compiled search space, ``None`` if the nodes of the search space are not supported by ``CompiledSearchSpace``.
+        """
+        signature = (
+            self.graph.number_of_nodes(),
+            self.graph.number_of_edges(),
+            tuple(getattr(node, "num_ops", 0) for node in self.graph.nodes),
+            tuple(self.output_node)
+            if type(self.output_node) is list
+            else self.output_node,
+        )
+        if signature != self._compiled_signature:
+            self._compiled_signature = signature
+            if CompiledSearchSpace.supports(self):
+                self._compiled = CompiledSearchSpace(self)
+            else:
+                self._compiled = None
+        return self._compiled
 
     def choices(self):
         """Gives the possible choices for each decision variable of the search space.
@@ -198,11 +225,12 @@ class KSearchSpace(NxSearchSpace):
         """
         return [(0, vnode.num_ops - 1) for vnode in self.variable_nodes]
 
-    def sample(self, choice=None):
+    def sample(self, choice=None, node_layers=None):
         """Sample a ``tf.keras.Model`` from the search space.
 
         Args:
             choice (list, optional): A list of decision for the operations of this search space. Defaults to None, will generate a random sample.
+            node_layers (dict, optional): if given, it is filled with the Keras layers of the model keyed by node and operation (see ``CompiledSearchSpace.create_tensors``) so that weights can be transferred between the models of the search space. It stays empty if the search space cannot be compiled. Defaults to ``None``.
 
         Returns:
             tf.keras.Model: A Tensorflow Keras model.
@@ -211,6 +239,13 @@ class KSearchSpace(NxSearchSpace):
         if choice is None:
             choice = [self._random.randint(c[0], c[1] + 1) for c in self.choices()]
 
+        compiled = self.compile()
+        if compiled is not None:
+            input_tensors, output_tensors = compiled.create_tensors(
+                choice, node_layers=node_layers
+            )
+            return self._create_keras_model(input_tensors, output_tensors)
+
         self_copy = copy.deepcopy(self)
         self_copy.set_ops(choice)
         model = self_copy.create_model()
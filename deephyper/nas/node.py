@@ -113,17 +113,27 @@ class VariableNode(OperationNode):
         self.get_op(index).init(self)
 
     def get_op(self, index):
+        self._index = self.op_index(index)
+        return self.op
+
+    def op_index(self, index):
+        """Absolute index of the operation chosen by ``index``, without setting it.
+
+        Args:
+            index (float|int): a normalized index in [0, 1] or an absolute index.
+
+        Returns:
+            int: the absolute index of the operation.
+        """
         assert "float" in str(type(index)) or "int" in str(
             type(index)
         ), f"found type is : {type(index)}"
         if "float" in str(type(index)):
-            self._index = self.denormalize(index)
-        else:
-            assert 0 <= index and index < len(
-                self._ops
-            ), f"Number of possible operations is: {len(self._ops)}, but index given is: {index} (index starts from 0)!"
-            self._index = index
-        return self.op
+            return self.denormalize(index)
+        assert 0 <= index and index < len(
+            self._ops
+        ), f"Number of possible operations is: {len(self._ops)}, but index given is: {index} (index starts from 0)!"
+        return index
 
     def denormalize(self, index):
         """Denormalize a normalized index to get an absolute indexes. Useful when you want to compare the number of different search_spaces.
@@ -0,0 +1,137 @@
+"""Cache of the data returned by the ``load_data`` function of a neural architecture search problem.
+
+The data are loaded once per process and reused by all the evaluations of the process. When the ``DEEPHYPER_DATA_CACHE_DIR`` environment variable is set, Numpy data are also written once in this directory as ``.npy`` files and every process maps them in memory (read-only) instead of calling ``load_data``, so that the workers of a machine share the same pages of memory.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DATA_CACHE_DIR_ENV = "DEEPHYPER_DATA_CACHE_DIR"
+
+# data loaded by the current process, by key of (load_data, kwargs)
+_cache = {}
+
+
+def data_cache_key(load_data: callable, kwargs: dict = None) -> str:
+    """Key identifying the data returned by ``load_data(**kwargs)``.
+
+    Args:
+        load_data (callable): the function loading the data.
+        kwargs (dict, optional): the keyword arguments of ``load_data``. Defaults to ``None``.
+
+    Returns:
+        str: the key.
+    """
+    name = f"{load_data.__module__}.{load_data.__qualname__}"
+    kwargs = json.dumps({} if kwargs is None else kwargs, sort_keys=True, default=repr)
+    return hashlib.sha1(f"{name}({kwargs})".encode()).hexdigest()
+
+
+def _flatten(data):
+    """Flatten Numpy data of the form ``(X_train, y_train), (X_valid, y_valid)`` where each element is an array or a list of arrays. Returns the arrays and the structure of the data, ``None`` if the data are not of this form."""
+    if type(data) is not tuple or len(data) != 2:
+        return None
+    arrays, structure = [], []
+    for split in data:
+        if type(split) is not tuple or len(split) != 2:
+            return None
+        for leaf in split:
+            leaf_arrays = leaf if type(leaf) is list else [leaf]
+            if not all(
+                type(x) is np.ndarray and not x.dtype.hasobject for x in leaf_arrays
+            ):
+                return None
+            arrays.extend(leaf_arrays)
+            structure.append(len(leaf) if type(leaf) is list else None)
+    return arrays, structure
+
+
+def _unflatten(arrays, structure):
+    leaves, i = [], 0
+    for n in structure:
+        if n is None:
+            leaves.append(arrays[i])
+            i += 1
+        else:
+            leaves.append(list(arrays[i : i + n]))
+            i += n
+    return (leaves[0], leaves[1]), (leaves[2], leaves[3])
+
+
+def _read(path):
+    with open(os.path.join(path, "structure.json"), "r") as f:
+        structure = json.load(f)
+    n_arrays = sum(1 if n is None else n for n in structure)
+    # views as np.ndarray (the type checked by the trainers) of the memory maps
+    arrays = [
+        np.load(os.path.join(path, f"{i}.npy"), mmap_mode="r").view(np.ndarray)
+        for i in range(n_arrays)
+    ]
+    return _unflatten(arrays, structure)
+
+
+def _write(path, arrays, structure):
+    # written in a temporary directory renamed once complete so that the other
+    # processes never read partial files
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    os.makedirs(tmp_path)
+    try:
+        for i, x in enumerate(arrays):
+            np.save(os.path.join(tmp_path, f"{i}.npy"), x)
+        with open(os.path.join(tmp_path, "structure.json"), "w") as f:
+            json.dump(structure, f)
+        os.rename(tmp_path, path)
+    except OSError:
+        # another process wrote the data first
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not os.path.exists(path):
+            raise
+
+
+def load_data_cached(load_data: callable, kwargs: dict = None, cache_dir: str = None):
+    """Return ``load_data(**kwargs)``, loaded at most once per process.
+
+    If ``cache_dir`` is given (defaults to the ``DEEPHYPER_DATA_CACHE_DIR`` environment variable) and the data are Numpy arrays of the form ``(X_train, y_train), (X_valid, y_valid)``, the arrays are returned as read-only memory maps of ``.npy`` files of ``cache_dir`` which are written by the first process loading the data. Other data (e.g., generators) are only cached in the memory of the process. The returned data are shared by all callers and must not be modified in place.
+
+    Args:
+        load_data (callable): the function loading the data.
+        kwargs (dict, optional): the keyword arguments of ``load_data``. Defaults to ``None``.
+        cache_dir (str, optional): the directory of the ``.npy`` files shared by the processes. Defaults to ``None``.
+
+    Returns:
+        the data returned by ``load_data``.
+    """
+    key = data_cache_key(load_data, kwargs)
+    if key in _cache:
+        return _cache[key]
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(DATA_CACHE_DIR_ENV)
+    path = None if cache_dir is None else os.path.join(cache_dir, key)
+
+    if path is not None and os.path.exists(path):
+        data = _read(path)
+        logger.info(f"Data mapped from {path}")
+    else:
+        data = load_data() if kwargs is None else load_data(**kwargs)
+        flat = None if path is None else _flatten(data)
+        if flat is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            _write(path, *flat)
+            data = _read(path)
+            logger.info(f"Data written to {path}")
+
+    _cache[key] = data
+    return data
+
+
+def clear_data_cache():
+    """Forget the data cached in the memory of the current process."""
+    _cache.clear()
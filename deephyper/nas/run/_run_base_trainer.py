@@ -3,10 +3,12 @@
 import os
 import traceback
 import logging
+from functools import partial
 
 import numpy as np
 import tensorflow as tf
-from deephyper.keras.callbacks import import_callback
+from deephyper.evaluator import Stopper
+from deephyper.keras.callbacks import StopperCallback, import_callback
 from deephyper.nas.run._util import (
     compute_objective,
     load_config,
@@ -15,6 +17,7 @@ from deephyper.nas.run._util import (
     get_search_space,
     default_callbacks_config,
     HistorySaver,
+    load_weights,
 )
 from deephyper.nas.trainer import BaseTrainer
 
@@ -69,9 +72,10 @@ def run_base_trainer(config):
 
     search_space = get_search_space(config, input_shape, output_shape, seed=seed)
 
+    node_layers = {}
     model_created = False
     try:
-        model = search_space.sample(config["arch_seq"])
+        model = search_space.sample(config["arch_seq"], node_layers=node_layers)
         model_created = True
     except Exception:
         logger.info("Error: Model creation failed...")
@@ -79,6 +83,14 @@ def run_base_trainer(config):
 
     if model_created:
 
+        # warm start from the weights of the parent architecture
+        parent_weights = config.get("parent_weights")
+        if parent_weights is not None and os.path.exists(parent_weights):
+            loaded = load_weights(parent_weights, node_layers)
+            logger.info(
+                f"Loaded the weights of {len(loaded)}/{len(node_layers)} layers from {parent_weights}"
+            )
+
         # Setup callbacks
         callbacks = []
         cb_requires_valid = False  # Callbacks requires validation data
@@ -113,11 +125,21 @@ def run_base_trainer(config):
         last_only, with_pred = preproc_trainer(config)
         last_only = last_only and not cb_requires_valid
 
+        # the objective is reported to the stopper of the evaluator after each epoch
+        stopper = Stopper.from_config(config)
+        if stopper is not None and not with_pred:
+            objective = partial(compute_objective, config["objective"])
+            trainer.callbacks.append(StopperCallback(stopper, objective))
+            last_only = False
+
         history = trainer.train(with_pred=with_pred, last_only=last_only)
 
         # save history
         saver.write_history(history)
 
+        if config.get("save_weights"):
+            saver.write_weights(node_layers)
+
         result = compute_objective(config["objective"], history)
     else:
         # penalising actions if model cannot be created
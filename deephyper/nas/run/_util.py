@@ -1,5 +1,6 @@
 """Utilitaries functions to ease the processing of a configuration (``dict``) generated by a neural architecture search algorithm.
 """
+import collections
 import logging
 import copy
 import json
@@ -14,6 +15,7 @@ from deephyper.core.exceptions.problem import WrongProblemObjective
 from deephyper.evaluator._encoder import Encoder
 from deephyper.core.utils import load_attr
 from deephyper.nas.lr_scheduler import exponential_decay
+from deephyper.nas.run._data_cache import load_data_cached
 
 
 default_callbacks_config = {
@@ -119,7 +121,7 @@ def setup_data(config: dict, add_to_config: bool = True) -> tuple:
     # Loading data
     load_data = config["load_data"]["func"]
     kwargs = config["load_data"].get("kwargs")
-    data = load_data() if kwargs is None else load_data(**kwargs)
+    data = load_data_cached(load_data, kwargs)
     logging.info(f"Data loaded with kwargs: {kwargs}")
 
     # Set data shape
@@ -204,14 +206,40 @@ def setup_data(config: dict, add_to_config: bool = True) -> tuple:
         return input_shape, output_shape, data
 
 
+# built search spaces of the current process, by key of their arguments
+_search_spaces = {}
+
+
 def get_search_space(config, input_shape, output_shape, seed):
+    """Build the search space defined by the ``"search_space"`` key of the ``config`` dictionnary. The search space is built once per process for the same arguments and reused by the next evaluations, its compiled representation (see ``KSearchSpace.compile``) creating the models without copying it.
+
+    Args:
+        config (dict): The JSON encoded configuration generated by DeepHyper.
+        input_shape (tuple or list): the shape(s) of the input(s).
+        output_shape (tuple or list): the shape(s) of the output(s).
+        seed (int): the seed of the search space.
+
+    Returns:
+        KSearchSpace: the built search space.
+    """
     space_class = config["search_space"]["class"]
     cs_kwargs = config["search_space"].get("kwargs")
+    key = (
+        f"{space_class.__module__}.{space_class.__qualname__}",
+        repr(input_shape),
+        repr(output_shape),
+        seed,
+        json.dumps(cs_kwargs, sort_keys=True, default=repr),
+    )
+    if key in _search_spaces:
+        return _search_spaces[key]
+
     if cs_kwargs is None:
         search_space = space_class(input_shape, output_shape, seed=seed)
     else:
         search_space = space_class(input_shape, output_shape, seed=seed, **cs_kwargs)
     search_space.build()
+    _search_spaces[key] = search_space
     return search_space
 
 
@@ -287,6 +315,7 @@ class HistorySaver:
         history_dir="history",
         model_dir="model",
         config_dir="config",
+        weights_dir="weights",
     ):
         self.id = config.get("job_id", uuid.uuid1())
         self.date = HistorySaver.get_date()
@@ -295,6 +324,7 @@ class HistorySaver:
         self.history_dir = os.path.join(self.save_dir, history_dir)
         self.model_dir = os.path.join(self.save_dir, model_dir)
         self.config_dir = os.path.join(self.save_dir, config_dir)
+        self.weights_dir = os.path.join(self.save_dir, weights_dir)
 
     @property
     def name(self) -> str:
@@ -312,6 +342,10 @@ class HistorySaver:
     def config_path(self) -> str:
         return os.path.join(self.config_dir, f"{self.name}.json")
 
+    @property
+    def weights_path(self) -> str:
+        return os.path.join(self.weights_dir, f"{self.name}.npz")
+
     @staticmethod
     def get_date() -> str:
         date = datetime.now()
@@ -338,6 +372,56 @@ class HistorySaver:
         if not (os.path.exists(self.model_dir)):
             pathlib.Path(self.model_dir).mkdir(parents=True, exist_ok=True)
 
+    def write_weights(self, node_layers: dict) -> None:
+        """Save the weights of the layers of a model keyed by node and operation (see ``KSearchSpace.sample``) so that they can be loaded by ``load_weights`` in an other model of the search space.
+
+        Args:
+            node_layers (dict): the layers of the model keyed by node and operation.
+        """
+        if not (os.path.exists(self.weights_dir)):
+            pathlib.Path(self.weights_dir).mkdir(parents=True, exist_ok=True)
+
+        weights = {
+            f"{key}_w{j}": w
+            for key, layer in node_layers.items()
+            for j, w in enumerate(layer.get_weights())
+        }
+        logging.info(f"Saving weights at: {self.weights_path}")
+        np.savez(self.weights_path, **weights)
+
+
+def get_weights_path(log_dir: str, job_id) -> str:
+    """Path of the weights saved by ``HistorySaver.write_weights`` for the job ``job_id`` of a search logging in ``log_dir``."""
+    return os.path.join(log_dir, "save", "weights", f"{job_id}.npz")
+
+
+def load_weights(path: str, node_layers: dict) -> list:
+    """Load the weights saved by ``HistorySaver.write_weights`` in the layers of an other model of the same search space. A layer is loaded only if the same node and operation was saved with weights of the same shapes.
+
+    Args:
+        path (str): the path of the saved weights.
+        node_layers (dict): the layers of the model keyed by node and operation (see ``KSearchSpace.sample``).
+
+    Returns:
+        list: the keys of the loaded layers.
+    """
+    saved = collections.defaultdict(dict)
+    with np.load(path) as data:
+        for name in data.files:
+            key, j = name.rsplit("_w", 1)
+            saved[key][int(j)] = data[name]
+
+    loaded = []
+    for key, layer in node_layers.items():
+        current = layer.get_weights()
+        if key not in saved or len(current) == 0 or len(saved[key]) != len(current):
+            continue
+        weights = [saved[key].get(j) for j in range(len(current))]
+        if all(w is not None and w.shape == c.shape for w, c in zip(weights, current)):
+            layer.set_weights(weights)
+            loaded.append(key)
+    return loaded
+
 
 def save_history(log_dir: str, history: dict, config: dict):
     if not (log_dir is None):
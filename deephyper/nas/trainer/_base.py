@@ -13,6 +13,31 @@ from deephyper.nas.metrics import selectMetric
 
 logger = logging.getLogger(__name__)
 
+# last dataset of tensor slices of each split, reused by the next trainers of the
+# process when they are given the same arrays (see deephyper.nas.run._data_cache)
+_tensor_slices_cache = {}
+
+
+def _tensor_slices(split, X, Y):
+    arrays = (*X, *(Y if type(Y) is list else [Y]))
+    cached = _tensor_slices_cache.get(split)
+    if (
+        cached is not None
+        and len(cached[0]) == len(arrays)
+        and all(x is y for x, y in zip(cached[0], arrays))
+    ):
+        return cached[1]
+
+    if type(Y) is list:
+        output_mapping = {f"output_{i}": y for i, y in enumerate(Y)}
+    else:
+        output_mapping = Y
+    dataset = tf.data.Dataset.from_tensor_slices(
+        ({f"input_{i}": x for i, x in enumerate(X)}, output_mapping)
+    )
+    _tensor_slices_cache[split] = (arrays, dataset)
+    return dataset
+
 
 class BaseTrainer:
     def __init__(self, config, model):
@@ -283,18 +308,7 @@ class BaseTrainer:
 
     def set_dataset_train(self):
         if self.data_config_type == "ndarray":
-            if type(self.train_Y) is list:
-                output_mapping = {
-                    f"output_{i}": tY for i, tY in enumerate(self.train_Y)
-                }
-            else:
-                output_mapping = self.train_Y
-            self.dataset_train = tf.data.Dataset.from_tensor_slices(
-                (
-                    {f"input_{i}": tX for i, tX in enumerate(self.train_X)},
-                    output_mapping,
-                )
-            )
+            self.dataset_train = _tensor_slices("train", self.train_X, self.train_Y)
         else:  # self.data_config_type == "gen"
             self.dataset_train = tf.data.Dataset.from_generator(
                 self.train_gen,
@@ -316,18 +330,7 @@ class BaseTrainer:
 
     def set_dataset_valid(self):
         if self.data_config_type == "ndarray":
-            if type(self.valid_Y) is list:
-                output_mapping = {
-                    f"output_{i}": vY for i, vY in enumerate(self.valid_Y)
-                }
-            else:
-                output_mapping = self.valid_Y
-            self.dataset_valid = tf.data.Dataset.from_tensor_slices(
-                (
-                    {f"input_{i}": vX for i, vX in enumerate(self.valid_X)},
-                    output_mapping,
-                )
-            )
+            self.dataset_valid = _tensor_slices("valid", self.valid_X, self.valid_Y)
         else:
             self.dataset_valid = tf.data.Dataset.from_generator(
                 self.valid_gen,
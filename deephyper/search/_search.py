@@ -1,11 +1,9 @@
 import abc
 import copy
-import functools
 import os
 import pathlib
 
 import numpy as np
-import pandas as pd
 import yaml
 from deephyper.core.exceptions import SearchTerminationError
 from deephyper.core.utils._introspection import get_init_params_as_json
@@ -23,10 +21,22 @@ class Search(abc.ABC):
         random_state ([type], optional): [description]. Defaults to None.
         log_dir (str, optional): [description]. Defaults to ".".
         verbose (int, optional): [description]. Defaults to 0.
+        stopper (Stopper, optional): stopper deciding if the evaluations are stopped early from the intermediate objectives reported by the run-function (see ``deephyper.evaluator.Stopper``). If its ``path`` is ``None`` the objectives are shared in the ``stopper`` directory of ``log_dir``. Defaults to ``None``.
     """
 
+    # time (in seconds) given to the evaluator to cancel and report the running jobs
+    # after the timeout before the search is interrupted
+    TIMEOUT_GRACE_PERIOD = 0.25
+
     def __init__(
-        self, problem, evaluator, random_state=None, log_dir=".", verbose=0, **kwargs
+        self,
+        problem,
+        evaluator,
+        random_state=None,
+        log_dir=".",
+        verbose=0,
+        stopper=None,
+        **kwargs,
     ):
 
         # get the __init__ parameters
@@ -53,6 +63,13 @@ class Search(abc.ABC):
 
         self._verbose = verbose
 
+        # early stopping of the evaluations
+        self._stopper = stopper
+        if stopper is not None:
+            if stopper.path is None:
+                stopper.path = os.path.join(self._log_dir, "stopper")
+            self._evaluator.set_stopper(stopper)
+
     def check_evaluator(self, evaluator):
         if not (isinstance(evaluator, Evaluator)) and callable(evaluator):
             self._evaluator = Evaluator.create(
@@ -89,7 +106,7 @@ class Search(abc.ABC):
             yaml.dump(context, file)
 
     def _set_timeout(self, timeout=None):
-        """If the `timeout` parameter is valid. Run the search in an other thread and trigger a timeout when this thread exhaust the allocated time budget."""
+        """If the `timeout` parameter is valid. Set the time budget of the evaluator which cancels the running jobs and terminates the search when it is exhausted."""
 
         if timeout is not None:
             if type(timeout) is not int:
@@ -99,11 +116,7 @@ class Search(abc.ABC):
             if timeout <= 0:
                 raise ValueError("'timeout' should be > 0!")
 
-        if np.isscalar(timeout) and timeout > 0:
-            self._evaluator.set_timeout(timeout)
-            self._search = functools.partial(
-                terminate_on_timeout, timeout, self._search
-            )
+        self._evaluator.set_timeout(timeout)
 
     def search(self, max_evals: int = -1, timeout: int = None):
         """Execute the search algorithm.
@@ -129,19 +142,25 @@ class Search(abc.ABC):
                     cb.set_max_evals(max_evals)
 
         try:
-            self._search(max_evals, timeout)
+            if timeout is None:
+                self._search(max_evals, timeout)
+            else:
+                # the search is run in an other thread in case it is blocked
+                # by something else than the evaluator after the timeout
+                terminate_on_timeout(
+                    timeout + self.TIMEOUT_GRACE_PERIOD,
+                    self._search,
+                    max_evals,
+                    timeout,
+                )
         except SearchTerminationError:
             if "saved_keys" in dir(self):
                 self._evaluator.dump_evals(saved_keys=self.saved_keys)
             else:
                 self._evaluator.dump_evals(log_dir=self._log_dir)
 
-        try:
-            path_results = os.path.join(self._log_dir, "results.csv")
-            df_results = pd.read_csv(path_results)
-            return df_results
-        except FileNotFoundError:
-            return None
+        df_results = self._evaluator.load_evals(log_dir=self._log_dir)
+        return df_results
 
     @abc.abstractmethod
     def _search(self, max_evals, timeout):
@@ -33,6 +33,76 @@ def scheduler_periodic_exponential_decay(i, eta_0, periode, rate):
     return eta_i
 
 
+class _AdaptiveBatching:
+    """Manager policy deciding when the surrogate model is updated.
+
+    It keeps moving averages of the duration of an update (``tell`` followed by ``ask``) and of the rate at which evaluations complete. Their product is the number of evaluations expected to complete during an update. Received results are accumulated until this many are pending before updating the surrogate model. Meanwhile, the workers which become free receive configurations from a buffer computed at the previous update. When updates are fast with respect to evaluations both the batch size and the buffer are minimal and the policy behaves as updating at each received result.
+
+    Args:
+        num_workers (int): number of workers of the evaluator.
+        smoothing (float, optional): weight of new measures in the moving averages. Defaults to ``0.2``.
+    """
+
+    def __init__(self, num_workers: int, smoothing: float = 0.2):
+        self.num_workers = num_workers
+        self.smoothing = smoothing
+
+        # configurations ready to be submitted
+        self.buffer = []
+        # results not yet given to the optimizer
+        self.pending_X = []
+        self.pending_y = []
+
+        self._latency = None
+        self._num_completed = None
+        self._duration = None
+        self._timestamp = None
+
+    def _average(self, average, value):
+        if average is None:
+            return value
+        return (1 - self.smoothing) * average + self.smoothing * value
+
+    def observe_completed(self, n: int):
+        """Record that ``n`` evaluations were gathered."""
+        now = time.time()
+        if self._timestamp is not None:
+            self._num_completed = self._average(self._num_completed, n)
+            self._duration = self._average(self._duration, now - self._timestamp)
+        self._timestamp = now
+
+    def observe_latency(self, duration: float):
+        """Record the duration of an update of the surrogate model."""
+        self._latency = self._average(self._latency, duration)
+
+    @property
+    def expected_completed(self) -> float:
+        """Number of evaluations expected to complete during an update."""
+        if self._latency is None or self._num_completed is None:
+            return 0.0
+        rate = self._num_completed / max(self._duration, 1e-6)
+        return rate * self._latency
+
+    @property
+    def batch_size(self) -> int:
+        """Number of pending results required to update the surrogate model."""
+        return int(np.clip(round(self.expected_completed), 1, self.num_workers))
+
+    @property
+    def buffer_size(self) -> int:
+        """Number of configurations to keep ready for the workers which complete until the next update is done."""
+        return int(min(round(2 * self.expected_completed), self.num_workers))
+
+    def pop(self, n: int) -> list:
+        """Remove and return up to ``n`` configurations from the buffer."""
+        batch, self.buffer = self.buffer[:n], self.buffer[n:]
+        return batch
+
+    def should_update(self, num_missing: int) -> bool:
+        """Decide if the surrogate model is updated given the number of free workers for which the buffer had no configuration."""
+        return num_missing > 0 or len(self.pending_y) >= self.batch_size
+
+
 class CBO(Search):
     """Centralized Bayesian Optimisation Search, previously named as "Asynchronous Model-Based Search" (AMBS). It follows a manager-workers architecture where the manager runs the Bayesian optimization loop and workers execute parallel evaluations of the black-box function.
 
@@ -47,7 +117,7 @@ class CBO(Search):
         random_state (int, optional): Random seed. Defaults to ``None``.
         log_dir (str, optional): Log directory where search's results are saved. Defaults to ``"."``.
         verbose (int, optional): Indicate the verbosity level of the search. Defaults to ``0``.
-        surrogate_model (Union[str,sklearn.base.RegressorMixin], optional): Surrogate model used by the Bayesian optimization. Can be a value in ``["RF", "GP", "ET", "GBRT", "DUMMY"]`` or a sklearn regressor. ``"RF"`` is for Random-Forest which is the best compromise between speed and quality when performing a lot of parallel evaluations, i.e., reaching more than hundreds of evaluations. ``"GP"`` is for Gaussian-Process which is the best choice when maximizing the quality of iteration but quickly slow down when reaching hundreds of evaluations, also it does not support conditional search space. ``"ET"`` is for Extra-Tree, faster than random forest but with worse mean estimate and poor uncertainty quantification capabilities. ``"GBRT"`` is for Gradient-Boosting Regression Tree, it has better mean estimate than other tree-based method worse uncertainty quantification capabilities and slower than ``"RF"``. Defaults to ``"RF"``.
+        surrogate_model (Union[str,sklearn.base.RegressorMixin], optional): Surrogate model used by the Bayesian optimization. Can be a value in ``["RF", "GP", "SGP", "ET", "GBRT", "DUMMY"]`` or a sklearn regressor. ``"RF"`` is for Random-Forest which is the best compromise between speed and quality when performing a lot of parallel evaluations, i.e., reaching more than hundreds of evaluations. ``"GP"`` is for Gaussian-Process which is the best choice when maximizing the quality of iteration but quickly slow down when reaching hundreds of evaluations, also it does not support conditional search space. ``"SGP"`` is for Sparse Gaussian-Process, a Gaussian-Process with a fixed number of inducing points which is updated incrementally with new evaluations and keeps a constant cost per update when reaching thousands of evaluations. ``"ET"`` is for Extra-Tree, faster than random forest but with worse mean estimate and poor uncertainty quantification capabilities. ``"GBRT"`` is for Gradient-Boosting Regression Tree, it has better mean estimate than other tree-based method worse uncertainty quantification capabilities and slower than ``"RF"``. Defaults to ``"RF"``.
         acq_func (str, optional): Acquisition function used by the Bayesian optimization. Can be a value in ``["UCB", "EI", "PI", "gp_hedge"]``. Defaults to ``"UCB"``.
         acq_optimizer (str, optional): Method used to minimze the acquisition function. Can be a value in ``["sampling", "lbfgs"]``. Defaults to ``"auto"``.
         kappa (float, optional): Manage the exploration/exploitation tradeoff for the "UCB" acquisition function. Defaults to ``1.96`` which corresponds to 95% of the confidence interval.
@@ -64,6 +134,10 @@ class CBO(Search):
         max_failures (int, optional): Maximum number of failed configurations allowed before observing a valid objective value when ``filter_failures`` is not equal to ``"ignore"``. Defaults to ``100``.
         moo_scalarization_strategy (str, optional): Scalarization strategy used in multiobjective optimization. Can be a value in ``["Linear", "Chebyshev", "AugChebyshev", "PBI", "Quadratic", "rLinear", "rChebyshev", "rAugChebyshev", "rPBI", "rQuadratic"]``. Defaults to ``"Chebyshev"``.
         moo_scalarization_weight (list, optional): Scalarization weights to be used in multiobjective optimization with length equal to the number of objective functions. Defaults to ``None``.
+        refit_period (int, optional): Number of updates of the surrogate model after which all its trees are re-fitted. With ``1`` the surrogate model is re-fitted from scratch at each update. With ``k > 1`` only ``1/k`` of the trees of ``"RF"`` and ``"ET"`` surrogate models are re-fitted at each update which keeps the cost of updates constant when many evaluations are received. With ``k > 1`` the kernel hyperparameters of the ``"GP"`` surrogate model are optimized every ``k`` updates and the new evaluations are added to its Cholesky decomposition in between, in quadratic instead of cubic time. Not used with other surrogate models. Defaults to ``1``.
+        adaptive_batching (bool, optional): If ``True`` the number of results accumulated before updating the surrogate model is adapted to the measured duration of updates and completion rate of evaluations, and workers which become free in the meantime receive configurations computed in advance. It keeps workers busy when updates are slow with respect to evaluations, it is meant for surrogate models which are slow to fit such as ``"GP"`` with many workers. With fast surrogate models (e.g., ``"RF"``) the surrogate model is already updated with all the results gathered during an update and the buffered configurations can lower the number of evaluations per second. Only used with asynchronous communication. Defaults to ``False`` to update the surrogate model each time results are received.
+        candidate_generator (str, optional): Generator of the ``n_points`` configurations on which the acquisition function is optimized. Can be a value in ``["random", "sobol", "halton"]``. With ``"random"`` new configurations are sampled at each update. With ``"sobol"`` or ``"halton"`` the configurations come from a scrambled low-discrepancy sequence which is transformed once and refreshed incrementally, completed by perturbations of the best configurations, so that a smaller ``n_points`` can be used. Only used when the search space has no conditions or forbidden clauses. Defaults to ``"random"``.
+        stopper (Stopper, optional): stopper deciding if the evaluations are stopped early from the intermediate objectives reported by the run-function, e.g., ``SuccessiveHalvingStopper`` to stop the trainings which are not in the top of the objectives reported after the same number of epochs. The workers of stopped evaluations receive new configurations. The objective of a stopped evaluation is the one returned by the run-function (e.g., its last reported objective). Defaults to ``None``.
     """
 
     def __init__(
@@ -92,10 +166,16 @@ class CBO(Search):
         moo_scalarization_strategy: str = "Chebyshev",
         moo_scalarization_weight=None,
         scheduler=None,
+        refit_period: int = 1,
+        adaptive_batching: bool = False,
+        candidate_generator: str = "random",
+        stopper=None,
         **kwargs,
     ):
 
-        super().__init__(problem, evaluator, random_state, log_dir, verbose)
+        super().__init__(
+            problem, evaluator, random_state, log_dir, verbose, stopper=stopper
+        )
         # get the __init__ parameters
         self._init_params = locals()
 
@@ -103,7 +183,7 @@ class CBO(Search):
         if not (type(n_jobs) is int):
             raise ValueError(f"Parameter n_jobs={n_jobs} should be an integer value!")
 
-        surrogate_model_allowed = ["RF", "ET", "GBRT", "DUMMY", "GP", "MF"]
+        surrogate_model_allowed = ["RF", "ET", "GBRT", "DUMMY", "GP", "SGP", "MF"]
         if surrogate_model in surrogate_model_allowed:
             base_estimator = self._get_surrogate_model(
                 surrogate_model,
@@ -142,6 +222,17 @@ class CBO(Search):
                 f"Parameter max_failures={max_failures} should be an integer value!"
             )
 
+        if not (type(refit_period) is int and refit_period > 0):
+            raise ValueError(
+                f"Parameter refit_period={refit_period} should be an integer value > 0!"
+            )
+
+        candidate_generator_allowed = ["random", "sobol", "halton"]
+        if not (candidate_generator in candidate_generator_allowed):
+            raise ValueError(
+                f"Parameter candidate_generator={candidate_generator} should have a value in {candidate_generator_allowed}!"
+            )
+
         moo_scalarization_strategy_allowed = [
             "Linear",
             "Chebyshev",
@@ -219,6 +310,8 @@ class CBO(Search):
                 ),
                 "max_failures": max_failures,
                 "boltzmann_gamma": 1,
+                "refit_period": refit_period,
+                "candidate_generator": candidate_generator,
             },
             # acquisition function
             acq_func=MAP_acq_func.get(acq_func, acq_func),
@@ -231,6 +324,7 @@ class CBO(Search):
         )
 
         self._gather_type = "ALL" if sync_communication else "BATCH"
+        self._adaptive_batching = adaptive_batching and not (sync_communication)
 
         # scheduler policy
         self.scheduler = None
@@ -277,6 +371,10 @@ class CBO(Search):
         num_evals_done = 0
         num_local_evals_done = 0
 
+        batching = None
+        if self._adaptive_batching:
+            batching = _AdaptiveBatching(self._evaluator.num_workers)
+
         logging.info(f"Asking {self._evaluator.num_workers} initial configurations...")
         t1 = time.time()
         new_X = self._opt.ask(n_points=self._evaluator.num_workers)
@@ -318,6 +416,8 @@ class CBO(Search):
                     f"Gathered {num_new_local_results} job(s) in {time.time() - t1:.4f} sec."
                 )
             num_local_evals_done += num_new_local_results
+            if batching is not None:
+                batching.observe_completed(num_new_local_results)
 
             if num_new_local_results > 0:
 
@@ -359,34 +459,85 @@ class CBO(Search):
                 # apply scheduler
                 self._apply_scheduler(i=num_local_evals_done)
 
-                logging.info("Fitting the optimizer...")
-                t1 = time.time()
+                if batching is None:
+                    self._tell_ask_submit(opt_X, opt_y, num_new_local_results)
+                    continue
 
-                if len(opt_y) > 0:
-                    self._opt.tell(opt_X, opt_y)
-                    logging.info(f"Fitting took {time.time() - t1:.4f} sec.")
+                batching.pending_X.extend(opt_X)
+                batching.pending_y.extend(opt_y)
 
-                logging.info(f"Asking {num_new_local_results} new configurations...")
-                t1 = time.time()
-                new_X = self._opt.ask(
-                    n_points=num_new_local_results, strategy=self._multi_point_strategy
-                )
-                logging.info(f"Asking took {time.time() - t1:.4f} sec.")
+                # free workers receive configurations computed in advance
+                new_batch = batching.pop(num_new_local_results)
+                if len(new_batch) > 0:
+                    logging.info(
+                        f"Submitting {len(new_batch)} buffered configurations..."
+                    )
+                    t1 = time.time()
+                    self._evaluator.submit(new_batch)
+                    logging.info(f"Submition took {time.time() - t1:.4f} sec.")
+                num_missing = num_new_local_results - len(new_batch)
+
+                if batching.should_update(num_missing):
+                    t_update = time.time()
+                    num_refill = max(batching.buffer_size - len(batching.buffer), 0)
+                    logging.info(
+                        f"Updating with {len(batching.pending_y)} result(s) (batch size {batching.batch_size}, buffer size {batching.buffer_size})..."
+                    )
+                    new_batch = self._tell_ask_submit(
+                        batching.pending_X,
+                        batching.pending_y,
+                        num_missing + num_refill,
+                        num_submit=num_missing,
+                    )
+                    batching.pending_X, batching.pending_y = [], []
+                    batching.buffer.extend(new_batch[num_missing:])
+                    batching.observe_latency(time.time() - t_update)
 
-                # Transform list to dict configurations
-                logging.info("Transforming configurations to dict...")
-                t1 = time.time()
-                new_batch = []
-                for x in new_X:
-                    new_cfg = self._to_dict(x)
-                    new_batch.append(new_cfg)
-                logging.info(f"Transformation took {time.time() - t1:.4f} sec.")
+    def _tell_ask_submit(self, opt_X, opt_y, num_ask, num_submit=None):
+        """Give results to the optimizer, ask new configurations and submit them to the evaluator.
 
-                # submit new configurations
-                logging.info(f"Submitting {len(new_batch)} configurations...")
-                t1 = time.time()
-                self._evaluator.submit(new_batch)
-                logging.info(f"Submition took {time.time() - t1:.4f} sec.")
+        Args:
+            opt_X (list): the evaluated points.
+            opt_y (list): the corresponding objectives.
+            num_ask (int): the number of configurations to ask.
+            num_submit (int, optional): the number of asked configurations to submit. Defaults to ``None`` to submit all of them.
+
+        Returns:
+            list: the configurations asked.
+        """
+        logging.info("Fitting the optimizer...")
+        t1 = time.time()
+
+        if len(opt_y) > 0:
+            self._opt.tell(opt_X, opt_y)
+            logging.info(f"Fitting took {time.time() - t1:.4f} sec.")
+
+        if num_ask == 0:
+            return []
+
+        logging.info(f"Asking {num_ask} new configurations...")
+        t1 = time.time()
+        new_X = self._opt.ask(n_points=num_ask, strategy=self._multi_point_strategy)
+        logging.info(f"Asking took {time.time() - t1:.4f} sec.")
+
+        # Transform list to dict configurations
+        logging.info("Transforming configurations to dict...")
+        t1 = time.time()
+        new_batch = []
+        for x in new_X:
+            new_cfg = self._to_dict(x)
+            new_batch.append(new_cfg)
+        logging.info(f"Transformation took {time.time() - t1:.4f} sec.")
+
+        # submit new configurations
+        submit_batch = new_batch if num_submit is None else new_batch[:num_submit]
+        if len(submit_batch) > 0:
+            logging.info(f"Submitting {len(submit_batch)} configurations...")
+            t1 = time.time()
+            self._evaluator.submit(submit_batch)
+            logging.info(f"Submition took {time.time() - t1:.4f} sec.")
+
+        return new_batch
 
     def _get_surrogate_model(
         self, name: str, n_jobs: int = None, random_state: int = None
@@ -400,7 +551,7 @@ class CBO(Search):
         Raises:
             ValueError: when the name of the surrogate model is unknown.
         """
-        accepted_names = ["RF", "ET", "GBRT", "DUMMY", "GP", "MF"]
+        accepted_names = ["RF", "ET", "GBRT", "DUMMY", "GP", "SGP", "MF"]
         if not (name in accepted_names):
             raise ValueError(
                 f"Unknown surrogate model {name}, please choose among {accepted_names}."
@@ -437,7 +588,7 @@ class CBO(Search):
                 raise deephyper.core.exceptions.MissingRequirementError(
                     "Installing 'deephyper/scikit-garden' is required to use MondrianForest (MF) regressor as a surrogate model!"
                 )
-        else:  # for DUMMY and GP
+        else:  # for DUMMY, GP and SGP
             surrogate = name
 
         return surrogate
@@ -24,7 +24,7 @@ class DBO(CBO):
         comm (optional): The MPI communicator to use. Defaults to ``None``.
         run_function_kwargs (dict): Keyword arguments to pass to the run-function. Defaults to ``None``.
         n_jobs (int, optional): Parallel processes per rank to use for optimization updates (e.g., model re-fitting). Not used in ``surrogate_model`` if passed as own sklearn regressor. Defaults to ``1``.
-        surrogate_model (Union[str,sklearn.base.RegressorMixin], optional): Type of the surrogate model to use. Can be a value in ``["RF", "GP", "ET", "GBRT", "DUMMY"]`` or a sklearn regressor. ``"DUMMY"`` can be used of random-search, ``"GP"`` for Gaussian-Process (efficient with few iterations such as a hundred sequentially but bottleneck when scaling because of its cubic complexity w.r.t. the number of evaluations), "``"RF"`` for the Random-Forest regressor (log-linear complexity with respect to the number of evaluations). Defaults to ``"RF"``.
+        surrogate_model (Union[str,sklearn.base.RegressorMixin], optional): Type of the surrogate model to use. Can be a value in ``["RF", "GP", "SGP", "ET", "GBRT", "DUMMY"]`` or a sklearn regressor. ``"DUMMY"`` can be used of random-search, ``"GP"`` for Gaussian-Process (efficient with few iterations such as a hundred sequentially but bottleneck when scaling because of its cubic complexity w.r.t. the number of evaluations), ``"SGP"`` for a Sparse Gaussian-Process with inducing points (linear complexity with respect to the number of evaluations), "``"RF"`` for the Random-Forest regressor (log-linear complexity with respect to the number of evaluations). Defaults to ``"RF"``.
         n_initial_points (int, optional): Number of collected objectives required before fitting the surrogate-model. Defaults to ``10``.
         initial_point_generator (str, optional): Sets an initial points generator. Can be either ``["random", "sobol", "halton", "hammersly", "lhs", "grid"]``. Defaults to ``"random"``.
         lazy_socket_allocation (bool, optional): If `True` then MPI communication socket are initialized only when used for the first time, otherwise the initialization is forced when creating the instance. Defaults to ``False``.
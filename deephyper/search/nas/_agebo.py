@@ -1,4 +1,5 @@
 import collections
+from functools import partial
 
 import deephyper.skopt
 import numpy as np
@@ -37,6 +38,10 @@ class AgEBO(RegularizedEvolution):
         liar_strategy (str, optional): Definition of the constant value use for the Liar strategy. Can be a value in ``["cl_min", "cl_mean", "cl_max"]`` . Defaults to ``"cl_max"``.
         n_jobs (int, optional): Number of parallel processes used to fit the surrogate model of the Bayesian optimization. A value of ``-1`` will use all available cores. Defaults to ``1``.
         sync_communcation (bool, optional): Performs the search in a batch-synchronous manner. Defaults to ``False`` for asynchronous updates.
+        duplicates (str, optional): how configurations already submitted are handled, a value in ``["evaluate", "resample", "reuse"]`` (see ``RegularizedEvolution``). Defaults to ``"evaluate"``.
+        cache_hyperparameters (bool, optional): whether the hyperparameters are part of the key of the cached evaluations, if ``False`` configurations with the same architecture are duplicates. Defaults to ``True``.
+        inherit_weights (bool, optional): whether the children are warm-started from the weights of their parent (see ``RegularizedEvolution``). Defaults to ``False``.
+        stopper (Stopper, optional): stopper deciding if the trainings are stopped early from the objectives reported after each epoch (see ``RegularizedEvolution``). Defaults to ``None``.
     """
 
     def __init__(
@@ -60,6 +65,10 @@ class AgEBO(RegularizedEvolution):
         liar_strategy: str = "cl_max",
         n_jobs: int = 1,
         sync_communication: bool = False,
+        duplicates: str = "evaluate",
+        cache_hyperparameters: bool = True,
+        inherit_weights: bool = False,
+        stopper=None,
     ):
         super().__init__(
             problem,
@@ -69,7 +78,12 @@ class AgEBO(RegularizedEvolution):
             verbose,
             population_size,
             sample_size,
+            duplicates,
+            inherit_weights,
+            stopper=stopper,
         )
+        if self._cache is not None:
+            self._cache.include_hyperparameters = cache_hyperparameters
 
         # Initialize opitmizer of hyperparameter space
         if len(self._problem._hp_space._space) == 0:
@@ -167,7 +181,9 @@ class AgEBO(RegularizedEvolution):
             self._setup_hp_optimizer()
 
         num_evals_done = 0
-        population = collections.deque(maxlen=self._population_size)
+        self._population = collections.deque(maxlen=self._population_size)
+        self._reused_keys = set()
+        population = self._population
 
         # Filling available nodes at start
         batch = self._gen_random_batch(size=self._evaluator.num_workers)
@@ -181,6 +197,7 @@ class AgEBO(RegularizedEvolution):
 
             if len(new_results) > 0:
                 population.extend(new_results)
+                self._cache_results(new_results)
 
                 self._evaluator.dump_evals(
                     saved_keys=self._saved_keys, log_dir=self._log_dir
@@ -194,6 +211,8 @@ class AgEBO(RegularizedEvolution):
                 # If the population is big enough evolve the population
                 if len(population) == self._population_size:
                     children_batch = []
+                    parents = []
+                    samples = []
 
                     # For each new parent/result we create a child from it
                     for new_i in range(len(new_results)):
@@ -211,6 +230,8 @@ class AgEBO(RegularizedEvolution):
 
                         # add child to batch
                         children_batch.append(child)
+                        parents.append(parent)
+                        samples.append(sample)
 
                         # collect infos for hp optimization
                         new_i_hp_values = self._problem.extract_hp_values(
@@ -226,8 +247,15 @@ class AgEBO(RegularizedEvolution):
                     )
 
                     new_configs = []
-                    for hp_values, child_arch_seq in zip(new_hps, children_batch):
+                    for hp_values, child_arch_seq, parent, sample in zip(
+                        new_hps, children_batch, parents, samples
+                    ):
                         new_config = self._problem.gen_config(child_arch_seq, hp_values)
+                        new_config = self._deduplicate(
+                            new_config,
+                            partial(self._gen_child_config, parent, hp_values),
+                        )
+                        new_config = self._set_parent_weights(new_config, sample)
                         new_configs.append(new_config)
 
                     # submit_childs
@@ -263,15 +291,31 @@ class AgEBO(RegularizedEvolution):
             for hp_values in points:
                 arch_seq = self._random_search_space()
                 config = self._problem.gen_config(arch_seq, hp_values)
-                batch.append(config)
+                batch.append(
+                    self._deduplicate(
+                        config, partial(self._gen_random_arch_config, hp_values)
+                    )
+                )
         else:  # passed hps are used
             assert size == len(hps)
             for hp_values in hps:
                 arch_seq = self._random_search_space()
                 config = self._problem.gen_config(arch_seq, hp_values)
-                batch.append(config)
+                batch.append(
+                    self._deduplicate(
+                        config, partial(self._gen_random_arch_config, hp_values)
+                    )
+                )
         return batch
 
+    def _gen_random_arch_config(self, hp_values: list) -> dict:
+        arch_seq = self._random_search_space()
+        return self._problem.gen_config(arch_seq, hp_values)
+
+    def _gen_child_config(self, parent_arch: list, hp_values: list) -> dict:
+        child_arch = self._copy_mutate_arch(parent_arch)
+        return self._problem.gen_config(child_arch, hp_values)
+
     def _copy_mutate_arch(self, parent_arch: list) -> list:
         """
         # ! Time performance is critical because called sequentialy
@@ -3,9 +3,18 @@ from deephyper.search._search import Search
 
 class NeuralArchitectureSearch(Search):
     def __init__(
-        self, problem, evaluator, random_state=None, log_dir=".", verbose=0, **kwargs
+        self,
+        problem,
+        evaluator,
+        random_state=None,
+        log_dir=".",
+        verbose=0,
+        stopper=None,
+        **kwargs,
     ):
-        super().__init__(problem, evaluator, random_state, log_dir, verbose)
+        super().__init__(
+            problem, evaluator, random_state, log_dir, verbose, stopper=stopper
+        )
 
         self._problem._space["log_dir"] = self._log_dir
         self._problem._space["verbose"] = self._verbose
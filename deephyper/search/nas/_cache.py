@@ -0,0 +1,93 @@
+import json
+import os
+
+import numpy as np
+from deephyper.evaluator._encoder import Encoder
+from deephyper.nas.run._util import hash_arch_seq
+
+
+class ArchitectureCache:
+    """Cache of the objectives of the evaluated architectures of a neural architecture search, keyed by the canonical hash of their ``arch_seq`` and optionally by their hyperparameters.
+
+    The cache also keeps the keys of the submitted evaluations which are not completed so that they are not submitted twice. If a ``path`` is given, the completed evaluations are appended to this JSON lines file and loaded back when the cache is created so that the cache survives restarts of the search.
+
+    Args:
+        path (str, optional): path of the JSON lines file where the evaluations are persisted. Defaults to ``None`` for an in-memory cache.
+        include_hyperparameters (bool, optional): whether the hyperparameters are part of the key of an evaluation. Defaults to ``False``.
+    """
+
+    def __init__(self, path: str = None, include_hyperparameters: bool = False):
+        self.path = path
+        self.include_hyperparameters = include_hyperparameters
+        self._objectives = {}
+        self._pending = set()
+
+        if path is not None and os.path.exists(path):
+            with open(path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._objectives[record["key"]] = record["objective"]
+
+    def __len__(self):
+        return len(self._objectives)
+
+    def num_keys(self) -> int:
+        """Number of the evaluations submitted, completed or not."""
+        return len(self._objectives) + len(self._pending)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._objectives or key in self._pending
+
+    def key(self, arch_seq: list, hp_values: list = None) -> str:
+        """Canonical key of an evaluation.
+
+        Args:
+            arch_seq (list): the embedding of the architecture.
+            hp_values (list, optional): the values of the hyperparameters, ignored if ``include_hyperparameters`` is ``False``. Defaults to ``None``.
+
+        Returns:
+            str: the key.
+        """
+        # integral values are the same decision whatever their type
+        arch_seq = [
+            int(x) if float(x).is_integer() else float(x)
+            for x in np.asarray(arch_seq).ravel()
+        ]
+        key = hash_arch_seq(arch_seq)
+        if self.include_hyperparameters and hp_values is not None:
+            key += "|" + json.dumps(list(hp_values), cls=Encoder)
+        return key
+
+    def get(self, key: str, default=None):
+        """Objective of a completed evaluation.
+
+        Args:
+            key (str): the key of the evaluation.
+            default (optional): returned if the evaluation is not completed. Defaults to ``None``.
+
+        Returns:
+            the objective of the evaluation.
+        """
+        return self._objectives.get(key, default)
+
+    def add_pending(self, key: str):
+        """Mark an evaluation as submitted."""
+        if key not in self._objectives:
+            self._pending.add(key)
+
+    def add(self, key: str, objective):
+        """Add a completed evaluation.
+
+        Args:
+            key (str): the key of the evaluation.
+            objective: the objective of the evaluation.
+        """
+        self._pending.discard(key)
+        if key in self._objectives:
+            return
+        self._objectives[key] = objective
+        if self.path is not None:
+            with open(self.path, "a") as f:
+                f.write(json.dumps({"key": key, "objective": objective}, cls=Encoder))
+                f.write("\n")
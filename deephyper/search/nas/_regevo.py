@@ -1,6 +1,11 @@
 import collections
+import numbers
+import os
+from functools import partial
 
+from deephyper.nas.run._util import get_weights_path
 from deephyper.search.nas._base import NeuralArchitectureSearch
+from deephyper.search.nas._cache import ArchitectureCache
 
 
 class RegularizedEvolution(NeuralArchitectureSearch):
@@ -14,8 +19,14 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         verbose (int, optional): Indicate the verbosity level of the search. Defaults to 0.
         population_size (int, optional): the number of individuals to keep in the population. Defaults to 100.
         sample_size (int, optional): the number of individuals that should participate in each tournament. Defaults to 10.
+        duplicates (str, optional): how architectures already submitted are handled. ``"evaluate"`` evaluates them again, ``"resample"`` resamples them (random sample or new mutation of the same parent) and ``"reuse"`` also adds the cached objectives of the completed ones to the population before resampling. With ``"resample"`` and ``"reuse"`` the evaluations are cached by canonical architecture hash in ``arch_cache.jsonl`` of ``log_dir`` which is loaded back when a search is restarted in the same ``log_dir``. Defaults to ``"evaluate"``.
+        inherit_weights (bool, optional): whether the children are warm-started from the weights of their parent. The weights of each evaluated model are saved in ``log_dir/save/weights`` and the layers of a child whose node and operation are unchanged (with weights of the same shapes) are loaded from its parent before training. Requires a run function which supports it such as ``run_base_trainer``. Defaults to ``False``.
+        stopper (Stopper, optional): stopper deciding if the trainings are stopped early from the objectives reported after each epoch (e.g., ``SuccessiveHalvingStopper(max_budget=num_epochs)``), supported by ``run_base_trainer``. Defaults to ``None``.
     """
 
+    #: maximum number of resamplings of a duplicate before it is submitted anyway.
+    MAX_RESAMPLE = 100
+
     def __init__(
         self,
         problem,
@@ -25,10 +36,28 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         verbose: int = 0,
         population_size: int = 100,
         sample_size: int = 10,
-        **kwargs
+        duplicates: str = "evaluate",
+        inherit_weights: bool = False,
+        stopper=None,
+        **kwargs,
     ):
 
-        super().__init__(problem, evaluator, random_state, log_dir, verbose)
+        super().__init__(
+            problem, evaluator, random_state, log_dir, verbose, stopper=stopper
+        )
+
+        duplicates_allowed = ["evaluate", "resample", "reuse"]
+        if not (duplicates in duplicates_allowed):
+            raise ValueError(
+                f"Parameter 'duplicates={duplicates}' should have a value in {duplicates_allowed}!"
+            )
+        self._duplicates = duplicates
+        self._cache = None
+        if duplicates != "evaluate":
+            self._cache = ArchitectureCache(
+                os.path.join(self._log_dir, "arch_cache.jsonl"),
+                include_hyperparameters=len(self._problem._hp_space._space) > 0,
+            )
 
         if (
             type(self) is RegularizedEvolution
@@ -38,6 +67,10 @@ class RegularizedEvolution(NeuralArchitectureSearch):
                 "An hyperparameter space was defined for this problem use 'AgEBO' instead!"
             )
 
+        self._inherit_weights = inherit_weights
+        if inherit_weights:
+            self._problem._space["save_weights"] = True
+
         # Setup
         self.pb_dict = self._problem.space
         self.space_list = self._problem.build_search_space().choices()
@@ -45,6 +78,14 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         self._sample_size = int(sample_size)
         self._population = collections.deque(maxlen=self._population_size)
 
+        # number of architectures of the search space
+        self._num_archs = 1
+        for _, b in self.space_list:
+            self._num_archs *= b + 1
+
+        # keys of the cached individuals already added to the population
+        self._reused_keys = set()
+
     def _saved_keys(self, job):
         res = {"arch_seq": str(job.config["arch_seq"])}
         return res
@@ -71,6 +112,7 @@ class RegularizedEvolution(NeuralArchitectureSearch):
 
             if num_received > 0:
                 self._population.extend(new_results)
+                self._cache_results(new_results)
                 self._evaluator.dump_evals(
                     saved_keys=self._saved_keys, log_dir=self._log_dir
                 )
@@ -94,7 +136,11 @@ class RegularizedEvolution(NeuralArchitectureSearch):
                         # select_parent
                         parent = self._select_parent(sample)
                         # copy_mutate_parent
-                        child = self._copy_mutate_arch(parent)
+                        child = self._deduplicate(
+                            self._copy_mutate_arch(parent),
+                            partial(self._copy_mutate_arch, parent),
+                        )
+                        child = self._set_parent_weights(child, sample)
                         # add child to batch
                         children_batch.append(child)
 
@@ -108,14 +154,76 @@ class RegularizedEvolution(NeuralArchitectureSearch):
         cfg, _ = max(sample, key=lambda x: x[1])
         return cfg["arch_seq"]
 
+    def _set_parent_weights(self, config: dict, sample: list) -> dict:
+        """Set the path of the weights of the parent of a child configuration (the individual of ``sample`` selected by ``_select_parent``) to warm-start the child if ``inherit_weights`` is ``True``."""
+        if self._inherit_weights:
+            parent = max(sample, key=lambda x: x[1])
+            # individuals reused from the cache have no saved weights
+            if hasattr(parent, "id"):
+                config["parent_weights"] = get_weights_path(self._log_dir, parent.id)
+        return config
+
     def _gen_random_batch(self, size: int) -> list:
         batch = []
         for _ in range(size):
-            cfg = self.pb_dict.copy()
-            cfg["arch_seq"] = self._random_search_space()
-            batch.append(cfg)
+            cfg = self._gen_random_config()
+            batch.append(self._deduplicate(cfg, self._gen_random_config))
         return batch
 
+    def _gen_random_config(self) -> dict:
+        cfg = self.pb_dict.copy()
+        cfg["arch_seq"] = self._random_search_space()
+        return cfg
+
+    def _cache_key(self, config: dict) -> str:
+        return self._cache.key(
+            config["arch_seq"], self._problem.extract_hp_values(config)
+        )
+
+    def _cache_results(self, results: list):
+        if self._cache is not None:
+            for config, objective in results:
+                self._cache.add(self._cache_key(config), objective)
+
+    def _deduplicate(self, config: dict, resample: callable) -> dict:
+        """Resample a configuration with ``resample()`` as long as it is in the cache (submitted or completed) and the search space is not exhausted, with ``duplicates="reuse"`` the cached objectives of the duplicates are added to the population (at most once per architecture so that they age as the other individuals). The returned configuration is marked as submitted.
+
+        Args:
+            config (dict): the configuration to submit.
+            resample (callable): function returning a new configuration.
+
+        Returns:
+            dict: the configuration to submit.
+        """
+        if self._cache is None:
+            return config
+
+        key = self._cache_key(config)
+        for _ in range(self.MAX_RESAMPLE):
+            if key not in self._cache:
+                break
+            objective = self._cache.get(key)
+            if (
+                self._duplicates == "reuse"
+                and isinstance(objective, numbers.Number)
+                and key not in self._reused_keys
+            ):
+                self._reused_keys.add(key)
+                self._population.append((config, objective))
+            if self._space_exhausted():
+                break
+            config = resample()
+            key = self._cache_key(config)
+        self._cache.add_pending(key)
+        return config
+
+    def _space_exhausted(self) -> bool:
+        """Whether all the architectures of the search space were submitted, unknown (``False``) when the hyperparameters are part of the keys of the cache."""
+        return (
+            not (self._cache.include_hyperparameters)
+            and self._cache.num_keys() >= self._num_archs
+        )
+
     def _random_search_space(self) -> list:
         return [self._random_state.choice(b + 1) for (_, b) in self.space_list]
 
@@ -83,8 +83,13 @@ def _gaussian_acquisition(
             # d(inv_t) = inv_t * grad(g)
             # d(inv_t) = inv_t * (-mu_grad + std * std_grad)
             if return_grad:
-                acq_grad *= inv_t
-                acq_grad += acq_vals * (-mu_grad + std * std_grad)
+                if np.ndim(acq_grad) == 2:
+                    inv_t, std = inv_t[:, None], std[:, None]
+                    acq_grad *= inv_t
+                    acq_grad += acq_vals[:, None] * (-mu_grad + std * std_grad)
+                else:
+                    acq_grad *= inv_t
+                    acq_grad += acq_vals * (-mu_grad + std * std_grad)
 
     else:
         raise ValueError("Acquisition function not implemented.")
@@ -122,8 +127,8 @@ def gaussian_lcb(X, model, kappa=1.96, return_grad=False):
         Useless if ``method`` is not set to "LCB".
 
     return_grad : boolean, optional
-        Whether or not to return the grad. Implemented only for the case where
-        ``X`` is a single sample.
+        Whether or not to return the grad. The grad is of shape
+        (n_features,) when ``X`` is a single sample.
 
     Returns
     -------
@@ -190,8 +195,8 @@ def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         values. Useful only when ``method`` is set to "EI"
 
     return_grad : boolean, optional
-        Whether or not to return the grad. Implemented only for the case where
-        ``X`` is a single sample.
+        Whether or not to return the grad. The grad is of shape
+        (n_features,) when ``X`` is a single sample.
 
     Returns
     -------
@@ -224,15 +229,19 @@ def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False):
     values[mask] = norm.cdf(scaled)
 
     if return_grad:
-        if not np.all(mask):
-            return values, np.zeros_like(std_grad)
+        # the gradients of a single sample are 1-D
+        single = np.ndim(std_grad) == 1
+        mu_grad, std_grad = np.atleast_2d(mu_grad), np.atleast_2d(std_grad)
+        grad = np.zeros_like(std_grad)
+        std, improve, scaled = std[mask, None], improve[:, None], scaled[:, None]
 
         # Substitute (y_opt - xi - mu) / sigma = t and apply chain rule.
         # improve_grad is the gradient of t wrt x.
-        improve_grad = -mu_grad * std - std_grad * improve
+        improve_grad = -mu_grad[mask] * std - std_grad[mask] * improve
         improve_grad /= std**2
 
-        return values, improve_grad * norm.pdf(scaled)
+        grad[mask] = improve_grad * norm.pdf(scaled)
+        return values, grad[0] if single else grad
 
     return values
 
@@ -273,8 +282,8 @@ def gaussian_ei(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         values. Useful only when ``method`` is set to "EI"
 
     return_grad : boolean, optional
-        Whether or not to return the grad. Implemented only for the case where
-        ``X`` is a single sample.
+        Whether or not to return the grad. The grad is of shape
+        (n_features,) when ``X`` is a single sample.
 
     Returns
     -------
@@ -312,19 +321,23 @@ def gaussian_ei(X, model, y_opt=0.0, xi=0.01, return_grad=False):
     values[mask] = exploit + explore
 
     if return_grad:
-        if not np.all(mask):
-            return values, np.zeros_like(std_grad)
+        # the gradients of a single sample are 1-D
+        single = np.ndim(std_grad) == 1
+        mu_grad, std_grad = np.atleast_2d(mu_grad), np.atleast_2d(std_grad)
+        grad = np.zeros_like(std_grad)
+        std, improve = std[mask, None], improve[:, None]
+        cdf, pdf = cdf[:, None], pdf[:, None]
 
         # Substitute (y_opt - xi - mu) / sigma = t and apply chain rule.
         # improve_grad is the gradient of t wrt x.
-        improve_grad = -mu_grad * std - std_grad * improve
+        improve_grad = -mu_grad[mask] * std - std_grad[mask] * improve
         improve_grad /= std**2
         cdf_grad = improve_grad * pdf
         pdf_grad = -improve * cdf_grad
-        exploit_grad = -mu_grad * cdf - pdf_grad
-        explore_grad = std_grad * pdf + pdf_grad
+        exploit_grad = -mu_grad[mask] * cdf - pdf_grad
+        explore_grad = std_grad[mask] * pdf + pdf_grad
 
-        grad = exploit_grad + explore_grad
-        return values, grad
+        grad[mask] = exploit_grad + explore_grad
+        return values, grad[0] if single else grad
 
     return values
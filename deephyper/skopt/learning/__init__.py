@@ -3,6 +3,7 @@
 from .forest import RandomForestRegressor
 from .forest import ExtraTreesRegressor
 from .gaussian_process import GaussianProcessRegressor
+from .gaussian_process import SparseGaussianProcessRegressor
 from .gbrt import GradientBoostingQuantileRegressor
 
 
@@ -11,6 +12,7 @@ __all__ = [
     "ExtraTreesRegressor",
     "GradientBoostingQuantileRegressor",
     "GaussianProcessRegressor",
+    "SparseGaussianProcessRegressor",
 ]
 
 try:
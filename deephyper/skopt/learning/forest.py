@@ -1,68 +1,192 @@
+import threading
+
 import numpy as np
+from joblib import Parallel
+from sklearn.base import clone
 from sklearn.ensemble import ExtraTreesRegressor as _sk_ExtraTreesRegressor
+from sklearn.ensemble._base import _partition_estimators
 from sklearn.ensemble._forest import ForestRegressor, DecisionTreeRegressor
+from sklearn.utils import check_random_state
+from sklearn.utils.fixes import delayed
+from sklearn.utils.validation import check_is_fitted
+
 
+def _leaf_tables(forest):
+    """Per-node tables of the fitted trees of a ``forest``.
 
-def _return_std(X, n_outputs, trees, predictions, min_variance):
+    For each tree the table of means ``E[Y | leaf]`` and the table of second
+    moments ``Var(Y | leaf) + E[Y | leaf]**2`` (with the variance rounded up
+    to ``min_variance``) are computed once and cached on the forest until its
+    trees are replaced or updated (see ``_fantasize``).
+
+    Returns
+    -------
+    tables : list of tuples, shape=(n_estimators,)
+        The ``(mean, second_moment)`` tables of each tree, arrays of shape
+        ``(node_count, n_outputs)``.
     """
-    Returns `std(Y | X)`.
+    # the trees are compared (not the list) as ``warm_start`` extends the list
+    # of trees in place
+    trees = tuple(forest.estimators_)
+    cache = getattr(forest, "_leaf_tables_", None)
+    if cache is not None and cache[0] == trees and cache[1] == forest.min_variance:
+        return cache[2]
+
+    tables = []
+    for tree in trees:
+        mean = tree.tree_.value[:, :, 0]
+
+        # This rounding off is done in accordance with the
+        # adjustment done in section 4.3.3
+        # of http://arxiv.org/pdf/1211.0906v2.pdf to account
+        # for cases such as leaves with 1 sample in which there
+        # is zero variance.
+        var = np.maximum(tree.tree_.impurity, forest.min_variance)
+        tables.append((mean, var[:, np.newaxis] + mean**2))
+
+    forest._leaf_tables_ = (trees, forest.min_variance, tables)
+    return tables
+
 
-    Can be calculated by E[Var(Y | Tree)] + Var(E[Y | Tree]) where
-    P(Tree) is `1 / len(trees)`.
+def _accumulate_leaf_stats(tree, tables, X, out, lock):
+    """Add the means and second moments of the leaves reached by ``X`` in
+    ``tree`` to ``out`` (a single traversal of the tree)."""
+    leaves = tree.tree_.apply(X)
+    mean = tables[0][leaves]
+    second_moment = tables[1][leaves]
+    with lock:
+        out[0] += mean
+        out[1] += second_moment
+
+
+def _predict_mean_std(forest, X, return_std):
+    """Returns ``E[Y | X]`` and ``std(Y | X)`` with one traversal per tree.
+
+    The standard deviation is calculated by E[Var(Y | Tree)] + Var(E[Y | Tree])
+    where P(Tree) is `1 / len(trees)`, see 4.3.2 of arXiv:1211.0906. The trees
+    are traversed in parallel threads (``n_jobs`` of the forest).
 
     Parameters
     ----------
+    forest : RandomForestRegressor or ExtraTreesRegressor
+        A fitted forest.
+
     X : array-like, shape=(n_samples, n_features)
         Input data.
 
-    n_outputs: int.
-        Number of outputs.
-
-    trees : list, shape=(n_estimators,)
-        List of fit sklearn trees as obtained from the ``estimators_``
-        attribute of a fit RandomForestRegressor or ExtraTreesRegressor.
-
-    predictions : array-like, shape=(n_samples,)
-        Prediction of each data point as returned by RandomForestRegressor
-        or ExtraTreesRegressor.
+    return_std : boolean
+        Whether or not to return the standard deviation.
 
     Returns
     -------
-    std : array-like, shape=(n_samples,)
-        Standard deviation of `y` at `X`. If criterion
-        is set to "mse", then `std[i] ~= std(y | X[i])`.
+    mean : array-like, shape=(n_samples,) or (n_samples, n_outputs)
+        Mean of `y` at `X`.
 
+    std : array-like, shape=(n_samples,) or (n_samples, n_outputs)
+        Standard deviation of `y` at `X`, only if ``return_std`` is ``True``.
     """
-    # This derives std(y | x) as described in 4.3.2 of arXiv:1211.0906
+    if return_std and forest.criterion != "squared_error":
+        raise ValueError(
+            "Expected impurity to be 'squared_error', got %s instead" % forest.criterion
+        )
 
-    flat = len(predictions.shape) == 1
-    if flat:
-        predictions = predictions.reshape(-1, 1)
+    check_is_fitted(forest)
+    X = forest._validate_X_predict(X)
+    tables = _leaf_tables(forest)
+
+    n_jobs, _, _ = _partition_estimators(forest.n_estimators, forest.n_jobs)
+    out = np.zeros((2, X.shape[0], forest.n_outputs_))
+    lock = threading.Lock()
+    Parallel(n_jobs=n_jobs, verbose=forest.verbose, require="sharedmem")(
+        delayed(_accumulate_leaf_stats)(tree, table, X, out, lock)
+        for tree, table in zip(forest.estimators_, tables)
+    )
+    out /= len(forest.estimators_)
+    mean, second_moment = out
+
+    std = None
+    if return_std:
+        std = second_moment - mean**2
+        std[std < 0.0] = 0.0
+        std = std**0.5
+
+    if forest.n_outputs_ == 1:
+        mean = mean.reshape(-1)
+        std = std.reshape(-1) if return_std else None
+
+    return mean, std
+
+
+def _predict_batches(forest, Xs, return_std):
+    """Predict several batches of inputs at once (one traversal of each tree
+    for all the batches)."""
+    Xs = [np.asarray(X) for X in Xs]
+    sizes = np.cumsum([len(X) for X in Xs])[:-1]
+    mean, std = _predict_mean_std(forest, np.concatenate(Xs), return_std)
+    means = np.split(mean, sizes)
+    if return_std:
+        return list(zip(means, np.split(std, sizes)))
+    return means
+
+
+def _partial_refit(forest, X, y, n_estimators):
+    """Refit ``n_estimators`` trees of a fitted ``forest`` on ``(X, y)``.
+
+    The trees are refreshed in a round-robin order so that the oldest trees are
+    replaced first. The new trees are fitted by a clone of ``forest`` and the
+    list of trees is replaced (not modified in place) so that a shallow copy
+    of the forest made before the call keeps its own trees.
+    """
+    n_total = len(forest.estimators_)
+    n_estimators = max(1, min(n_estimators, n_total))
 
-    std = np.zeros((n_outputs, len(X)))
+    if getattr(forest, "_refit_random_state_", None) is None:
+        forest._refit_random_state_ = check_random_state(forest.random_state)
+    offset = getattr(forest, "_refit_offset_", 0)
 
-    for tree in trees:
-        var_tree = tree.tree_.impurity[tree.apply(X)]
+    sub_forest = clone(forest).set_params(
+        n_estimators=n_estimators,
+        warm_start=False,
+        oob_score=False,
+        random_state=forest._refit_random_state_.randint(np.iinfo(np.int32).max),
+    )
+    sub_forest.fit(X, y)
 
-        # This rounding off is done in accordance with the
-        # adjustment done in section 4.3.3
-        # of http://arxiv.org/pdf/1211.0906v2.pdf to account
-        # for cases such as leaves with 1 sample in which there
-        # is zero variance.
-        var_tree[var_tree < min_variance] = min_variance
-        mean_tree = tree.predict(X).T
-        std += var_tree + mean_tree**2
+    estimators = list(forest.estimators_)
+    for i, tree in enumerate(sub_forest.estimators_):
+        estimators[(offset + i) % n_total] = tree
+    forest.estimators_ = estimators
+    forest._refit_offset_ = (offset + n_estimators) % n_total
 
-    std = std.T
-    std /= len(trees)
-    std -= predictions**2.0
-    std[std < 0.0] = 0.0
-    std = std**0.5
+    return forest
 
-    if flat:
-        std = std.reshape(-1)
 
-    return std
+def _fantasize(forest, X, y):
+    """Update in place the leaves of a fitted ``forest`` as if ``(X, y)`` were
+    part of its training data.
+
+    The structure of the trees is kept, only the mean (``value``), variance
+    (``impurity``) and weight of the leaf reached by each point are updated
+    with Welford's formula.
+    """
+    y = np.asarray(y, dtype=np.float64).reshape(len(X), -1)
+    for tree in forest.estimators_:
+        tree_ = tree.tree_
+        value = tree_.value
+        impurity = tree_.impurity
+        weight = tree_.weighted_n_node_samples
+        for leaf, y_leaf in zip(tree.apply(X), y):
+            w = weight[leaf]
+            mean = value[leaf, :, 0]
+            new_mean = mean + (y_leaf - mean) / (w + 1)
+            impurity[leaf] = (
+                w * impurity[leaf] + np.mean((y_leaf - mean) * (y_leaf - new_mean))
+            ) / (w + 1)
+            value[leaf, :, 0] = new_mean
+            weight[leaf] = w + 1
+            tree_.n_node_samples[leaf] += 1
+    forest._leaf_tables_ = None
+    return forest
 
 
 class RandomForestRegressor(ForestRegressor):
@@ -268,6 +392,55 @@ class RandomForestRegressor(ForestRegressor):
         self.min_variance = min_variance
         self.splitter = splitter
 
+    def partial_refit(self, X, y, n_estimators):
+        """Refit a subset of the trees of an already fitted forest.
+
+        The ``n_estimators`` oldest trees are replaced by trees fitted on
+        ``(X, y)``, the other trees are kept. Calling this method
+        ``ceil(self.n_estimators / n_estimators)`` times refreshes the whole
+        forest.
+
+        Parameters
+        ----------
+        X : array-like of shape=(n_samples, n_features)
+            Training data.
+
+        y : array-like of shape=(n_samples,)
+            Target values.
+
+        n_estimators : int
+            Number of trees to refit.
+
+        Returns
+        -------
+        self : object
+            The forest with refreshed trees.
+        """
+        return _partial_refit(self, X, y, n_estimators)
+
+    def fantasize(self, X, y):
+        """Condition the fitted forest on new observations without refitting.
+
+        The leaves reached by ``X`` are updated in place as if ``(X, y)`` were
+        part of the training data, the splits of the trees are kept. This is
+        used by the constant liar strategy of the ``Optimizer`` on a copy of
+        the surrogate model.
+
+        Parameters
+        ----------
+        X : array-like of shape=(n_samples, n_features)
+            Input data.
+
+        y : array-like of shape=(n_samples,)
+            Target values (e.g., lies).
+
+        Returns
+        -------
+        self : object
+            The updated forest.
+        """
+        return _fantasize(self, X, y)
+
     def predict(self, X, return_std=False, forestci=False):
         """Predict continuous output for X.
 
@@ -290,22 +463,31 @@ class RandomForestRegressor(ForestRegressor):
             is set to "mse", then `std[i] ~= std(y | X[i])`.
 
         """
-        mean = super(RandomForestRegressor, self).predict(X)
-
+        mean, std = _predict_mean_std(self, X, return_std)
         if return_std:
-            if self.criterion != "squared_error":
-                raise ValueError(
-                    "Expected impurity to be 'squared_error', got %s instead"
-                    % self.criterion
-                )
-
-            std = _return_std(
-                X, self.n_outputs_, self.estimators_, mean, self.min_variance
-            )
-
             return mean, std
         return mean
 
+    def predict_batches(self, Xs, return_std=False):
+        """Predict continuous outputs for several batches of inputs with a
+        single traversal of each tree.
+
+        Parameters
+        ----------
+        Xs : list of arrays of shape = (n_samples_i, n_features)
+            Batches of input data.
+
+        return_std : boolean
+            Whether or not to return the standard deviation.
+
+        Returns
+        -------
+        predictions : list
+            The predictions of each batch, or the ``(predictions, std)``
+            tuples of each batch if ``return_std`` is ``True``.
+        """
+        return _predict_batches(self, Xs, return_std)
+
 
 class ExtraTreesRegressor(_sk_ExtraTreesRegressor):
     """
@@ -488,6 +670,55 @@ class ExtraTreesRegressor(_sk_ExtraTreesRegressor):
             warm_start=warm_start,
         )
 
+    def partial_refit(self, X, y, n_estimators):
+        """Refit a subset of the trees of an already fitted forest.
+
+        The ``n_estimators`` oldest trees are replaced by trees fitted on
+        ``(X, y)``, the other trees are kept. Calling this method
+        ``ceil(self.n_estimators / n_estimators)`` times refreshes the whole
+        forest.
+
+        Parameters
+        ----------
+        X : array-like of shape=(n_samples, n_features)
+            Training data.
+
+        y : array-like of shape=(n_samples,)
+            Target values.
+
+        n_estimators : int
+            Number of trees to refit.
+
+        Returns
+        -------
+        self : object
+            The forest with refreshed trees.
+        """
+        return _partial_refit(self, X, y, n_estimators)
+
+    def fantasize(self, X, y):
+        """Condition the fitted forest on new observations without refitting.
+
+        The leaves reached by ``X`` are updated in place as if ``(X, y)`` were
+        part of the training data, the splits of the trees are kept. This is
+        used by the constant liar strategy of the ``Optimizer`` on a copy of
+        the surrogate model.
+
+        Parameters
+        ----------
+        X : array-like of shape=(n_samples, n_features)
+            Input data.
+
+        y : array-like of shape=(n_samples,)
+            Target values (e.g., lies).
+
+        Returns
+        -------
+        self : object
+            The updated forest.
+        """
+        return _fantasize(self, X, y)
+
     def predict(self, X, return_std=False):
         """
         Predict continuous output for X.
@@ -510,17 +741,27 @@ class ExtraTreesRegressor(_sk_ExtraTreesRegressor):
             Standard deviation of `y` at `X`. If criterion
             is set to "squared_error", then `std[i] ~= std(y | X[i])`.
         """
-        mean = super(ExtraTreesRegressor, self).predict(X)
-
+        mean, std = _predict_mean_std(self, X, return_std)
         if return_std:
-            if self.criterion != "squared_error":
-                raise ValueError(
-                    "Expected impurity to be 'squared_error', got %s instead"
-                    % self.criterion
-                )
-            std = _return_std(
-                X, self.n_outputs_, self.estimators_, mean, self.min_variance
-            )
             return mean, std
-
         return mean
+
+    def predict_batches(self, Xs, return_std=False):
+        """Predict continuous outputs for several batches of inputs with a
+        single traversal of each tree.
+
+        Parameters
+        ----------
+        Xs : list of arrays of shape = (n_samples_i, n_features)
+            Batches of input data.
+
+        return_std : boolean
+            Whether or not to return the standard deviation.
+
+        Returns
+        -------
+        predictions : list
+            The predictions of each batch, or the ``(predictions, std)``
+            tuples of each batch if ``return_std`` is ``True``.
+        """
+        return _predict_batches(self, Xs, return_std)
@@ -1,3 +1,4 @@
 from .gpr import GaussianProcessRegressor  # noqa: F401
+from .sgpr import SparseGaussianProcessRegressor  # noqa: F401
 
-__all__ = "GaussianProcessRegressor"
+__all__ = ["GaussianProcessRegressor", "SparseGaussianProcessRegressor"]
@@ -3,7 +3,7 @@ import warnings
 import numpy as np
 import sklearn
 from packaging import version
-from scipy.linalg import cho_solve, solve_triangular
+from scipy.linalg import cho_solve, cholesky, solve_triangular
 from sklearn.gaussian_process import (
     GaussianProcessRegressor as sk_GaussianProcessRegressor,
 )
@@ -126,6 +126,13 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
         If set to "gaussian", then it is assumed that `y` is a noisy
         estimate of `f(x)` where the noise is gaussian.
 
+    refit_period : int or None, optional (default: None)
+        Number of calls to `update` after which the kernel hyperparameters
+        are optimized again. In between, `update` adds the new observations
+        with the current hyperparameters by extending the Cholesky
+        decomposition ``L_`` in ``O(n^2)`` instead of re-fitting the model
+        in ``O(n^3)``. If None, `update` always re-fits the model.
+
     Attributes
     ----------
     X_train_ : array-like, shape = (n_samples, n_features)
@@ -144,9 +151,17 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
     alpha_ : array-like, shape = (n_samples,)
         Dual coefficients of training data points in kernel space
 
+    K_inv_ : array-like, shape = (n_samples, n_samples)
+        Inverse of the kernel in ``X_train_``, computed from ``L_`` when it
+        is first accessed (predictions only use ``L_``)
+
     log_marginal_likelihood_value_ : float
         The log-marginal-likelihood of ``self.kernel_.theta``
 
+    n_updates_ : int
+        Number of calls to `update` since the kernel hyperparameters were
+        optimized.
+
     noise_ : float
         Estimate of the gaussian noise. Useful only when noise is set to
         "gaussian".
@@ -162,8 +177,10 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
         copy_X_train=True,
         random_state=None,
         noise=None,
+        refit_period=None,
     ):
         self.noise = noise
+        self.refit_period = refit_period
         super(GaussianProcessRegressor, self).__init__(
             kernel=kernel,
             alpha=alpha,
@@ -193,6 +210,8 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
         if isinstance(self.noise, str) and self.noise != "gaussian":
             raise ValueError("expected noise to be 'gaussian', got %s" % self.noise)
 
+        # kernel given as parameter, the noise is added to self.kernel below
+        self._kernel = self.kernel
         if self.kernel is None:
             self.kernel = ConstantKernel(1.0, constant_value_bounds="fixed") * RBF(
                 1.0, length_scale_bounds="fixed"
@@ -232,9 +251,8 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                         **{white_param: WhiteKernel(noise_level=0.0)}
                     )
 
-        # Precompute arrays needed at prediction
-        L_inv = solve_triangular(self.L_.T, np.eye(self.L_.shape[0]))
-        self.K_inv_ = L_inv.dot(L_inv.T)
+        self._K_inv = None
+        self.n_updates_ = 0
 
         # Fix deprecation warning #462
         sklearn_version = version.parse(sklearn.__version__)
@@ -250,6 +268,149 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
 
         return self
 
+    @property
+    def K_inv_(self):
+        if self._K_inv is None:
+            L_inv = solve_triangular(self.L_.T, np.eye(self.L_.shape[0]))
+            self._K_inv = L_inv.dot(L_inv.T)
+        return self._K_inv
+
+    def _extend(self, X):
+        """Append ``X`` to the training data and extend the Cholesky
+        decomposition ``L_`` with the current kernel hyperparameters."""
+        if np.size(self.alpha) != 1:
+            raise ValueError(
+                "The model can only be extended with a scalar alpha, got an array "
+                "of %d values (one per training sample)" % np.size(self.alpha)
+            )
+        # the noise was removed from ``kernel_`` after fitting (see ``fit``)
+        noise = float(np.asarray(self.alpha).reshape(-1)[0])
+        if self.noise_:
+            noise += self.noise_
+
+        K_12 = self.kernel_(self.X_train_, X)
+        K_22 = self.kernel_(X) + noise * np.eye(len(X))
+
+        # block Cholesky decomposition: K_22 - L_21 L_21^T = L_22 L_22^T
+        L_21 = solve_triangular(self.L_, K_12, lower=True).T
+        L_22 = cholesky(K_22 - L_21.dot(L_21.T), lower=True)
+        n = self.L_.shape[0]
+        L = np.zeros((n + len(X), n + len(X)))
+        L[:n, :n] = self.L_
+        L[n:, :n] = L_21
+        L[n:, n:] = L_22
+
+        self.X_train_ = np.vstack([self.X_train_, X])
+        self.L_ = L
+        self._K_inv = None
+
+    def fantasize(self, X, y):
+        """Condition the fitted model on new observations without refitting.
+
+        The kernel hyperparameters are kept and the Cholesky decomposition of
+        the kernel matrix is extended by a low-rank update in ``O(n^2)``
+        instead of being recomputed in ``O(n^3)``. This is used by the constant
+        liar strategy of the ``Optimizer`` on a copy of the surrogate model.
+
+        Parameters
+        ----------
+        X : array-like, shape = (n_new_samples, n_features)
+            New training data.
+
+        y : array-like, shape = (n_new_samples,)
+            New target values (e.g., lies).
+
+        Returns
+        -------
+        self
+            Returns an instance of self.
+        """
+        X = check_array(X)
+        y = np.asarray(y, dtype=np.float64)
+        y = (y - self.y_train_mean_) / self.y_train_std_
+
+        self._extend(X)
+        self.y_train_ = np.concatenate(
+            [self.y_train_, y.reshape(len(X), *self.y_train_.shape[1:])]
+        )
+        self.alpha_ = cho_solve((self.L_, True), self.y_train_)
+
+        return self
+
+    def update(self, X, y):
+        """Update the fitted model with observations appended to its training
+        data.
+
+        The model is re-fitted when ``refit_period`` is None, every
+        ``refit_period`` calls, when ``alpha`` is not a scalar or when the
+        first rows of ``X`` are not the training data of the model. Otherwise
+        the new rows are added with the current kernel hyperparameters (see
+        `fantasize`) and the targets of the previous rows, which can change
+        (e.g., replaced failures), are updated in ``O(n^2)``.
+
+        Parameters
+        ----------
+        X : array-like, shape = (n_samples, n_features)
+            All the training data.
+
+        y : array-like, shape = (n_samples, [n_output_dims])
+            All the target values.
+
+        Returns
+        -------
+        self
+            Returns an instance of self.
+        """
+        X = check_array(X)
+        y = np.asarray(y, dtype=np.float64)
+        n = len(self.X_train_) if hasattr(self, "L_") else 0
+        if (
+            self.refit_period is None
+            or np.size(self.alpha) != 1
+            or n == 0
+            or self.n_updates_ + 1 >= self.refit_period
+            or len(X) < n
+            or not np.array_equal(X[:n], self.X_train_)
+        ):
+            # fit adds the noise to self.kernel, restore the initial kernel
+            if hasattr(self, "_kernel"):
+                self.kernel = self._kernel
+            return self.fit(X, y)
+
+        if len(X) > n:
+            self._extend(X[n:])
+        y = (y - self.y_train_mean_) / self.y_train_std_
+        self.y_train_ = y.reshape(len(X), *self.y_train_.shape[1:])
+        self.alpha_ = cho_solve((self.L_, True), self.y_train_)
+        self.n_updates_ += 1
+
+        return self
+
+    def _predict_grad(self, X, y_std=None, K_inv_trans=None):
+        """Gradients of the predicted mean and, if ``K_inv_trans`` (the columns
+        ``K^-1 k(X_train, x)``) is given, of the predicted std at each row of X.
+        The gradients of a single row are returned as 1-D arrays."""
+        grad = np.array([self.kernel_.gradient_x(x, self.X_train_) for x in X])
+        # undo normalisation
+        grad_mean = np.dot(grad.transpose(0, 2, 1), self.alpha_) * self.y_train_std_
+        if len(X) == 1:
+            grad_mean = grad_mean[0]
+        if K_inv_trans is None:
+            return grad_mean
+
+        grad_std = np.zeros(X.shape)
+        nonzero = ~np.isclose(y_std, 0)
+        if np.any(nonzero):
+            grad_std[nonzero] = (
+                -np.einsum("ji,ijk->ik", K_inv_trans[:, nonzero], grad[nonzero])
+                / y_std[nonzero, None]
+            )
+            # undo normalisation
+            grad_std *= self.y_train_std_**2
+        if len(X) == 1:
+            grad_std = grad_std[0]
+        return grad_mean, grad_std
+
     def predict(
         self,
         X,
@@ -281,11 +442,9 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
 
         return_mean_grad : bool, default: False
             Whether or not to return the gradient of the mean.
-            Only valid when X is a single point.
 
         return_std_grad : bool, default: False
             Whether or not to return the gradient of the std.
-            Only valid when X is a single point.
 
         Returns
         -------
@@ -301,10 +460,12 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
             Only returned when return_cov is True.
 
         y_mean_grad : shape = (n_samples, n_features)
-            The gradient of the predicted mean
+            The gradient of the predicted mean, of shape (n_features,)
+            when X is a single point.
 
         y_std_grad : shape = (n_samples, n_features)
-            The gradient of the predicted std.
+            The gradient of the predicted std, of shape (n_features,)
+            when X is a single point.
         """
         if return_std and return_cov:
             raise RuntimeError(
@@ -316,8 +477,6 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
             raise ValueError("Not returning std_gradient without returning " "the std.")
 
         X = check_array(X)
-        if X.shape[0] != 1 and (return_mean_grad or return_std_grad):
-            raise ValueError("Not implemented for n_samples > 1")
 
         if not hasattr(self, "X_train_"):  # Not fit; predict based on GP prior
             y_mean = np.zeros(X.shape[0])
@@ -344,11 +503,10 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                 return y_mean, y_cov
 
             elif return_std:
-                K_inv = self.K_inv_
-
                 # Compute variance of predictive distribution
+                v = solve_triangular(self.L_, K_trans.T, lower=True)
                 y_var = self.kernel_.diag(X)
-                y_var -= np.einsum("ki,kj,ij->k", K_trans, K_trans, K_inv)
+                y_var -= np.einsum("ij,ij->j", v, v)
 
                 # Check if any of the variances is negative because of
                 # numerical issues. If yes: set the variance to 0.
@@ -364,18 +522,14 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                 y_std = np.sqrt(y_var)
 
             if return_mean_grad:
-                grad = self.kernel_.gradient_x(X[0], self.X_train_)
-                grad_mean = np.dot(grad.T, self.alpha_)
-                # undo normalisation
-                grad_mean = grad_mean * self.y_train_std_
                 if return_std_grad:
-                    grad_std = np.zeros(X.shape[1])
-                    if not np.allclose(y_std, grad_std):
-                        grad_std = -np.dot(K_trans, np.dot(K_inv, grad))[0] / y_std
-                        # undo normalisation
-                        grad_std = grad_std * self.y_train_std_**2
+                    # K_inv k(X_train, x) = L^-T v
+                    K_inv_trans = solve_triangular(self.L_.T, v, lower=False)
+                    grad_mean, grad_std = self._predict_grad(X, y_std, K_inv_trans)
                     return y_mean, y_std, grad_mean, grad_std
 
+                grad_mean = self._predict_grad(X)
+
                 if return_std:
                     return y_mean, y_std, grad_mean
                 else:
@@ -0,0 +1,448 @@
+import warnings
+
+import numpy as np
+from scipy.linalg import cho_solve, cholesky, solve_triangular
+from sklearn.base import clone
+from sklearn.utils import check_array, check_random_state
+
+from .gpr import GaussianProcessRegressor
+
+
+def _select_inducing_points(X, y, n_inducing, random_state):
+    """Select the indices of ``n_inducing`` distinct rows of ``X`` by ``D^2``
+    sampling (k-means++ seeding) starting from the row with the lowest ``y``.
+    """
+    n = len(X)
+    if n <= n_inducing:
+        return np.arange(n)
+
+    idx = [int(np.argmin(y))]
+    d2 = np.sum((X - X[idx[0]]) ** 2, axis=1)
+    for _ in range(n_inducing - 1):
+        total = d2.sum()
+        if total <= 0:  # all the remaining rows are duplicates
+            break
+        i = random_state.choice(n, p=d2 / total)
+        idx.append(i)
+        d2 = np.minimum(d2, np.sum((X - X[i]) ** 2, axis=1))
+    return np.array(idx)
+
+
+def _cholesky_jitter(K, jitter):
+    """Lower Cholesky factor of ``K`` with the smallest diagonal jitter (in
+    ``jitter * 10**k``) for which the decomposition succeeds."""
+    scale = np.mean(np.diag(K))
+    for k in range(6):
+        try:
+            return cholesky(K + jitter * 10**k * scale * np.eye(len(K)), lower=True)
+        except np.linalg.LinAlgError:
+            continue
+    raise np.linalg.LinAlgError("The kernel matrix of the inducing points is singular.")
+
+
+class _SharedRows(object):
+    """Append-only buffer of rows shared by the shallow copies of a model.
+
+    A model only reads the first ``n`` rows it appended. Appending after
+    another copy appended to the buffer copies the ``n`` rows to a new buffer
+    first, so that copies never see the rows of each other.
+    """
+
+    def __init__(self, n_features):
+        self.data = np.empty((16, n_features))
+        self.size = 0
+
+    def append(self, n, X):
+        """Append ``X`` after the first ``n`` rows, returns the buffer holding
+        the ``n + len(X)`` rows (``self`` or a copy)."""
+        buffer = self
+        if self.size != n:
+            buffer = _SharedRows(self.data.shape[1])
+            buffer.data = self.data[: max(2 * n, 16)].copy()
+            buffer.size = n
+        if n + len(X) > len(buffer.data):
+            data = np.empty((max(2 * len(buffer.data), n + len(X)), X.shape[1]))
+            data[:n] = buffer.data[:n]
+            buffer.data = data
+        buffer.data[n : n + len(X)] = X
+        buffer.size = n + len(X)
+        return buffer
+
+
+class SparseGaussianProcessRegressor(GaussianProcessRegressor):
+    """
+    Gaussian process regressor with inducing points for large numbers of
+    observations.
+
+    The posterior is approximated from ``m = n_inducing`` inducing points
+    selected among the training data (Deterministic Training Conditional,
+    Quiñonero-Candela and Rasmussen 2005, with the predictive distribution of
+    Titsias 2009). The kernel hyperparameters are fitted by an exact
+    `GaussianProcessRegressor` on the inducing points only and all the
+    observations are then accumulated in ``m x m`` sufficient statistics:
+
+    * ``fit`` costs ``O(m^3 + n m^2)`` instead of ``O(n^3)``;
+    * ``update`` (and ``fantasize``) adds new observations in
+      ``O(k m^2)`` for ``k`` new points without refitting the kernel
+      hyperparameters, the model is re-fitted when the number of
+      observations grew by a factor ``refit_factor``;
+    * ``predict`` costs ``O(m^2)`` per point.
+
+    The prediction API is the one of `GaussianProcessRegressor`
+    (``return_std``, ``return_cov`` and the gradients with respect to ``X``)
+    with ``X_train_`` being the inducing points. When the number of
+    observations is lower than ``n_inducing`` the model is an exact Gaussian
+    process.
+
+    Parameters
+    ----------
+    kernel : kernel object
+        The kernel specifying the covariance function of the GP. If None is
+        passed, the kernel "1.0 * RBF(1.0)" is used as default.
+
+    alpha : float, optional (default: 1e-10)
+        Value added to the diagonal of the kernel matrix during fitting.
+
+    optimizer : string or callable, optional (default: "fmin_l_bfgs_b")
+        The optimizer of the kernel hyperparameters, see
+        `GaussianProcessRegressor`.
+
+    n_restarts_optimizer : int, optional (default: 0)
+        The number of restarts of the optimizer of the kernel hyperparameters.
+
+    normalize_y : boolean, optional (default: False)
+        Whether the target values y are normalized (with the mean and standard
+        deviation of all the observations).
+
+    copy_X_train : bool, optional (default: True)
+        Kept for compatibility with `GaussianProcessRegressor`, the training
+        data are always copied.
+
+    random_state : integer or numpy.RandomState, optional
+        The generator used to select the inducing points and to initialize the
+        optimizer of the kernel hyperparameters.
+
+    noise : string, "gaussian", optional
+        If set to "gaussian", then it is assumed that `y` is a noisy
+        estimate of `f(x)` where the noise is gaussian.
+
+    n_inducing : int, optional (default: 256)
+        The number of inducing points.
+
+    refit_factor : float, optional (default: 2.0)
+        ``update`` re-fits the model (inducing points and kernel
+        hyperparameters) when the number of observations is larger than
+        ``refit_factor`` times the number of observations of the last fit.
+
+    Attributes
+    ----------
+    X_train_ : array-like, shape = (n_inducing, n_features)
+        The inducing points.
+
+    alpha_ : array-like, shape = (n_inducing,)
+        Weights of the kernel between query points and inducing points in the
+        predictive mean.
+
+    kernel_ : kernel object
+        The kernel used for prediction (without the noise).
+
+    noise_ : float
+        Estimate of the gaussian noise. Useful only when noise is set to
+        "gaussian".
+
+    n_train_ : int
+        The number of observations.
+    """
+
+    def __init__(
+        self,
+        kernel=None,
+        alpha=1e-10,
+        optimizer="fmin_l_bfgs_b",
+        n_restarts_optimizer=0,
+        normalize_y=False,
+        copy_X_train=True,
+        random_state=None,
+        noise=None,
+        n_inducing=256,
+        refit_factor=2.0,
+    ):
+        super(SparseGaussianProcessRegressor, self).__init__(
+            kernel=kernel,
+            alpha=alpha,
+            optimizer=optimizer,
+            n_restarts_optimizer=n_restarts_optimizer,
+            normalize_y=normalize_y,
+            copy_X_train=copy_X_train,
+            random_state=random_state,
+            noise=noise,
+        )
+        self.n_inducing = n_inducing
+        self.refit_factor = refit_factor
+
+    def _validate_data_xy(self, X, y):
+        X = check_array(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim == 2 and y.shape[1] == 1:
+            y = y.ravel()
+        if y.ndim != 1:
+            raise ValueError(
+                "SparseGaussianProcessRegressor only supports a single output, "
+                "got y with shape %s" % (y.shape,)
+            )
+        if len(X) != len(y):
+            raise ValueError(
+                "Found X and y with inconsistent numbers of samples: %d and %d"
+                % (len(X), len(y))
+            )
+        return X, y
+
+    def fit(self, X, y):
+        """Fit the kernel hyperparameters on inducing points selected in ``X``
+        and condition the model on all the observations.
+
+        Parameters
+        ----------
+        X : array-like, shape = (n_samples, n_features)
+            Training data
+
+        y : array-like, shape = (n_samples,)
+            Target values
+
+        Returns
+        -------
+        self
+            Returns an instance of self.
+        """
+        X, y = self._validate_data_xy(X, y)
+        self._rng = check_random_state(self.random_state)
+
+        idx = _select_inducing_points(X, y, self.n_inducing, self._rng)
+        self.inducing_points_ = X[idx]
+
+        # kernel hyperparameters of an exact GP on the inducing points
+        gp = GaussianProcessRegressor(
+            kernel=clone(self.kernel) if self.kernel is not None else None,
+            alpha=self.alpha,
+            optimizer=self.optimizer,
+            n_restarts_optimizer=self.n_restarts_optimizer,
+            normalize_y=self.normalize_y,
+            random_state=self._rng,
+            noise=self.noise,
+        )
+        gp.fit(self.inducing_points_, y[idx])
+        self.kernel_ = gp.kernel_
+        self.noise_ = gp.noise_
+        self.log_marginal_likelihood_value_ = gp.log_marginal_likelihood_value_
+
+        # variance of the observations, bounded below so that the system of
+        # the inducing points stays well conditioned
+        K_mm = self.kernel_(self.inducing_points_)
+        noise = np.mean(self.alpha) + (self.noise_ or 0.0)
+        self._noise = max(noise, 1e-6 * np.mean(np.diag(K_mm)))
+        self._L_mm = _cholesky_jitter(K_mm, 1e-8)
+
+        m = len(self.inducing_points_)
+        self._C = np.zeros((m, m))
+        self._c_y = np.zeros(m)
+        self._c_1 = np.zeros(m)
+        self._sum_y = 0.0
+        self._sum_y2 = 0.0
+        self._X = _SharedRows(X.shape[1])
+        self._y = np.zeros(0)
+        self.n_fit_ = len(X)
+
+        self._add(X, y)
+        self._update_posterior()
+        return self
+
+    def _project(self, X):
+        """Returns ``L_mm^-1 K(Z, X)`` of shape ``(n_inducing, len(X))``."""
+        return solve_triangular(
+            self._L_mm, self.kernel_(self.inducing_points_, X), lower=True
+        )
+
+    def _add(self, X, y):
+        """Add observations to the sufficient statistics (without in place
+        modifications so that shallow copies of the model are not affected)."""
+        V = self._project(X)
+        self._C = self._C + V.dot(V.T)
+        self._c_y = self._c_y + V.dot(y)
+        self._c_1 = self._c_1 + V.sum(axis=1)
+        self._sum_y += y.sum()
+        self._sum_y2 += y.dot(y)
+        self._X = self._X.append(len(self._y), X)
+        self._y = np.concatenate([self._y, y])
+
+    def _update_posterior(self):
+        n = len(self._y)
+        self.n_train_ = n
+        if self.normalize_y:
+            mean = self._sum_y / n
+            std = np.sqrt(max(self._sum_y2 / n - mean**2, 0.0))
+            std = std if std > 0 else 1.0
+        else:
+            mean, std = 0.0, 1.0
+        self.y_train_mean_ = self._y_train_mean = mean
+        self.y_train_std_ = self._y_train_std = std
+
+        c = (self._c_y - mean * self._c_1) / std
+
+        # with V = L_mm^-1 K(Z, X) and B = I + V V^T / noise, the predictive
+        # mean is v^T B^-1 V y / noise and the predictive variance is
+        # k(x, x) - v^T v + v^T B^-1 v for v = L_mm^-1 K(Z, x), the variance is
+        # computed from triangular solves because forming K(Z, Z)^-1 loses
+        # most of the precision of the (small) difference
+        m = len(self._C)
+        self._L_B = cholesky(np.eye(m) + self._C / self._noise, lower=True)
+        self.X_train_ = self.inducing_points_
+        self.alpha_ = (
+            solve_triangular(self._L_mm.T, cho_solve((self._L_B, True), c), lower=False)
+            / self._noise
+        )
+
+    def update(self, X, y):
+        """Update the fitted model with observations appended to its training
+        data.
+
+        The first rows of ``X`` must be the training data of the model, their
+        targets can change (e.g., replaced failures). New rows are added to the
+        model in ``O(k m^2)`` without refitting the kernel hyperparameters, the
+        model is re-fitted from scratch when the training data do not match or
+        when the number of observations grew by a factor ``refit_factor``.
+
+        Parameters
+        ----------
+        X : array-like, shape = (n_samples, n_features)
+            All the training data.
+
+        y : array-like, shape = (n_samples,)
+            All the target values.
+
+        Returns
+        -------
+        self
+            Returns an instance of self.
+        """
+        X, y = self._validate_data_xy(X, y)
+        n = len(self._y) if hasattr(self, "_y") else 0
+        if (
+            n == 0
+            or len(X) < n
+            or len(X) > self.refit_factor * self.n_fit_
+            or (self.n_fit_ < self.n_inducing and len(X) > self.n_fit_)
+            or not np.array_equal(X[:n], self._X.data[:n])
+        ):
+            return self.fit(X, y)
+
+        # targets of previous observations which changed
+        changed = np.flatnonzero(y[:n] != self._y)
+        if len(changed) > 0:
+            delta = y[changed] - self._y[changed]
+            self._c_y = self._c_y + self._project(X[changed]).dot(delta)
+            self._sum_y += delta.sum()
+            self._sum_y2 += y[changed].dot(y[changed]) - self._y[changed].dot(
+                self._y[changed]
+            )
+            self._y = y[:n].copy()
+
+        if len(X) > n:
+            self._add(X[n:], y[n:])
+        self._update_posterior()
+        return self
+
+    def fantasize(self, X, y):
+        """Condition the fitted model on new observations without refitting.
+
+        Parameters
+        ----------
+        X : array-like, shape = (n_new_samples, n_features)
+            New training data.
+
+        y : array-like, shape = (n_new_samples,)
+            New target values (e.g., lies).
+
+        Returns
+        -------
+        self
+            Returns an instance of self.
+        """
+        X, y = self._validate_data_xy(X, y)
+        self._add(X, y)
+        self._update_posterior()
+        return self
+
+    def predict(
+        self,
+        X,
+        return_std=False,
+        return_cov=False,
+        return_mean_grad=False,
+        return_std_grad=False,
+    ):
+        """
+        Predict output for X.
+
+        See `GaussianProcessRegressor.predict`.
+        """
+        if not hasattr(self, "X_train_"):
+            return super(SparseGaussianProcessRegressor, self).predict(
+                X,
+                return_std=return_std,
+                return_cov=return_cov,
+                return_mean_grad=return_mean_grad,
+                return_std_grad=return_std_grad,
+            )
+
+        if return_std and return_cov:
+            raise RuntimeError(
+                "Not returning standard deviation of predictions when "
+                "returning full covariance."
+            )
+
+        if return_std_grad and not return_std:
+            raise ValueError("Not returning std_gradient without returning " "the std.")
+
+        X = check_array(X)
+        K_trans = self.kernel_(X, self.X_train_)
+        y_mean = K_trans.dot(self.alpha_)
+        y_mean = self.y_train_std_ * y_mean + self.y_train_mean_
+
+        v = solve_triangular(self._L_mm, K_trans.T, lower=True)
+        w = solve_triangular(self._L_B, v, lower=True)
+        if return_cov:
+            y_cov = self.kernel_(X) - v.T.dot(v) + w.T.dot(w)
+            return y_mean, y_cov * self.y_train_std_**2
+
+        if return_std:
+            y_var = (
+                self.kernel_.diag(X) - np.sum(v**2, axis=0) + np.sum(w**2, axis=0)
+            )
+            y_var_negative = y_var < 0
+            if np.any(y_var_negative):
+                warnings.warn(
+                    "Predicted variances smaller than 0. "
+                    "Setting those variances to 0."
+                )
+                y_var[y_var_negative] = 0.0
+            y_std = np.sqrt(y_var * self.y_train_std_**2)
+
+        if return_mean_grad:
+            if return_std_grad:
+                # K_inv k(Z, x) = L_mm^-T (v - L_B^-T w)
+                u = solve_triangular(
+                    self._L_mm.T,
+                    v - solve_triangular(self._L_B.T, w, lower=False),
+                    lower=False,
+                )
+                grad_mean, grad_std = self._predict_grad(X, y_std, u)
+                return y_mean, y_std, grad_mean, grad_std
+
+            grad_mean = self._predict_grad(X)
+            if return_std:
+                return y_mean, y_std, grad_mean
+            return y_mean, grad_mean
+
+        if return_std:
+            return y_mean, y_std
+        return y_mean
@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 import pytest
 
@@ -8,6 +10,8 @@ from numpy.testing import assert_array_almost_equal
 from numpy.testing import assert_array_equal
 
 from deephyper.skopt.learning import GaussianProcessRegressor
+from deephyper.skopt.learning import SparseGaussianProcessRegressor
+from deephyper.skopt.learning.gaussian_process.kernels import ConstantKernel
 from deephyper.skopt.learning.gaussian_process.kernels import RBF
 from deephyper.skopt.learning.gaussian_process.kernels import Matern
 from deephyper.skopt.learning.gaussian_process.kernels import WhiteKernel
@@ -122,3 +126,174 @@ def test_gpr_handles_similar_points():
     model = GaussianProcessRegressor()
     # this fails if singular matrix is not handled
     model.fit(X, y)
+
+
+@pytest.mark.hps
+def test_gpr_fantasize():
+    rng = np.random.RandomState(0)
+    X = rng.randn(20, 3)
+    y = np.sin(X.sum(axis=1))
+    X_new = rng.randn(3, 3)
+    y_new = rng.randn(3)
+    X_test = rng.randn(10, 3)
+
+    for normalize_y in [False, True]:
+        gpr = GaussianProcessRegressor(
+            kernel=Matern(), alpha=1e-3, normalize_y=normalize_y
+        ).fit(X, y)
+        gpr.fantasize(X_new, y_new)
+
+        # same predictions as a model with the same kernel fitted on all the data
+        gpr_all = GaussianProcessRegressor(
+            kernel=gpr.kernel_, alpha=1e-3, optimizer=None
+        )
+        y_all = np.concatenate([y, y_new])
+        gpr_all.fit(
+            np.vstack([X, X_new]), (y_all - gpr.y_train_mean_) / gpr.y_train_std_
+        )
+        mean, std = gpr.predict(X_test, return_std=True)
+        mean_all, std_all = gpr_all.predict(X_test, return_std=True)
+        assert_array_almost_equal(mean, mean_all * gpr.y_train_std_ + gpr.y_train_mean_)
+        assert_array_almost_equal(std, std_all * gpr.y_train_std_)
+
+    # the noise of new samples is unknown with a per-sample alpha
+    gpr = GaussianProcessRegressor(kernel=Matern(), alpha=np.full(len(X), 1e-3))
+    gpr.fit(X, y)
+    with pytest.raises(ValueError):
+        gpr.fantasize(X_new, y_new)
+
+
+@pytest.mark.hps
+def test_gpr_update():
+    rng = np.random.RandomState(0)
+    X = rng.randn(30, 3)
+    y = np.sin(X.sum(axis=1))
+    X_test = rng.randn(10, 3)
+
+    gpr = GaussianProcessRegressor(
+        kernel=Matern(), noise="gaussian", normalize_y=True, refit_period=3
+    ).fit(X[:20], y[:20])
+
+    # new observations and a changed target are added with the same kernel
+    y_new = y.copy()
+    y_new[0] = 2.0
+    gpr_new = copy.copy(gpr).update(X[:25], y_new[:25])
+    assert gpr_new.n_updates_ == 1 and gpr.n_updates_ == 0
+    assert gpr_new.kernel_ is gpr.kernel_
+    assert len(gpr.X_train_) == 20
+
+    K = gpr.kernel_(X[:25]) + (gpr.noise_ + gpr.alpha) * np.eye(25)
+    K_trans = gpr.kernel_(X_test, X[:25])
+    y_norm = (y_new[:25] - gpr.y_train_mean_) / gpr.y_train_std_
+    mean = K_trans.dot(np.linalg.solve(K, y_norm))
+    var = gpr.kernel_.diag(X_test) - np.sum(
+        K_trans * np.linalg.solve(K, K_trans.T).T, axis=1
+    )
+    mean_new, std_new = gpr_new.predict(X_test, return_std=True)
+    assert_array_almost_equal(mean_new, mean * gpr.y_train_std_ + gpr.y_train_mean_)
+    assert_array_almost_equal(std_new, np.sqrt(var) * gpr.y_train_std_)
+
+    # the kernel hyperparameters are optimized again every refit_period calls
+    gpr_new.update(X[:28], y[:28])
+    assert gpr_new.n_updates_ == 2
+    gpr_new.update(X, y)
+    assert gpr_new.n_updates_ == 0 and gpr_new.kernel_ is not gpr.kernel_
+    assert gpr_new.kernel == gpr.kernel
+
+
+@pytest.mark.hps
+def test_gpr_fantasize_ill_conditioned():
+    # many lies with a smooth kernel and a small noise must not accumulate
+    # rounding errors in K_inv_
+    rng = np.random.RandomState(0)
+    X = rng.uniform(0, 1, size=(64, 5))
+    y = -np.sum((X - 0.3) ** 2, axis=1)
+    kernel = ConstantKernel(1000.0, "fixed") * Matern(
+        length_scale=[10.0] * 5, length_scale_bounds="fixed", nu=2.5
+    )
+    gpr = GaussianProcessRegressor(
+        kernel=kernel, alpha=1e-10, noise="gaussian", normalize_y=True
+    ).fit(X, y)
+
+    # greedy constant liar on a pool of candidates
+    X_c = rng.uniform(0, 1, size=(1000, 5))
+    for _ in range(64):
+        mean, std = gpr.predict(X_c, return_std=True)
+        i = np.argmin(mean - 1.96 * std)
+        gpr.fantasize(X_c[i : i + 1], [np.max(y)])
+        X_c = np.delete(X_c, i, axis=0)
+
+    assert np.all(np.linalg.eigvalsh(gpr.K_inv_) > 0)
+    mean, std = gpr.predict(X_c, return_std=True)
+    assert np.all(np.isfinite(mean)) and np.all(np.isfinite(std))
+
+
+@pytest.mark.hps
+def test_sparse_gpr_without_inducing_approximation():
+    # with less observations than inducing points the model is an exact GP
+    rng = np.random.RandomState(0)
+    X = rng.uniform(0, 1, size=(30, 3))
+    y = np.sin(3 * X).sum(axis=1)
+    X_test = rng.uniform(0, 1, size=(10, 3))
+    kernel = ConstantKernel(1.0, "fixed") * Matern(
+        length_scale=0.5, length_scale_bounds="fixed", nu=2.5
+    )
+
+    gpr = GaussianProcessRegressor(kernel=kernel, alpha=1e-3, normalize_y=True)
+    sgpr = SparseGaussianProcessRegressor(kernel=kernel, alpha=1e-3, normalize_y=True)
+    mean, std = gpr.fit(X, y).predict(X_test, return_std=True)
+    mean_s, std_s = sgpr.fit(X, y).predict(X_test, return_std=True)
+    assert_array_almost_equal(mean, mean_s)
+    assert_array_almost_equal(std, std_s)
+
+    num_grad = optimize.approx_fprime(
+        X_test[0], lambda x: predict_wrapper(x, sgpr)[1], 1e-6
+    )
+    _, _, _, grad = sgpr.predict(
+        X_test[:1], return_std=True, return_mean_grad=True, return_std_grad=True
+    )
+    assert_array_almost_equal(grad, num_grad, decimal=3)
+
+
+@pytest.mark.hps
+def test_sparse_gpr_update():
+    rng = np.random.RandomState(0)
+    X = rng.uniform(0, 1, size=(300, 3))
+    y = np.sin(3 * X).sum(axis=1)
+    X_test = rng.uniform(0, 1, size=(10, 3))
+
+    sgpr = SparseGaussianProcessRegressor(
+        kernel=Matern(), noise="gaussian", normalize_y=True, n_inducing=32
+    ).fit(X[:200], y[:200])
+    inducing_points = sgpr.inducing_points_
+    mean, std = sgpr.predict(X_test, return_std=True)
+
+    # new observations and a changed target are added without refitting
+    y_new = y.copy()
+    y_new[0] = 10.0
+    sgpr_new = copy.copy(sgpr).update(X, y_new)
+    assert sgpr_new.inducing_points_ is inducing_points
+    assert sgpr_new.n_train_ == 300
+
+    # same predictions as the model conditioned on all the data at once
+    sgpr_all = copy.copy(sgpr)
+    sgpr_all._C = 0 * sgpr._C
+    sgpr_all._c_y = 0 * sgpr._c_y
+    sgpr_all._c_1 = 0 * sgpr._c_1
+    sgpr_all._sum_y = sgpr_all._sum_y2 = 0.0
+    sgpr_all._y = sgpr_all._y[:0]
+    sgpr_all.fantasize(X, y_new)
+    assert_array_almost_equal(
+        sgpr_new.predict(X_test, return_std=True),
+        sgpr_all.predict(X_test, return_std=True),
+    )
+
+    # the shallow copies did not modify the initial model
+    assert sgpr.n_train_ == 200
+    assert_array_almost_equal((mean, std), sgpr.predict(X_test, return_std=True))
+
+    # the model is re-fitted when the number of observations doubled
+    X_more = np.vstack([X, rng.uniform(0, 1, size=(200, 3))])
+    y_more = np.sin(3 * X_more).sum(axis=1)
+    sgpr_more = copy.copy(sgpr).update(X_more, y_more)
+    assert sgpr_more.n_fit_ == 500
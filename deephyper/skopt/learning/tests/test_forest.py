@@ -114,3 +114,132 @@ def test_extra_forest():
     # also test apply
     leaf_indices = clf.apply(X)
     assert leaf_indices.shape == (len(X), clf.n_estimators)
+
+
+@pytest.mark.hps
+def test_forest_partial_refit():
+    for Forest in [RandomForestRegressor, ExtraTreesRegressor]:
+        check_forest_partial_refit(Forest)
+
+
+def check_forest_partial_refit(Forest):
+    import copy
+
+    rng = np.random.RandomState(0)
+    X = rng.uniform(-2, 2, size=(50, 1))
+    y = truth(X)
+
+    forest = Forest(n_estimators=10, random_state=1)
+    forest.fit(X[:40], y[:40])
+    trees = list(forest.estimators_)
+
+    previous = copy.copy(forest)
+    forest.partial_refit(X, y, n_estimators=4)
+
+    # the 4 oldest trees are replaced, the previous copy is not modified
+    assert len(forest.estimators_) == 10
+    assert all(a is not b for a, b in zip(forest.estimators_[:4], trees[:4]))
+    assert all(a is b for a, b in zip(forest.estimators_[4:], trees[4:]))
+    assert all(a is b for a, b in zip(previous.estimators_, trees))
+
+    # the next refit continues with the following trees
+    forest.partial_refit(X, y, n_estimators=4)
+    assert all(a is not b for a, b in zip(forest.estimators_[4:8], trees[4:8]))
+    assert all(a is b for a, b in zip(forest.estimators_[8:], trees[8:]))
+
+    mean, std = forest.predict(X, return_std=True)
+    assert mean.shape == std.shape == (50,)
+
+
+@pytest.mark.hps
+def test_forest_fantasize():
+    for Forest in [RandomForestRegressor, ExtraTreesRegressor]:
+        check_forest_fantasize(Forest)
+
+
+def check_forest_fantasize(Forest):
+    rng = np.random.RandomState(0)
+    X = rng.uniform(-2, 2, size=(50, 1))
+    y = truth(X)
+
+    forest = Forest(n_estimators=5, min_samples_leaf=5, bootstrap=False, random_state=1)
+    forest.fit(X, y)
+
+    x_lie, y_lie = np.array([[0.5]]), 2.0
+    leaves = forest.apply(X)
+    leaves_lie = forest.apply(x_lie)[0]
+    forest.fantasize(x_lie, [y_lie])
+
+    # each leaf reached by the lie has the statistics of its samples and the lie
+    for tree, leaf, leaves_tree in zip(forest.estimators_, leaves_lie, leaves.T):
+        y_leaf = np.append(y[leaves_tree == leaf], y_lie)
+        assert tree.tree_.n_node_samples[leaf] == len(y_leaf)
+        assert np.isclose(tree.tree_.value[leaf, 0, 0], np.mean(y_leaf))
+        assert np.isclose(tree.tree_.impurity[leaf], np.var(y_leaf))
+
+
+@pytest.mark.hps
+def test_forest_std_from_leaf_tables():
+    for Forest in [RandomForestRegressor, ExtraTreesRegressor]:
+        check_forest_std_from_leaf_tables(Forest)
+
+
+def check_forest_std_from_leaf_tables(Forest):
+    rng = np.random.RandomState(0)
+    X = rng.uniform(-2, 2, size=(50, 2))
+    y = truth(X)
+    T = rng.uniform(-2, 2, size=(30, 2))
+
+    forest = Forest(n_estimators=10, min_samples_leaf=3, min_variance=0.01)
+    forest.fit(X, y)
+
+    def reference_std(forest):
+        # E[Var(Y | Tree)] + Var(E[Y | Tree]) computed tree by tree
+        var = np.mean(
+            [
+                np.maximum(tree.tree_.impurity[tree.apply(T)], 0.01)
+                for tree in forest.estimators_
+            ],
+            axis=0,
+        )
+        means = np.array([tree.predict(T) for tree in forest.estimators_])
+        var_means = np.mean(means**2, axis=0) - np.mean(means, axis=0) ** 2
+        return np.sqrt(np.maximum(var + var_means, 0.0))
+
+    mean, std = forest.predict(T, return_std=True)
+    assert np.allclose(mean, np.mean([t.predict(T) for t in forest.estimators_], 0))
+    assert np.allclose(std, reference_std(forest))
+
+    # the cached tables are updated when the forest is conditioned on lies
+    forest.fantasize(T[:2], [3.0, 3.0])
+    mean_lie, std_lie = forest.predict(T, return_std=True)
+    assert not np.allclose(mean_lie, mean)
+    assert np.allclose(std_lie, reference_std(forest))
+
+    # the cached tables are updated when trees are added with ``warm_start``
+    forest.set_params(n_estimators=20, warm_start=True).fit(X, 10 * y)
+    mean = forest.predict(T)
+    assert np.allclose(mean, np.mean([t.predict(T) for t in forest.estimators_], 0))
+
+
+@pytest.mark.hps
+def test_forest_predict_batches():
+    rng = np.random.RandomState(0)
+    X = rng.uniform(-2, 2, size=(50, 2))
+    y = truth(X)
+    Ts = [rng.uniform(-2, 2, size=(n, 2)) for n in [1, 7, 30]]
+
+    for Forest in [RandomForestRegressor, ExtraTreesRegressor]:
+        forest = Forest(n_estimators=10, min_samples_leaf=3, random_state=0)
+        forest.fit(X, y)
+
+        means = forest.predict_batches(Ts)
+        assert len(means) == len(Ts)
+        for T, mean in zip(Ts, means):
+            assert np.allclose(mean, forest.predict(T))
+
+        predictions = forest.predict_batches(Ts, return_std=True)
+        for T, (mean, std) in zip(Ts, predictions):
+            mean_ref, std_ref = forest.predict(T, return_std=True)
+            assert np.allclose(mean, mean_ref)
+            assert np.allclose(std, std_ref)
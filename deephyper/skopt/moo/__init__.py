@@ -1,4 +1,5 @@
-from ._hv import hypervolume
+from ._archive import ParetoArchive
+from ._hv import hypervolume, hypervolume_monte_carlo
 from ._multiobjective import (
     MoAugmentedChebyshevFunction,
     MoChebyshevFunction,
@@ -15,6 +16,7 @@ from ._pf import (
 
 __all__ = [
     "hypervolume",
+    "hypervolume_monte_carlo",
     "MoLinearFunction",
     "MoAugmentedChebyshevFunction",
     "MoChebyshevFunction",
@@ -24,4 +26,5 @@ __all__ = [
     "non_dominated_set",
     "non_dominated_set_ranked",
     "pareto_front",
+    "ParetoArchive",
 ]
@@ -0,0 +1,248 @@
+from bisect import bisect_left
+
+import numpy as np
+
+from ._hv import _Staircase, hypervolume
+
+
+class _Front2D(_Staircase):
+    """Front of 2 objectives stored as a staircase."""
+
+    def __init__(self):
+        super().__init__()
+        self.ids = []
+
+    def insert(self, i, y):
+        """Insert the point ``i`` (not weakly dominated by the front) and
+        remove the points it weakly dominates, returns their ids."""
+        # same as _Staircase.insert, inlined because the points moved between
+        # the fronts are inserted many times
+        f1, y1 = self.f1, y[1]
+        start = bisect_left(self.f0, y[0])
+        stop, n = start, len(f1)
+        while stop < n and f1[stop] >= y1:
+            stop += 1
+        self.f0[start:stop] = [y[0]]
+        f1[start:stop] = [y1]
+        removed = self.ids[start:stop]
+        self.ids[start:stop] = [i]
+        return removed
+
+
+class _FrontND:
+    """Front of any number of objectives stored as an array."""
+
+    def __init__(self, n_objectives):
+        self.points = np.zeros((0, n_objectives))
+        self.ids = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def dominates(self, y):
+        return bool(np.any(np.all(self.points <= y, axis=1)))
+
+    def insert(self, i, y):
+        dominated = np.all(y <= self.points, axis=1)
+        removed = [j for j, d in zip(self.ids, dominated) if d]
+        self.points = np.vstack([self.points[~dominated], y])
+        self.ids = [j for j, d in zip(self.ids, dominated) if not d] + [i]
+        return removed
+
+    def contribution(self, y, ref):
+        ref = np.asarray(ref)
+        points = np.maximum(self.points, y)
+        points = points[np.all(points < ref, axis=1)]
+        volume = float(np.prod(ref - y))
+        if len(points) == 0:
+            return volume
+        return volume - hypervolume(points, ref)
+
+
+class ParetoArchive:
+    """Archive of points ranked by non-dominated sorting, maintained incrementally as the points are added. The archive assumes minimization.
+
+    Each point belongs to a front: the first front is the set of non-dominated points and the ``k``'th front is the set of non-dominated points once the previous fronts are removed. Among duplicate points only the first added is included in a front, the others belong to the next fronts (as with ``non_dominated_set``). A new point is placed by a binary search over the fronts and the points it dominates are moved to the next fronts. For 2 objectives the fronts are sorted so that a point is inserted in ``O(log n)`` plus the number of points it moves. The hypervolume of the first front is updated at each insertion from the contribution of the new point.
+
+    Args:
+        n_objectives (int): the number of objectives.
+        ref (array or list, optional): the reference point of the hypervolume, of size (n_objectives, ). Defaults to ``None`` for no hypervolume.
+
+    Example:
+        >>> archive = ParetoArchive(2, ref=[1.0, 1.0])
+        >>> archive.extend([[0.5, 0.2], [0.2, 0.5], [0.6, 0.6]])
+        [0, 1, 2]
+        >>> archive.ranks
+        array([0, 0, 1])
+        >>> archive.hypervolume()
+        0.55
+        >>> archive.pareto_front()
+        array([[0.5, 0.2],
+               [0.2, 0.5]])
+    """
+
+    def __init__(self, n_objectives: int, ref=None):
+        self.n_objectives = n_objectives
+        self.ref = None if ref is None else np.asarray(ref, dtype=float)
+        if self.ref is not None and self.ref.shape != (n_objectives,):
+            raise ValueError(
+                f"Expected ref to be of size ({n_objectives}, ), got {self.ref.shape}"
+            )
+        self._y = np.zeros((16, n_objectives))
+        self._rank = []
+        self._n_points = 0
+        # points as lists of floats for the 2 objectives fronts
+        self._rows = []
+        self._ref = None if ref is None else self.ref.tolist()
+        self._fronts = []
+        self._hypervolume = 0.0
+
+    def __len__(self):
+        return self._n_points
+
+    def _new_front(self):
+        if self.n_objectives == 2:
+            return _Front2D()
+        return _FrontND(self.n_objectives)
+
+    def add(self, y) -> int:
+        """Add a point to the archive.
+
+        Args:
+            y (array or list): Array or list of size (n_objectives, ).
+
+        Raises:
+            ValueError: Raised if y is not of size (n_objectives, ) or is not finite.
+
+        Returns:
+            int: the index of the point in the archive.
+        """
+        y = np.asarray_chkfinite(y, dtype=float)
+        if y.shape != (self.n_objectives,):
+            raise ValueError(
+                f"Expected y to be of size ({self.n_objectives}, ), got {y.shape}"
+            )
+        i = self._n_points
+        if i == len(self._y):
+            self._y = np.concatenate([self._y, np.zeros_like(self._y)])
+        self._y[i] = y
+        self._n_points += 1
+        row = y.tolist() if self.n_objectives == 2 else y
+        self._rows.append(row)
+
+        # the fronts which weakly dominate y are the first ones
+        low, high = 0, len(self._fronts)
+        while low < high:
+            mid = (low + high) // 2
+            if self._fronts[mid].dominates(row):
+                low = mid + 1
+            else:
+                high = mid
+
+        if low == 0 and self.ref is not None and np.all(y < self.ref):
+            if len(self._fronts) > 0:
+                self._hypervolume += self._fronts[0].contribution(row, self._ref)
+            else:
+                self._hypervolume = float(np.prod(self.ref - y))
+
+        # insert y and move the points it dominates to the next fronts
+        rows, rank = self._rows, self._rank
+        rank.append(low)
+        moved = [i]
+        k = low
+        while len(moved) > 0:
+            if k == len(self._fronts):
+                self._fronts.append(self._new_front())
+            insert = self._fronts[k].insert
+            next_moved = []
+            for j in moved:
+                rank[j] = k
+                next_moved.extend(insert(j, rows[j]))
+            moved = next_moved
+            k += 1
+
+        return i
+
+    def extend(self, Y) -> list:
+        """Add points to the archive.
+
+        Args:
+            Y (array or list): Array or list of size (n_points, n_objectives).
+
+        Returns:
+            list: the indices of the points in the archive.
+        """
+        return [self.add(y) for y in Y]
+
+    @property
+    def y(self):
+        """Array of size (n_points, n_objectives) of the points in the order in which they were added."""
+        return self._y[: self._n_points]
+
+    @property
+    def ranks(self):
+        """Array of size (n_points, ) of the indices of the fronts of the points (``0`` for the first front)."""
+        return np.array(self._rank, dtype=int)
+
+    def non_dominated_set(self, return_mask=True):
+        """Find the set of non-dominated points (see ``non_dominated_set``).
+
+        Args:
+            return_mask (bool, optional): Whether to return a mask or the actual indices of the non-dominated set. Defaults to True.
+
+        Returns:
+            array: If return_mask is True, this will be an (n_points, ) boolean array. Else it will be a 1-d integer array of indices indicating which points are non-dominated.
+        """
+        return self.non_dominated_set_ranked(0, return_mask=return_mask, n_fronts=1)
+
+    def non_dominated_set_ranked(self, fraction, return_mask=True, n_fronts=None):
+        """Find the set of top-``fraction x 100%`` of non-dominated points (see ``non_dominated_set_ranked``).
+
+        Args:
+            fraction (float or int): Fraction of points to return.
+            return_mask (bool, optional): Whether to return a mask or the actual indices of the non-dominated set. Defaults to True.
+            n_fronts (int, optional): If given, return the points of the first ``n_fronts`` fronts instead of a fraction of the points. Defaults to None.
+
+        Raises:
+            ValueError: Raised if ``fraction`` is not a non-negative number.
+
+        Returns:
+            array: If return_mask is True, this will be an (n_points, ) boolean array. Else it will be a 1-d integer array of indices indicating which points are in the top non-dominated set.
+        """
+        if not isinstance(fraction, (float, int)) or fraction < 0:
+            raise ValueError("Expected 'fraction' to be a non-negative scalar")
+
+        n_points = self._n_points
+        if n_fronts is None:
+            req_number = min(int(np.ceil(fraction * n_points)), n_points)
+        else:
+            req_number = int(np.sum(self.ranks < n_fronts))
+
+        # stable sort: points ordered by front then by index
+        chosen_indices = np.argsort(self.ranks, kind="stable")[:req_number]
+        if return_mask:
+            chosen = np.zeros(n_points, dtype=bool)
+            chosen[chosen_indices] = True
+            return chosen
+        return chosen_indices
+
+    def pareto_front(self):
+        """Extract the pareto front (actual objective values of the non-dominated set).
+
+        Returns:
+            array: Array of size (n_front_points, n_objectives) of the points of the first front.
+        """
+        return self.y[self.non_dominated_set(return_mask=False)]
+
+    def hypervolume(self) -> float:
+        """Hypervolume of the first front with respect to the reference point ``ref``.
+
+        Raises:
+            ValueError: Raised if the archive was created without reference point.
+
+        Returns:
+            float: the hypervolume.
+        """
+        if self.ref is None:
+            raise ValueError("The archive was created without reference point 'ref'.")
+        return self._hypervolume
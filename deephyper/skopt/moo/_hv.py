@@ -15,18 +15,177 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 __author__ = "Simon Wessing"
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+from scipy.stats import norm
+from sklearn.utils import check_random_state
+
 from ._pf import non_dominated_set
 
 
-def hypervolume(pointset, ref):
+def hypervolume(pointset, ref, n_samples=None, random_state=None):
     """Compute the absolute hypervolume of a *pointset* according to the
-    reference point *ref*.
+    reference point *ref* (minimization is assumed). The points which do
+    not dominate *ref* are ignored.
+
+    The hypervolume is computed exactly in ``O(n log n)`` by sweeps on sorted
+    arrays for 1, 2 and 3 objectives and by the dimension-sweep algorithm of
+    Fonseca et al. for more objectives, unless *n_samples* is given in which
+    case it is estimated by Monte-Carlo (see ``hypervolume_monte_carlo``).
     """
+    pointset = np.asarray_chkfinite(pointset, dtype=float)
+    ref = np.asarray_chkfinite(ref, dtype=float)
+    pointset = pointset[np.all(pointset < ref, axis=1)]
+    n_objectives = len(ref)
+    if len(pointset) == 0:
+        return 0.0
+    elif n_objectives == 1:
+        return float(ref[0] - pointset[:, 0].min())
+    elif n_objectives == 2:
+        return _hypervolume_2d(pointset, ref)
+    elif n_objectives == 3:
+        return _hypervolume_3d(pointset, ref)
+    elif n_samples is not None:
+        hv, _ = hypervolume_monte_carlo(
+            pointset, ref, n_samples=n_samples, random_state=random_state
+        )
+        return hv
+
     nds = non_dominated_set(pointset, return_mask=True)
     hv = _HyperVolume(ref)
     return hv.compute(pointset[nds])
 
 
+def hypervolume_monte_carlo(
+    pointset, ref, n_samples=100_000, confidence=0.95, random_state=None
+):
+    """Estimate the hypervolume of a *pointset* according to the reference
+    point *ref* (minimization is assumed) from the fraction of *n_samples*
+    uniform samples of the bounding box of the points which are dominated.
+
+    Returns the estimate and the bounds of its *confidence* interval (Wilson
+    score interval of the dominated fraction).
+    """
+    pointset = np.asarray_chkfinite(pointset, dtype=float)
+    ref = np.asarray_chkfinite(ref, dtype=float)
+    pointset = pointset[np.all(pointset < ref, axis=1)]
+    if len(pointset) == 0:
+        return 0.0, (0.0, 0.0)
+    pointset = pointset[non_dominated_set(pointset, return_mask=True)]
+
+    rng = check_random_state(random_state)
+    lower = pointset.min(axis=0)
+    box = float(np.prod(ref - lower))
+
+    # samples are processed by chunks to bound the memory of the comparisons
+    chunk_size = max(1, 2**22 // (pointset.size + 1))
+    n_dominated = 0
+    for start in range(0, n_samples, chunk_size):
+        size = min(chunk_size, n_samples - start)
+        samples = rng.uniform(lower, ref, size=(size, len(ref)))
+        dominated = np.zeros(size, dtype=bool)
+        for point in pointset:
+            dominated |= np.all(point <= samples, axis=1)
+        n_dominated += int(dominated.sum())
+
+    p = n_dominated / n_samples
+    z = norm.ppf(0.5 + confidence / 2)
+    center = (p + z**2 / (2 * n_samples)) / (1 + z**2 / n_samples)
+    half_width = (
+        z
+        * np.sqrt(p * (1 - p) / n_samples + z**2 / (4 * n_samples**2))
+        / (1 + z**2 / n_samples)
+    )
+    return p * box, (
+        max(center - half_width, 0.0) * box,
+        min(center + half_width, 1.0) * box,
+    )
+
+
+def _hypervolume_2d(pointset, ref):
+    """Area dominated by points of 2 objectives which dominate *ref*."""
+    pointset = pointset[np.lexsort((pointset[:, 1], pointset[:, 0]))]
+    # minimum of the second objective among the points on the left
+    f1 = np.minimum.accumulate(pointset[:, 1])
+    widths = np.diff(np.append(pointset[:, 0], ref[0]))
+    return float(np.sum(widths * (ref[1] - f1)))
+
+
+def _hypervolume_3d(pointset, ref):
+    """Volume dominated by points of 3 objectives which dominate *ref*: the
+    area dominated by the points below a plane of the third objective is
+    maintained in a staircase while the plane sweeps the sorted points."""
+    pointset = pointset[np.argsort(pointset[:, 2], kind="stable")]
+    points = pointset.tolist()
+    ref = ref.tolist()
+    front = _Staircase()
+    area = volume = 0.0
+    for k, point in enumerate(points):
+        if not front.dominates(point):
+            area += front.contribution(point, ref)
+            front.insert(point)
+        z = points[k + 1][2] if k + 1 < len(points) else ref[2]
+        volume += area * (z - point[2])
+    return volume
+
+
+class _Staircase:
+    """Non-dominated points of 2 objectives sorted by their first objective
+    (strictly increasing) so that their second objective is strictly
+    decreasing."""
+
+    def __init__(self):
+        self.f0 = []
+        self.f1 = []
+
+    def __len__(self):
+        return len(self.f0)
+
+    def dominates(self, y):
+        """Whether a point of the staircase weakly dominates ``y``."""
+        i = bisect_right(self.f0, y[0])
+        return i > 0 and self.f1[i - 1] <= y[1]
+
+    def _span(self, y):
+        """Slice of the points weakly dominated by ``y``."""
+        f1, y1 = self.f1, y[1]
+        start = bisect_left(self.f0, y[0])
+        stop, n = start, len(f1)
+        while stop < n and f1[stop] >= y1:
+            stop += 1
+        return start, stop
+
+    def insert(self, y):
+        """Insert ``y`` (not weakly dominated by the staircase) and remove the
+        points it weakly dominates, returns the slice of the removed points."""
+        start, stop = self._span(y)
+        self.f0[start:stop] = [y[0]]
+        self.f1[start:stop] = [y[1]]
+        return start, stop
+
+    def contribution(self, y, ref):
+        """Area (with respect to ``ref``) dominated by ``y`` (which dominates
+        ``ref``) and not by the staircase."""
+        # the area dominated by y and by the staircase is the staircase of
+        # the points moved to the boundary of the area dominated by y
+        start, stop = self._span(y)
+        f0 = [y[0]] if start > 0 else []
+        f1 = [self.f1[start - 1]] if start > 0 else []
+        f0.extend(self.f0[start:stop])
+        f1.extend(self.f1[start:stop])
+        if stop < len(self.f0):
+            f0.append(self.f0[stop])
+            f1.append(y[1])
+        f0.append(ref[0])
+
+        area = (ref[0] - y[0]) * (ref[1] - y[1])
+        for k in range(len(f1)):
+            if f0[k] < ref[0] and f1[k] < ref[1]:
+                area -= (min(f0[k + 1], ref[0]) - f0[k]) * (ref[1] - f1[k])
+        return area
+
+
 class _HyperVolume:
     """
     Hypervolume computation based on variant 3 of the algorithm in the paper:
@@ -47,6 +47,11 @@ class MoScalarFunction(abc.ABC):
         self._weight /= np.sum(self._weight)
         self._scaling = np.ones(self._n_objectives)
 
+        # running statistics of the normalization
+        self._y_min = None
+        self._y_max = None
+        self._n_normalized = 0
+
     def _check_shape(self, y):
         """Check if the shape of y is consistent with the object."""
         if not (
@@ -71,23 +76,63 @@ class MoScalarFunction(abc.ABC):
             return y
         return self._scalarize(y)
 
-    def normalize(self, yi):
+    def _check_shape_many(self, Y):
+        """Convert Y to an array of shape (n_points, _n_objectives)."""
+        Y = np.asarray(Y, dtype=float)
+        if Y.ndim == 1 and self._n_objectives == 1:
+            Y = Y.reshape(-1, 1)
+        if Y.ndim != 2 or Y.shape[1] != self._n_objectives:
+            raise ValueError(
+                f"expected Y to be a 2-D array with {self._n_objectives} columns"
+            )
+        return Y
+
+    def scalarize_many(self, Y):
+        """Convert the rows of the input array into scalar values.
+
+        Args:
+            Y (2-D array): The array of shape (n_points, n_objectives) to be scalarized.
+
+        Returns:
+            1-D array: The converted scalar values.
+        """
+        return self._scalarize_many(self._check_shape_many(Y))
+
+    def normalize(self, yi, incremental=False):
         """Compute normalization constants based on the history of evaluated objective values.
 
         Args:
             yi (array): Array of evaluated objective values.
+            incremental (bool, optional): If ``True``, ``yi`` is expected to extend the history given to the previous call and only its new rows are used to update the normalization constants. Defaults to ``False``.
 
         Raises:
             ValueError: Raised if yi is not a list of scalars each of length _n_objectives.
         """
-        if not is_listlike(yi):
+        if not (is_listlike(yi) or isinstance(yi, np.ndarray)):
             raise ValueError("expected yi to be a list")
-        for y in yi:
-            self._check_shape(y)
-        y_max = np.max(yi, axis=0)
-        y_min = np.min(yi, axis=0)
-        self._utopia_point = y_min
-        self._scaling = 1.0 / np.maximum(y_max - y_min, 1e-6)
+        if not incremental or len(yi) < self._n_normalized:
+            self._y_min, self._y_max, self._n_normalized = None, None, 0
+        if len(yi) > self._n_normalized:
+            Y = self._check_shape_many(yi[self._n_normalized :])
+            y_min, y_max = np.min(Y, axis=0), np.max(Y, axis=0)
+            if self._y_min is not None:
+                y_min = np.minimum(self._y_min, y_min)
+                y_max = np.maximum(self._y_max, y_max)
+            self._y_min, self._y_max = y_min, y_max
+            self._n_normalized = len(yi)
+        if self._y_min is None:
+            raise ValueError("expected yi to be a non-empty list")
+        self._utopia_point = self._y_min
+        self._scaling = 1.0 / np.maximum(self._y_max - self._y_min, 1e-6)
+
+    def resample_weight(self):
+        """Draw new random weights for the objective functions."""
+        self._weight = self._rng.rand(self._n_objectives)
+        self._weight /= np.sum(self._weight)
+        self._update_weight()
+
+    def _update_weight(self):
+        """Update the quantities derived from the weights."""
 
     @abc.abstractmethod
     def _scalarize(self, y):
@@ -100,6 +145,17 @@ class MoScalarFunction(abc.ABC):
             float: Converted scalar value.
         """
 
+    def _scalarize_many(self, Y):
+        """Scalarization of the rows of Y, to be overridden by a vectorized implementation.
+
+        Args:
+            Y: Array of shape (n_points, _n_objectives).
+
+        Returns:
+            1-D array: Converted scalar values.
+        """
+        return np.array([self._scalarize(y) for y in Y], dtype=float)
+
 
 class MoLinearFunction(MoScalarFunction):
     """This scalarizing function linearly combines the individual objective values (after automatically scaling them in [0, 1]).
@@ -123,6 +179,9 @@ class MoLinearFunction(MoScalarFunction):
     def _scalarize(self, y):
         return np.dot(self._weight, np.asarray(y))
 
+    def _scalarize_many(self, Y):
+        return Y.dot(self._weight)
+
 
 class MoChebyshevFunction(MoScalarFunction):
     """This scalarizing function computes a weighted infinity-norm of the individual objective values (after automatically scaling them in [0, 1]).
@@ -147,6 +206,10 @@ class MoChebyshevFunction(MoScalarFunction):
         y = np.multiply(self._scaling, np.asarray(y) - self._utopia_point)
         return np.max(np.multiply(self._weight, np.abs(y)))
 
+    def _scalarize_many(self, Y):
+        Y = self._scaling * (Y - self._utopia_point)
+        return np.max(self._weight * np.abs(Y), axis=1)
+
 
 class MoPBIFunction(MoScalarFunction):
     """This scalarizing function computes the projection of the objective vector along a reference vector and adds a penalty term to minimize deviations from the projected point to the attainable objective set. See https://doi.org/10.1109/TEVC.2007.892759
@@ -168,15 +231,24 @@ class MoPBIFunction(MoScalarFunction):
         penalty: float = 100.0,
     ):
         super().__init__(n_objectives, weight, utopia_point, random_state)
-        self._weightnorm = np.linalg.norm(self._weight) ** 2
+        self._update_weight()
         self._penalty = np.abs(penalty) if np.isreal(penalty) else 100.0
 
+    def _update_weight(self):
+        self._weightnorm = np.linalg.norm(self._weight) ** 2
+
     def _scalarize(self, y):
         y = np.multiply(self._scaling, np.asarray(y) - self._utopia_point)
         d1 = np.dot(self._weight, y) / self._weightnorm
         d2 = np.linalg.norm(y - (d1 * self._weight), 1)
         return d1 + (self._penalty * d2)
 
+    def _scalarize_many(self, Y):
+        Y = self._scaling * (Y - self._utopia_point)
+        d1 = Y.dot(self._weight) / self._weightnorm
+        d2 = np.sum(np.abs(Y - np.outer(d1, self._weight)), axis=1)
+        return d1 + (self._penalty * d2)
+
 
 class MoAugmentedChebyshevFunction(MoScalarFunction):
     """This scalarizing function computes a sum of weighted infinity- and 1-norms of the individual objective values (after automatically scaling them in [0, 1]).
@@ -205,6 +277,10 @@ class MoAugmentedChebyshevFunction(MoScalarFunction):
         y = np.multiply(self._weight, np.abs(y))
         return np.max(y) + (self._alpha * np.linalg.norm(y, 1))
 
+    def _scalarize_many(self, Y):
+        Y = self._weight * np.abs(self._scaling * (Y - self._utopia_point))
+        return np.max(Y, axis=1) + (self._alpha * np.sum(Y, axis=1))
+
 
 class MoQuadraticFunction(MoScalarFunction):
     """This scalarizing function quadratically combines the individual objective values (after automatically scaling them in [0, 1]). It can be interpreted a smoother version of `MoChebyshevFunction`.
@@ -226,8 +302,11 @@ class MoQuadraticFunction(MoScalarFunction):
         alpha: float = 10.0,
     ):
         super().__init__(n_objectives, weight, utopia_point, random_state)
-        U, _, _ = np.linalg.svd(self._weight.reshape(-1, 1), full_matrices=True)
         self._alpha = np.abs(alpha) if np.isreal(alpha) else 10.0
+        self._update_weight()
+
+    def _update_weight(self):
+        U, _, _ = np.linalg.svd(self._weight.reshape(-1, 1), full_matrices=True)
         self._Q = U.dot(
             np.diag([self._alpha if j > 0 else 1.0 for j in range(self._n_objectives)])
         ).dot(U.T)
@@ -235,3 +314,7 @@ class MoQuadraticFunction(MoScalarFunction):
     def _scalarize(self, y):
         y = np.multiply(self._scaling, np.asarray(y) - self._utopia_point)
         return y.T.dot(self._Q).dot(y)
+
+    def _scalarize_many(self, Y):
+        Y = self._scaling * (Y - self._utopia_point)
+        return np.einsum("ij,jk,ik->i", Y, self._Q, Y)
@@ -0,0 +1,118 @@
+import copy
+import warnings
+
+import numpy as np
+from scipy.stats import qmc
+from sklearn.utils import check_random_state
+
+from ..space import Integer, Real, Space
+from ..space.space import _points_to_array
+
+GENERATORS = {"sobol": qmc.Sobol, "halton": qmc.Halton}
+
+
+class CandidatePool:
+    """Pool of candidates of an acquisition function drawn from a scrambled low-discrepancy sequence.
+
+    The pool is transformed once and is refreshed incrementally: at each call of ``sample`` only the oldest ``refresh_fraction`` of the pool is replaced by the next points of the sequence (and transformed). The pool is completed by local perturbations of the incumbents (the best points fitted by the surrogate model) so that the acquisition function is also explored where it is likely to be minimal. The points of the sequence and the perturbations are drawn in the unit hypercube of the ``"normalize"`` transformation of the dimensions (e.g., in log-scale for ``"log-uniform"`` dimensions).
+
+    Args:
+        space (Space): the search space, with the transformation used by the surrogate model.
+        n_points (int): the number of candidates.
+        generator (str, optional): the low-discrepancy sequence, ``"sobol"`` or ``"halton"``. Defaults to ``"sobol"``.
+        refresh_fraction (float, optional): the fraction of the pool replaced by new points of the sequence at each call. Defaults to ``0.1``.
+        local_fraction (float, optional): the fraction of the candidates drawn around the incumbents. Defaults to ``0.2``.
+        n_incumbents (int, optional): the number of incumbents around which local candidates are drawn. Defaults to ``5``.
+        local_scale (float, optional): the standard deviation of the perturbations of the incumbents in the unit hypercube. Defaults to ``0.1``.
+        random_state (int, RandomState instance, or None, optional): the random state. Defaults to ``None``.
+    """
+
+    def __init__(
+        self,
+        space,
+        n_points,
+        generator="sobol",
+        refresh_fraction=0.1,
+        local_fraction=0.2,
+        n_incumbents=5,
+        local_scale=0.1,
+        random_state=None,
+    ):
+        if generator not in GENERATORS:
+            raise ValueError(
+                f"Expected generator to be in {list(GENERATORS)}, got {generator}"
+            )
+        self.space = space
+        self.n_points = n_points
+        self.generator = generator
+        self.refresh_fraction = refresh_fraction
+        self.local_fraction = local_fraction
+        self.n_incumbents = n_incumbents
+        self.local_scale = local_scale
+        self.rng = check_random_state(random_state)
+
+        # the dimensions mapped to the unit hypercube
+        self._unit_space = Space(copy.deepcopy(space.dimensions))
+        self._unit_space.set_transformer("normalize")
+
+        self._sequence = GENERATORS[generator](
+            space.n_dims,
+            scramble=True,
+            seed=self.rng.randint(np.iinfo(np.int32).max),
+        )
+        self._n_local = int(local_fraction * n_points)
+        self._X = None
+        self._Xt = None
+        self._next = 0
+
+    @staticmethod
+    def supports(space) -> bool:
+        """Whether the candidates of a space can be drawn from a low-discrepancy sequence: its dimensions must be independent (no conditions or forbidden clauses) and sampled without generative model."""
+        return not space.is_config_space and space.model_sdv is None
+
+    def _draw(self, U):
+        """Map points of the unit hypercube to the space, returns them and their transformation."""
+        X = _points_to_array(self._unit_space.inverse_transform(U), self.space.n_dims)
+        # the inverse transformation can round off the bounds (e.g., "log-uniform")
+        for j, dim in enumerate(self.space.dimensions):
+            if isinstance(dim, Real):
+                X[:, j] = np.clip(X[:, j].astype(float), dim.low, dim.high)
+            elif isinstance(dim, Integer):
+                X[:, j] = np.clip(X[:, j].astype(int), dim.low, dim.high)
+        return X, self.space.transform(X)
+
+    def _refresh(self):
+        n_global = self.n_points - self._n_local
+        with warnings.catch_warnings():
+            # the balance properties of Sobol' points require powers of 2
+            warnings.simplefilter("ignore")
+            if self._X is None:
+                self._X, self._Xt = self._draw(self._sequence.random(n_global))
+                return
+
+            n_new = min(int(np.ceil(self.refresh_fraction * n_global)), n_global)
+            idx = (self._next + np.arange(n_new)) % n_global
+            self._X[idx], self._Xt[idx] = self._draw(self._sequence.random(n_new))
+            self._next = (self._next + n_new) % n_global
+
+    def sample(self, incumbents=None):
+        """Refresh the pool and draw new local candidates.
+
+        Args:
+            incumbents (list, optional): the points around which local candidates are drawn. Defaults to ``None`` for no local candidates.
+
+        Returns:
+            (np.ndarray, np.ndarray): the candidates as a 2-D object array and their (imputed) transformation.
+        """
+        self._refresh()
+        X, Xt = [self._X], [self._Xt]
+
+        if self._n_local > 0 and incumbents is not None and len(incumbents) > 0:
+            U = self._unit_space.transform(incumbents)
+            U = U[self.rng.randint(len(U), size=self._n_local)]
+            U = U + self.local_scale * self.rng.randn(*U.shape)
+            X_local, Xt_local = self._draw(np.clip(U, 0.0, 1.0))
+            X.append(X_local)
+            Xt.append(Xt_local)
+
+        return np.concatenate(X), self.space.impute(np.concatenate(Xt))
@@ -0,0 +1,82 @@
+"""Multi-start L-BFGS-B minimization with batched evaluations of the objective."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.optimize import fmin_l_bfgs_b
+
+
+class _Batcher:
+    """Objective shared by the running minimizations. The points they query are gathered and evaluated in one call once every running minimization is waiting for its result."""
+
+    def __init__(self, func, n_running):
+        self._func = func
+        self._n_running = n_running
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._results = {}
+        self._error = None
+
+    def _evaluate(self):
+        # called with the lock held, by the last minimization to query a point
+        ids = list(self._pending)
+        X = np.array([self._pending[i] for i in ids])
+        self._pending = {}
+        try:
+            values, grads = self._func(X)
+            grads = np.reshape(grads, X.shape)
+            for k, i in enumerate(ids):
+                self._results[i] = (float(values[k]), np.array(grads[k]))
+        except BaseException as e:
+            self._error = e
+        self._cond.notify_all()
+
+    def __call__(self, x, i):
+        with self._cond:
+            self._pending[i] = np.array(x)
+            if len(self._pending) == self._n_running:
+                self._evaluate()
+            while i not in self._results and self._error is None:
+                self._cond.wait()
+            if self._error is not None:
+                raise self._error
+            return self._results.pop(i)
+
+    def stop(self):
+        with self._cond:
+            self._n_running -= 1
+            if len(self._pending) > 0 and len(self._pending) == self._n_running:
+                self._evaluate()
+
+
+def fmin_l_bfgs_b_batched(func, x0, bounds=None, maxiter=15000):
+    """Minimize ``func`` with L-BFGS-B from each row of ``x0``.
+
+    The minimizations run in lockstep in threads (sharing ``func`` and what it refers to without copies) and the points they query at each iteration are evaluated together with a single call to ``func``. Each minimization follows the same steps as a call to ``scipy.optimize.fmin_l_bfgs_b`` from its starting point.
+
+    Args:
+        func (callable): function of a 2-D array ``X`` of shape (n_points, n_features) returning the values at the rows of ``X`` and their gradients of shape (n_points, n_features).
+        x0 (array): starting points of shape (n_starts, n_features).
+        bounds (list, optional): ``(min, max)`` pairs for each feature. Defaults to ``None``.
+        maxiter (int, optional): maximum number of iterations of each minimization. Defaults to ``15000``.
+
+    Returns:
+        (np.ndarray, np.ndarray): the minimizers of shape (n_starts, n_features) and the minimum values of shape (n_starts,).
+    """
+    x0 = np.asarray(x0, dtype=float)
+    batcher = _Batcher(func, len(x0))
+
+    def minimize(i):
+        try:
+            return fmin_l_bfgs_b(
+                batcher, x0[i], args=(i,), bounds=bounds, maxiter=maxiter
+            )
+        finally:
+            batcher.stop()
+
+    with ThreadPoolExecutor(max_workers=max(len(x0), 1)) as executor:
+        results = list(executor.map(minimize, range(len(x0))))
+
+    xs = np.array([r[0] for r in results]).reshape(x0.shape)
+    fs = np.array([r[1] for r in results])
+    return xs, fs
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+# constants of the splitmix64 finalizer
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix64(h):
+    """Vectorized splitmix64 finalizer of an ``uint64`` array."""
+    h = h ^ (h >> np.uint64(30))
+    h = h * _MIX_1
+    h = h ^ (h >> np.uint64(27))
+    h = h * _MIX_2
+    h = h ^ (h >> np.uint64(31))
+    return h
+
+
+class SampledIndex:
+    """Incrementally maintained hash index of the points sampled by an ``Optimizer``.
+
+    Each point is encoded in a canonical ``uint64`` hash computed column by column with vectorized operations: numerical columns are hashed from their ``float64`` representation (so that ``1`` and ``1.0`` are equal and all ``nan`` are equal) and other columns are hashed from their string representation. The hashes of sampled points are kept in a sorted array so that testing the membership of a batch of ``n`` candidates costs ``O(n log N)`` instead of comparing to the whole history.
+
+    Args:
+        numerical (list): a list of ``bool`` indicating for each column if it is numerical.
+    """
+
+    def __init__(self, numerical):
+        self.numerical = list(numerical)
+        self._hashes = np.zeros(0, dtype=np.uint64)
+        self._size = 0
+
+    def __len__(self):
+        """Number of points added to the index (including duplicates)."""
+        return self._size
+
+    def copy(self):
+        index = SampledIndex(self.numerical)
+        index._hashes = self._hashes.copy()
+        index._size = self._size
+        return index
+
+    def hash(self, X):
+        """Compute the hash of each point.
+
+        Args:
+            X (list): a list of points (or a 2-D array).
+
+        Returns:
+            np.ndarray: an ``uint64`` array of shape ``(len(X),)``.
+        """
+        n = len(X)
+        h = np.zeros(n, dtype=np.uint64)
+        if n == 0:
+            return h
+
+        columns = X.T if isinstance(X, np.ndarray) else zip(*X)
+        for numerical, column in zip(self.numerical, columns):
+            if numerical:
+                try:
+                    values = np.asarray(column, dtype=np.float64)
+                except (TypeError, ValueError):
+                    values = pd.to_numeric(
+                        pd.Series(column, dtype="O"), errors="coerce"
+                    ).to_numpy(dtype=np.float64)
+                # canonical -0.0 and nan
+                values = np.where(np.isnan(values), np.nan, values + 0.0)
+                c = _mix64(values.view(np.uint64))
+            else:
+                c = pd.util.hash_array(np.asarray(column, dtype="O"), categorize=True)
+
+            # order sensitive combination of the column hashes
+            h = _mix64(h ^ (c + _GOLDEN + (h << np.uint64(6)) + (h >> np.uint64(2))))
+        return h
+
+    def contains(self, hashes):
+        """Test if hashes (see ``hash``) are in the index.
+
+        Args:
+            hashes (np.ndarray): an ``uint64`` array.
+
+        Returns:
+            np.ndarray: a boolean array of the same shape as ``hashes``.
+        """
+        if len(self._hashes) == 0:
+            return np.zeros(np.shape(hashes), dtype=bool)
+        idx = np.searchsorted(self._hashes, hashes)
+        idx[idx == len(self._hashes)] = 0
+        return self._hashes[idx] == hashes
+
+    def add(self, X):
+        """Add points to the index.
+
+        Args:
+            X (list): a list of points.
+        """
+        if len(X) == 0:
+            return
+        hashes = np.unique(self.hash(X))
+        hashes = hashes[~self.contains(hashes)]
+        self._hashes = np.insert(
+            self._hashes, np.searchsorted(self._hashes, hashes), hashes
+        )
+        self._size += len(X)
+
+    def filter(self, X):
+        """Filter out points which are duplicated in ``X`` or already in the index.
+
+        Args:
+            X (list): a list of points.
+
+        Returns:
+            np.ndarray: the sorted indices of the points of ``X`` to keep.
+        """
+        hashes = self.hash(X)
+        _, first = np.unique(hashes, return_index=True)
+        first = np.sort(first)
+        return first[~self.contains(hashes[first])]
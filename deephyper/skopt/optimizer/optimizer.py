@@ -1,18 +1,18 @@
+import copy
+import math
 import sys
 import warnings
+from functools import partial
 from math import log
 from numbers import Number
 
 import ConfigSpace as CS
 import numpy as np
-import pandas as pd
-from joblib import Parallel, delayed
-from scipy.optimize import fmin_l_bfgs_b
 from sklearn.base import clone, is_regressor
 from sklearn.multioutput import MultiOutputRegressor
 from sklearn.utils import check_random_state
 
-from ..acquisition import _gaussian_acquisition, gaussian_acquisition_1D
+from ..acquisition import _gaussian_acquisition
 from ..learning import GaussianProcessRegressor
 from ..moo import (
     MoAugmentedChebyshevFunction,
@@ -22,6 +22,9 @@ from ..moo import (
     MoQuadraticFunction,
 )
 from ..space import Categorical, Space
+from ._candidates import CandidatePool
+from ._lbfgs import fmin_l_bfgs_b_batched
+from ._sampled_index import SampledIndex
 from ..utils import (
     check_x_in_space,
     cook_estimator,
@@ -81,8 +84,8 @@ class Optimizer(object):
         - an instance of a `Dimension` object (`Real`, `Integer` or
           `Categorical`).
 
-    base_estimator : `"GP"`, `"RF"`, `"ET"`, `"GBRT"` or sklearn regressor, \
-            default: `"GP"`
+    base_estimator : `"GP"`, `"SGP"`, `"RF"`, `"ET"`, `"GBRT"` or sklearn \
+            regressor, default: `"GP"`
         Should inherit from :obj:`sklearn.base.RegressorMixin`.
         In addition the `predict` method, should have an optional `return_std`
         argument, which returns `std(Y | x)` along with `E[Y | x]`.
@@ -154,7 +157,9 @@ class Optimizer(object):
 
           - Sampling `n_restarts_optimizer` points randomly.
           - `"lbfgs"` is run for 20 iterations with these points as initial
-            points to find local minima.
+            points to find local minima. The runs are done in lockstep and
+            evaluate the acquisition function at all their current points
+            with a single prediction of the model.
           - The optimal of these local minima is used to update the prior.
 
     random_state : int, RandomState instance, or None (default)
@@ -172,6 +177,24 @@ class Optimizer(object):
 
     acq_optimizer_kwargs : dict
         Additional arguments to be passed to the acquisition optimizer.
+        The `"refit_period"` key (int, default: 1) manages how the surrogate
+        model is re-fitted at each `tell`. With a value of `1` a new model is
+        fitted from scratch. With a value `k > 1` and a surrogate model
+        which implements `partial_refit` (such as `RandomForestRegressor` and
+        `ExtraTreesRegressor`) only `ceil(n_estimators / k)` trees are re-fitted
+        at each `tell` so that the whole forest is refreshed every `k` calls.
+        With a `GaussianProcessRegressor` (such as `"GP"`) the kernel
+        hyperparameters are optimized every `k` calls and the new
+        observations are added to the Cholesky decomposition of the previous
+        model in between.
+        The `"candidate_generator"` key (str, default: `"random"`) sets how
+        the `n_points` candidates of the acquisition function are generated.
+        With `"random"` new candidates are sampled at each `tell`. With
+        `"sobol"` or `"halton"` they come from a pool of points of a scrambled
+        low-discrepancy sequence, transformed once and refreshed
+        incrementally, completed by perturbations of the best fitted points
+        and of the best previous candidates. It is only used when the space
+        is not a `ConfigurationSpace` and is sampled without `model_sdv`.
 
     model_queue_size : int or None, default: None
         Keeps list of models only as long as the argument given. In the
@@ -334,8 +357,34 @@ class Optimizer(object):
         self.boltzmann_psucc = acq_optimizer_kwargs.get("boltzmann_psucc", 0)
         self.filter_failures = acq_optimizer_kwargs.get("filter_failures", "mean")
         self.max_failures = acq_optimizer_kwargs.get("max_failures", 100)
+        self.refit_period = acq_optimizer_kwargs.get("refit_period", 1)
+        self.candidate_generator = acq_optimizer_kwargs.get(
+            "candidate_generator", "random"
+        )
         self.acq_optimizer_kwargs = acq_optimizer_kwargs
 
+        if self.candidate_generator not in ["random", "sobol", "halton"]:
+            raise ValueError(
+                "Expected candidate_generator to be 'random', 'sobol' or 'halton', "
+                f"got {self.candidate_generator}"
+            )
+        # created when the first candidates are sampled
+        self._candidate_pool = None
+
+        if not (isinstance(self.refit_period, int) and self.refit_period > 0):
+            raise ValueError(
+                f"Expected refit_period to be an int > 0, got {self.refit_period}"
+            )
+
+        if self.refit_period > 1 and isinstance(
+            self.base_estimator_, GaussianProcessRegressor
+        ):
+            params = self.base_estimator_.get_params()
+            if "refit_period" in params and params["refit_period"] is None:
+                self.base_estimator_ = clone(self.base_estimator_).set_params(
+                    refit_period=self.refit_period
+                )
+
         # Configure search space
 
         if type(dimensions) is CS.ConfigurationSpace:
@@ -413,13 +462,25 @@ class Optimizer(object):
         self.Xi = []
         self.yi = []
 
+        # transformed (and imputed) rows of `Xi`, new rows are transformed
+        # incrementally when the surrogate model is fitted
+        self._Xi_transformed = np.zeros((0, self.space.transformed_n_dims))
+
+        # last fitted surrogate model, used to refit incrementally
+        self._est = None
+        self._est_Xtt = None
+        self._est_yi = []
+        self._est_n_told = 0
+
         # Initialize cache for `ask` method responses
         # This ensures that multiple calls to `ask` with n_points set
         # return same sets of points. Reset to {} at every call to `tell`.
         self.cache_ = {}
 
         # to avoid duplicated samples
-        self.sampled = []
+        self.sampled = SampledIndex(
+            [not isinstance(dim, Categorical) for dim in self.space.dimensions]
+        )
 
         # for botlzmann strategy
         self._min_value = 0
@@ -459,9 +520,18 @@ class Optimizer(object):
 
         optimizer._initial_samples = self._initial_samples
 
-        optimizer.sampled = self.sampled[:]
+        optimizer.sampled = self.sampled.copy()
+
+        # the copy tells its own lies to its scalarizing function
+        optimizer._moo_scalar_function = copy.copy(self._moo_scalar_function)
 
-        optimizer._moo_scalar_function = self._moo_scalar_function
+        # the cache is never modified in place so it can be shared
+        optimizer._Xi_transformed = self._Xi_transformed
+        optimizer._est = self._est
+        optimizer._est_Xtt = self._est_Xtt
+        optimizer._est_yi = self._est_yi
+        optimizer._candidate_pool = self._candidate_pool
+        optimizer._est_n_told = self._est_n_told
 
         if hasattr(self, "gains_"):
             optimizer.gains_ = np.copy(self.gains_)
@@ -500,10 +570,16 @@ class Optimizer(object):
                objective and so on. The type of lie defines different
                flavours of `cl_x` strategies.
 
+               When the surrogate model implements a ``fantasize(X, y)``
+               method (random forests, extra trees and Gaussian processes),
+               the copy of optimizer is not created: a copy of the fitted
+               surrogate model is conditioned on each lie without being
+               re-fitted.
+
         """
         if n_points is None:
             x = self._ask()
-            self.sampled.append(x)
+            self.sampled.add([x])
             return x
 
         if n_points > 0 and (
@@ -516,7 +592,7 @@ class Optimizer(object):
                 X = self._initial_samples[:n]
                 self._initial_samples = self._initial_samples[n:]
                 X = X + self._ask_random_points(size=(n_points - n))
-            self.sampled.extend(X)
+            self.sampled.add(X)
             return X
 
         if self.acq_func == "qLCB":
@@ -548,7 +624,7 @@ class Optimizer(object):
             next_samples = self._last_X[idx].tolist()
 
             # to track sampled values and avoid duplicates
-            self.sampled.extend(next_samples)
+            self.sampled.add(next_samples)
 
             return next_samples
 
@@ -590,17 +666,15 @@ class Optimizer(object):
                     trials += 1
                 else:
                     idx.append(new_idx)
-                    self.sampled.append(self._last_X[new_idx].tolist())
+                    self.sampled.add([self._last_X[new_idx].tolist()])
 
             return self._last_X[idx].tolist()
 
         # q-ACQ multi point acquisition for centralized setting
-        if hasattr(self, "_est") and self.acq_func == "qLCB":
+        if self._est is not None and self.acq_func == "qLCB":
             X_s = self.space.rvs(n_samples=self.n_points, random_state=self.rng)
             X_s = self._filter_duplicated(X_s)
-            X_c = self.space.imp_const.fit_transform(
-                self.space.transform(X_s)
-            )  # candidates
+            X_c = self.space.impute(self.space.transform(X_s))  # candidates
             mu, std = self._est.predict(X_c, return_std=True)
             kappa = self.acq_func_kwargs.get("kappa", 1.96)
             kappas = self.rng.exponential(kappa, size=n_points)
@@ -616,6 +690,18 @@ class Optimizer(object):
         if (n_points, strategy) in self.cache_:
             return self.cache_[(n_points, strategy)]
 
+        # the constant liar is batched when the surrogate model supports
+        # being conditioned on lies without being re-fitted
+        if (
+            self._est is not None
+            and self._est_n_told == len(self.Xi)
+            and hasattr(self._est, "fantasize")
+            and "ps" not in self.acq_func
+        ):
+            X = self._ask_constant_liar(n_points, strategy)
+            self.cache_ = {(n_points, strategy): X}
+            return X
+
         # Copy of the optimizer is made in order to manage the
         # deletion of points with "lie" objective (the copy of
         # optimizer is simply discarded)
@@ -624,7 +710,7 @@ class Optimizer(object):
         X = []
         for i in range(n_points):
             x = opt.ask()
-            self.sampled.append(x)
+            self.sampled.add([x])
             X.append(x)
 
             # the optimizer copy `opt` is discarded anyway
@@ -658,35 +744,92 @@ class Optimizer(object):
 
         return X
 
-    def _filter_duplicated(self, samples):
-        """Filter out duplicated values in ``samples``.
+    def _ask_constant_liar(self, n_points, strategy):
+        """Batched constant liar strategy.
+
+        Instead of copying the optimizer and re-fitting its surrogate model for
+        each lie, a copy of the last fitted surrogate model is conditioned on
+        each lie with its ``fantasize`` method (leaf updates for forests,
+        low-rank Cholesky updates for Gaussian processes). The lies are
+        computed from the (scalarized) objectives fitted by the surrogate model.
+        The first point is the one proposed by the last ``tell`` (i.e., the one
+        returned by ``ask()``) and the next points reuse its candidates.
 
         Args:
-            samples (list): the list of samples to filter.
+            n_points (int): the number of points to ask.
+            strategy (str): a value in ``["cl_min", "cl_mean", "cl_max"]``.
 
         Returns:
-            list: the filtered list of samples
+            list: the list of asked points.
         """
+        est = copy.deepcopy(self._est)
+        yi = self._est_yi
 
-        if self.filter_duplicated:
-            # check duplicated values
+        if strategy == "cl_min":
+            y_lie = np.min(yi)
+        elif strategy == "cl_mean":
+            y_lie = np.mean(yi)
+        else:
+            y_lie = np.max(yi)
 
-            if hasattr(self, "config_space"):
-                hps_names = self.config_space.get_hyperparameter_names()
-            else:
-                hps_names = self.space.dimension_names
+        # the first point was proposed by the last ``tell`` from these candidates
+        # (the first rows of ``next_xs_`` if a batch was already asked)
+        x = self._next_x
+        next_xs = [np.atleast_2d(xs)[0] for xs in self.next_xs_]
+        X_c = self._last_X
+
+        # points proposed by each acquisition function for the whole batch
+        proposals = [[] for _ in next_xs]
+
+        X = []
+        for i in range(n_points):
+            if i > 0:
+                next_xs, _, _ = self._propose(est, yi, X=X_c)
+                next_x = self._select_next_x(next_xs)
+                x = self.space.inverse_transform(next_x.reshape((1, -1)))[0]
+            for proposal, next_x in zip(proposals, next_xs):
+                proposal.append(next_x)
+            self.sampled.add([x])
+            X.append(x)
+
+            if i == n_points - 1:
+                break
 
-            df_samples = pd.DataFrame(data=samples, columns=hps_names, dtype="O")
-            df_samples = df_samples[~df_samples.duplicated(keep="first")]
+            xt = self.space.impute(self.space.transform([x]))
 
-            if len(self.sampled) > 0:
-                df_history = pd.DataFrame(data=self.sampled, columns=hps_names)
-                df_merge = pd.merge(df_samples, df_history, on=None, how="inner")
-                df_samples = pd.concat([df_samples, df_merge])
-                df_samples = df_samples[~df_samples.duplicated(keep=False)]
+            # remove the selected point from the candidates
+            if self.filter_duplicated and len(X_c) > 1:
+                X_c = X_c[~np.all(np.isclose(X_c, xt), axis=1)]
 
-            if len(df_samples) > 0:
-                samples = df_samples.values.tolist()
+            # Lie to the surrogate model.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                est.fantasize(xt, [y_lie])
+
+        # the gains of "gp_hedge" are updated with all the proposals of the batch
+        self.next_xs_ = [np.array(proposal) for proposal in proposals]
+
+        return X
+
+    def _filter_duplicated(self, samples):
+        """Filter out duplicated values in ``samples``.
+
+        Args:
+            samples (list): the list of samples to filter (or a 2-D array).
+
+        Returns:
+            list: the filtered list of samples (or 2-D array).
+        """
+
+        if self.filter_duplicated:
+            # check duplicated values within samples and with the sampled history
+            idx = self.sampled.filter(samples)
+
+            if len(idx) > 0:
+                if isinstance(samples, np.ndarray):
+                    samples = samples[idx]
+                else:
+                    samples = [samples[i] for i in idx]
 
         return samples
 
@@ -724,7 +867,7 @@ class Optimizer(object):
 
     def _sample(self, X, y):
 
-        X = np.asarray(X, dtype="O")
+        X = np.asarray(X)
         y = np.asarray(y)
         size = y.shape[0]
 
@@ -752,9 +895,7 @@ class Optimizer(object):
                 X = np.concatenate(Xs, axis=0)
                 y = np.concatenate(ys, axis=0)
 
-        X = X.tolist()
-        y = y.tolist()
-        return X, y
+        return X, y.tolist()
 
     def _ask_random_points(self, size=None):
         samples = self.space.rvs(n_samples=self.n_points, random_state=self.rng)
@@ -883,9 +1024,6 @@ class Optimizer(object):
         # after being "told" n_initial_points we switch from sampling
         # random points to using a surrogate model
         if fit and self._n_initial_points <= 0 and self.base_estimator_ is not None:
-            transformed_bounds = np.array(self.space.transformed_bounds)
-            est = clone(self.base_estimator_)
-
             # handle failures
             yi = self._filter_failures(self.yi)
 
@@ -893,20 +1031,29 @@ class Optimizer(object):
             if np.ndim(yi) > 1 and np.shape(yi)[1] > 1:
                 yi = self._moo_scalarize(yi)
 
-            # handle size of the sample fit to the estimator
-            Xi, yi = self._sample(self.Xi, yi)
-
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                Xtt = self.space.imp_const.fit_transform(self.space.transform(Xi))
-                est.fit(Xtt, yi)
 
-            # for qLCB save the fitted estimator and skip the selection
-            if self.acq_func == "qLCB":
-                self._est = est
-            else:
+                # handle size of the sample fit to the estimator
+                Xtt, yi = self._sample(self._transform_Xi(), yi)
+
+                est = self._fit_estimator(Xtt, yi)
+
+            self._est = est
+            self._est_Xtt = Xtt
+            self._est_yi = yi
+            self._est_n_told = len(self.Xi)
+
+            # for qLCB the fitted estimator is used directly by ask
+            if self.acq_func != "qLCB":
                 if hasattr(self, "next_xs_") and self.acq_func == "gp_hedge":
-                    self.gains_ -= est.predict(np.vstack(self.next_xs_))
+                    # mean over the points proposed by each acquisition function
+                    # (several after a batched constant liar)
+                    sizes = [len(np.atleast_2d(xs)) for xs in self.next_xs_]
+                    values = est.predict(np.vstack(self.next_xs_))
+                    self.gains_ -= np.array(
+                        [np.mean(v) for v in np.split(values, np.cumsum(sizes)[:-1])]
+                    )
 
                 if self.max_model_queue_size is None:
                     self.models.append(est)
@@ -917,115 +1064,13 @@ class Optimizer(object):
                     self.models.pop(0)
                     self.models.append(est)
 
-                # even with BFGS as optimizer we want to sample a large number
-                # of points and then pick the best ones as starting points
-                X_s = self.space.rvs(n_samples=self.n_points, random_state=self.rng)
-
-                X_s = self._filter_duplicated(X_s)
-
-                X = self.space.imp_const.fit_transform(self.space.transform(X_s))
-                self.next_xs_ = []
-                for cand_acq_func in self.cand_acq_funcs_:
-                    values = _gaussian_acquisition(
-                        X=X,
-                        model=est,
-                        y_opt=np.min(yi),
-                        acq_func=cand_acq_func,
-                        acq_func_kwargs=self.acq_func_kwargs,
-                    )
+                self.next_xs_, X, values = self._propose(est, yi)
 
-                    # cache these values in case the strategy of ask is one-shot
-                    self._last_X = X
-                    self._last_values = values
-
-                    # Find the minimum of the acquisition function by randomly
-                    # sampling points from the space
-                    if self.acq_optimizer == "sampling":
-                        next_x = X[np.argmin(values)]
-
-                    elif self.acq_optimizer == "boltzmann_sampling":
-
-                        p = self.rng.uniform()
-                        if p <= self.boltzmann_psucc:
-                            next_x = X[np.argmin(values)]
-                        else:
-                            values = -values
-
-                            self._min_value = (
-                                self._min_value
-                                if self._min_value is None
-                                else min(values.min(), self._min_value)
-                            )
-                            self._max_value = (
-                                self._max_value
-                                if self._max_value is None
-                                else max(values.max(), self._max_value)
-                            )
-
-                            t = len(self.Xi)
-                            if t == 0:
-                                beta = 0
-                            else:
-                                beta = (
-                                    self.boltzmann_gamma
-                                    * np.log(t)
-                                    / np.abs(self._max_value - self._min_value)
-                                )
-
-                            probs = boltzman_distribution(values, beta)
-
-                            idx = np.argmax(self.rng.multinomial(1, probs))
-
-                            next_x = X[idx]
-
-                    # Use BFGS to find the mimimum of the acquisition function, the
-                    # minimization starts from `n_restarts_optimizer` different
-                    # points and the best minimum is used
-                    elif self.acq_optimizer == "lbfgs":
-                        x0 = X[np.argsort(values)[: self.n_restarts_optimizer]]
-
-                        with warnings.catch_warnings():
-                            warnings.simplefilter("ignore")
-                            results = Parallel(n_jobs=self.n_jobs)(
-                                delayed(fmin_l_bfgs_b)(
-                                    gaussian_acquisition_1D,
-                                    x,
-                                    args=(
-                                        est,
-                                        np.min(yi),
-                                        cand_acq_func,
-                                        self.acq_func_kwargs,
-                                    ),
-                                    bounds=self.space.transformed_bounds,
-                                    approx_grad=False,
-                                    maxiter=20,
-                                )
-                                for x in x0
-                            )
-
-                        cand_xs = np.array([r[0] for r in results])
-                        cand_acqs = np.array([r[1] for r in results])
-                        next_x = cand_xs[np.argmin(cand_acqs)]
-
-                    # lbfgs should handle this but just in case there are
-                    # precision errors.
-                    if not self.space.is_categorical:
-                        if not self.space.is_config_space:
-                            next_x = np.clip(
-                                next_x,
-                                transformed_bounds[:, 0],
-                                transformed_bounds[:, 1],
-                            )
-                    self.next_xs_.append(next_x)
-
-                if self.acq_func == "gp_hedge":
-                    logits = np.array(self.gains_)
-                    logits -= np.max(logits)
-                    exp_logits = np.exp(self.eta * logits)
-                    probs = exp_logits / np.sum(exp_logits)
-                    next_x = self.next_xs_[np.argmax(self.rng.multinomial(1, probs))]
-                else:
-                    next_x = self.next_xs_[0]
+                # cache these values in case the strategy of ask is one-shot
+                self._last_X = X
+                self._last_values = values
+
+                next_x = self._select_next_x(self.next_xs_)
 
                 # note the need for [0] at the end
                 self._next_x = self.space.inverse_transform(next_x.reshape((1, -1)))[0]
@@ -1038,6 +1083,205 @@ class Optimizer(object):
         result.specs = self.specs
         return result
 
+    def _propose(self, est, yi, X=None):
+        """Minimize each candidate acquisition function of the surrogate model ``est``.
+
+        Args:
+            est: the fitted surrogate model.
+            yi (list): the objectives fitted by ``est``.
+            X (np.ndarray, optional): transformed candidates. If ``None``, new candidates are sampled. Defaults to ``None``.
+
+        Returns:
+            (list, np.ndarray, np.ndarray): the minimizer of each acquisition function in the transformed space, the transformed candidates and the values of the last acquisition function at these candidates.
+        """
+        transformed_bounds = np.array(self.space.transformed_bounds)
+        y_opt = np.min(yi)
+
+        if X is None:
+            X = self._sample_candidates()
+
+        next_xs = []
+        for cand_acq_func in self.cand_acq_funcs_:
+            values = _gaussian_acquisition(
+                X=X,
+                model=est,
+                y_opt=y_opt,
+                acq_func=cand_acq_func,
+                acq_func_kwargs=self.acq_func_kwargs,
+            )
+
+            # Find the minimum of the acquisition function by randomly
+            # sampling points from the space
+            if self.acq_optimizer == "sampling":
+                next_x = X[np.argmin(values)]
+
+            elif self.acq_optimizer == "boltzmann_sampling":
+
+                p = self.rng.uniform()
+                if p <= self.boltzmann_psucc:
+                    next_x = X[np.argmin(values)]
+                else:
+                    values = -values
+
+                    self._min_value = (
+                        self._min_value
+                        if self._min_value is None
+                        else min(values.min(), self._min_value)
+                    )
+                    self._max_value = (
+                        self._max_value
+                        if self._max_value is None
+                        else max(values.max(), self._max_value)
+                    )
+
+                    t = len(self.Xi)
+                    if t == 0:
+                        beta = 0
+                    else:
+                        beta = (
+                            self.boltzmann_gamma
+                            * np.log(t)
+                            / np.abs(self._max_value - self._min_value)
+                        )
+
+                    probs = boltzman_distribution(values, beta)
+
+                    idx = np.argmax(self.rng.multinomial(1, probs))
+
+                    next_x = X[idx]
+
+            # Use BFGS to find the mimimum of the acquisition function, the
+            # minimization starts from `n_restarts_optimizer` different
+            # points and the best minimum is used, the restarts run in
+            # lockstep so that each iteration evaluates the acquisition
+            # function at all of them with a single prediction of `est`
+            elif self.acq_optimizer == "lbfgs":
+                x0 = X[np.argsort(values)[: self.n_restarts_optimizer]]
+
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    cand_xs, cand_acqs = fmin_l_bfgs_b_batched(
+                        partial(
+                            _gaussian_acquisition,
+                            model=est,
+                            y_opt=y_opt,
+                            acq_func=cand_acq_func,
+                            return_grad=True,
+                            acq_func_kwargs=self.acq_func_kwargs,
+                        ),
+                        x0,
+                        bounds=self.space.transformed_bounds,
+                        maxiter=20,
+                    )
+
+                next_x = cand_xs[np.argmin(cand_acqs)]
+
+            # lbfgs should handle this but just in case there are
+            # precision errors.
+            if not self.space.is_categorical:
+                if not self.space.is_config_space:
+                    next_x = np.clip(
+                        next_x,
+                        transformed_bounds[:, 0],
+                        transformed_bounds[:, 1],
+                    )
+            next_xs.append(next_x)
+
+        return next_xs, X, values
+
+    def _sample_candidates(self):
+        """Sample new candidates (without duplicates) and transform them."""
+        if self.candidate_generator != "random" and CandidatePool.supports(self.space):
+            return self._sample_candidates_from_pool()
+
+        # even with BFGS as optimizer we want to sample a large number
+        # of points and then pick the best ones as starting points
+        X_s = self.space._rvs_array(n_samples=self.n_points, random_state=self.rng)
+
+        X_s = self._filter_duplicated(X_s)
+
+        return self.space.impute(self.space.transform(X_s))
+
+    def _sample_candidates_from_pool(self):
+        """Sample new candidates (without duplicates) from the low-discrepancy pool
+        and around the best points fitted by the surrogate model."""
+        if self._candidate_pool is None:
+            self._candidate_pool = CandidatePool(
+                self.space,
+                self.n_points,
+                generator=self.candidate_generator,
+                random_state=self.rng.randint(0, np.iinfo(np.int32).max),
+            )
+
+        # the best fitted points and the best previous candidates (the
+        # acquisition function changes little between two steps)
+        n_incumbents = self._candidate_pool.n_incumbents
+        incumbents = []
+        if self._est_Xtt is not None and len(self._est_Xtt) > 0:
+            # the first column is the objective with per second acq. functions
+            yi = np.asarray(self._est_yi).reshape(len(self._est_Xtt), -1)[:, 0]
+            incumbents.append(self._est_Xtt[np.argsort(yi)[:n_incumbents]])
+        if hasattr(self, "_last_X"):
+            best = np.argsort(self._last_values)[:n_incumbents]
+            incumbents.append(self._last_X[best])
+        if len(incumbents) > 0:
+            incumbents = self.space.inverse_transform(np.concatenate(incumbents))
+
+        X_s, Xt = self._candidate_pool.sample(incumbents)
+
+        if self.filter_duplicated:
+            idx = self.sampled.filter(X_s)
+            if len(idx) > 0:
+                Xt = Xt[idx]
+
+        return Xt
+
+    def _select_next_x(self, next_xs):
+        """Select a point among the minimizers returned by ``_propose``."""
+        if self.acq_func == "gp_hedge":
+            logits = np.array(self.gains_)
+            logits -= np.max(logits)
+            exp_logits = np.exp(self.eta * logits)
+            probs = exp_logits / np.sum(exp_logits)
+            return next_xs[np.argmax(self.rng.multinomial(1, probs))]
+        else:
+            return next_xs[0]
+
+    def _transform_Xi(self):
+        """Transform (and impute) the rows of ``Xi`` which are not yet in the cached design matrix.
+
+        Returns:
+            np.ndarray: the transformed rows of ``Xi``.
+        """
+        n_cached = len(self._Xi_transformed)
+        if n_cached < len(self.Xi):
+            Xt = self.space.impute(self.space.transform(self.Xi[n_cached:]))
+            self._Xi_transformed = np.concatenate([self._Xi_transformed, Xt])
+        return self._Xi_transformed
+
+    def _fit_estimator(self, X, y):
+        """Fit the surrogate model. When ``refit_period > 1`` and the previous surrogate model supports it, only a subset of its trees is re-fitted. When the previous surrogate model can be updated with new observations (e.g., ``GaussianProcessRegressor`` or ``SparseGaussianProcessRegressor``) its ``update`` method decides whether it is updated or re-fitted.
+
+        Returns:
+            the fitted surrogate model.
+        """
+        if (
+            self.refit_period > 1
+            and self._est is not None
+            and hasattr(self._est, "partial_refit")
+        ):
+            # shallow copy so that the previous model (in self.models) is kept
+            est = copy.copy(self._est)
+            n_estimators = math.ceil(len(est.estimators_) / self.refit_period)
+            est.partial_refit(X, y, n_estimators)
+        elif self._est is not None and hasattr(self._est, "update"):
+            est = copy.copy(self._est)
+            est.update(X, y)
+        else:
+            est = clone(self.base_estimator_)
+            est.fit(X, y)
+        return est
+
     def _check_y_is_valid(self, x, y):
         """Check if the shape and types of x and y are consistent."""
 
@@ -1108,10 +1352,7 @@ class Optimizer(object):
         return result
 
     def _moo_scalarize(self, yi):
-        if (
-            self._moo_scalar_function is None
-            or self._moo_scalarization_strategy.startswith("r")
-        ):
+        if self._moo_scalar_function is None:
             moo_function = {
                 "Linear": MoLinearFunction,
                 "Chebyshev": MoChebyshevFunction,
@@ -1145,6 +1386,13 @@ class Optimizer(object):
                 random_state=self.rng,
             )
 
-        # compute normalization constants
-        self._moo_scalar_function.normalize(yi)
-        return [self._moo_scalar_function.scalarize(yv) for yv in yi]
+        elif (
+            self._moo_scalarization_strategy.startswith("r")
+            and self._moo_scalarization_weight is None
+        ):
+            self._moo_scalar_function.resample_weight()
+
+        # update normalization constants with the new objectives, the failures
+        # replaced by the mean or max of the objectives do not change them
+        self._moo_scalar_function.normalize(yi, incremental=True)
+        return self._moo_scalar_function.scalarize_many(yi).tolist()
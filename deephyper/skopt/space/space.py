@@ -1,5 +1,6 @@
 import numbers
 import numpy as np
+import pandas as pd
 import yaml
 
 from scipy.stats.distributions import randint
@@ -44,14 +45,7 @@ def _transpose_list_array(x):
 
     n_dims = len(x)
     assert n_dims > 0
-    n_samples = len(x[0])
-    rows = [None] * n_samples
-    for i in range(n_samples):
-        r = [None] * n_dims
-        for j in range(n_dims):
-            r[j] = x[j][i]
-        rows[i] = r
-    return rows
+    return [list(row) for row in zip(*x)]
 
 
 def check_dimension(dimension, transform=None):
@@ -902,6 +896,437 @@ class Categorical(Dimension):
         return 1 if a != b else 0
 
 
+class _Unsupported(Exception):
+    """Raised when a column cannot be processed by a ``_TransformPlan``."""
+
+
+class _NumericColumn(object):
+    """Column of a `Real` or `Integer` dimension in a ``_TransformPlan``.
+
+    The transformers of numerical dimensions are already vectorized, the
+    column only has to be converted to a float array.
+    """
+
+    def __init__(self, dim):
+        self.dim = dim
+        self.size = 1
+
+    def transform(self, column):
+        try:
+            values = np.asarray(column, dtype=float)
+        except (TypeError, ValueError):
+            raise _Unsupported
+        return np.asarray(self.dim.transform(values), dtype=float).reshape(-1, 1)
+
+    def inverse_transform(self, Xt):
+        return self.dim.inverse_transform(Xt[:, 0])
+
+    def sample(self, n_samples, random_state):
+        return np.asarray(self.dim.rvs(n_samples=n_samples, random_state=random_state))
+
+
+class _CategoricalColumn(object):
+    """Column of a `Categorical` dimension in a ``_TransformPlan``.
+
+    The transformed value of each category is precomputed in a table (e.g.,
+    one-hot rows) so that transforming a column is a hash lookup of the
+    categories followed by a ``take`` in the table. The inverse transform
+    decodes the index of the category (``argmax`` of one-hot rows, rounded
+    labels) and takes the category from an array.
+    """
+
+    def __init__(self, dim):
+        self.dim = dim
+        categories = list(dim.categories)
+        self.n_categories = len(categories)
+        if any(isinstance(v, (list, tuple, np.ndarray)) for v in categories):
+            raise _Unsupported
+
+        # the same equality as the dict of the transformers (e.g., 1 == 1.0)
+        self.index = pd.Index(categories, dtype=object)
+        if not (self.index.is_unique):
+            raise _Unsupported
+        # numerical categories are looked up faster in a typed index
+        self.numeric_index = None
+        if all(
+            isinstance(v, numbers.Number) and not (isinstance(v, (bool, np.bool_)))
+            for v in categories
+        ):
+            self.numeric_index = pd.Index(np.array(categories, dtype=float))
+
+        try:
+            table = np.asarray(dim.transform(categories), dtype=float)
+        except (TypeError, ValueError):
+            raise _Unsupported
+        self.table = table.reshape(self.n_categories, -1)
+        self.size = self.table.shape[1]
+
+        # decoded values indexed by the code of the category
+        if dim.transform_ == "onehot":
+            values = categories
+        elif dim.transform_ == "label":
+            values = [
+                dim.transformer.inverse_mapping_[i] for i in range(self.n_categories)
+            ]
+        elif dim.transform_ == "normalize":
+            label_encoder = dim.transformer.transformers[0]
+            values = [
+                label_encoder.inverse_mapping_[i] for i in range(self.n_categories)
+            ]
+        else:
+            values = None
+
+        # categories of the same type are taken from an array with the dtype
+        # that ``np.array`` would infer for any subset of them
+        self.values = values
+        self.values_array = None
+        if values is not None and len({type(v) for v in values}) == 1:
+            values_array = np.array(values)
+            if values_array.ndim == 1:
+                self.values_array = values_array
+
+    def transform(self, column):
+        codes = None
+        if self.numeric_index is not None:
+            values = np.asarray(list(column))
+            if values.dtype.kind in "iuf":
+                codes = self.numeric_index.get_indexer(values.astype(float))
+        if codes is None:
+            codes = self.index.get_indexer(np.asarray(column, dtype=object))
+        if np.any(codes < 0):
+            raise _Unsupported
+        return self.table[codes]
+
+    def _codes(self, Xt):
+        transform = self.dim.transform_
+        if transform == "onehot":
+            if self.n_categories == 1:
+                return np.zeros(len(Xt), dtype=int)
+            elif self.size == 1:
+                return (Xt[:, 0] > 0.5).astype(int)
+            else:
+                return np.argmax(Xt, axis=1)
+
+        values = Xt[:, 0]
+        if np.any(np.isnan(values)):
+            raise _Unsupported
+        if transform == "normalize":
+            normalize = self.dim.transformer.transformers[1]
+            if np.any(values > 1.0 + normalize._eps) or np.any(
+                values < 0.0 - normalize._eps
+            ):
+                raise _Unsupported
+            values = values * (normalize.high - normalize.low) + normalize.low
+        codes = np.round(values).astype(int)
+        if np.any(codes < 0) or np.any(codes >= self.n_categories):
+            raise _Unsupported
+        return codes
+
+    def inverse_transform(self, Xt):
+        if self.values is None:
+            raise _Unsupported
+        codes = self._codes(Xt)
+        if self.values_array is not None:
+            return self.values_array[codes]
+        return np.array([self.values[c] for c in codes])
+
+    def sample(self, n_samples, random_state):
+        return np.asarray(
+            self.dim.rvs(n_samples=n_samples, random_state=random_state), dtype=object
+        )
+
+
+class _TransformPlan(object):
+    """Vectorized transformations of the columns of a `Space`.
+
+    It is built once for the dimensions of a space (and their transformers)
+    and processes samples column by column with array operations instead of
+    packing and unpacking Python lists element by element. When a column
+    cannot be processed (e.g., non numerical transformed values or unknown
+    categories) ``_Unsupported`` is raised and the `Space` falls back to the
+    transformers of its dimensions.
+
+    Parameters
+    ----------
+    dimensions : list
+        The dimensions of the space.
+    """
+
+    def __init__(self, dimensions):
+        self.key = _TransformPlan.key_of(dimensions)
+        self.columns = []
+        for dim in dimensions:
+            try:
+                if isinstance(dim, Categorical):
+                    column = _CategoricalColumn(dim)
+                else:
+                    column = _NumericColumn(dim)
+            except _Unsupported:
+                column = None
+            self.columns.append(column)
+        self.supported = all(column is not None for column in self.columns)
+
+    @staticmethod
+    def key_of(dimensions):
+        return tuple((id(dim), dim.transform_) for dim in dimensions)
+
+    def _as_array(self, X):
+        """Returns ``X`` as a 2-D array with one column per dimension."""
+        if not (isinstance(X, np.ndarray)):
+            X = np.array(X, dtype=object)
+        if X.ndim != 2 or X.shape[1] < len(self.columns) or len(X) == 0:
+            raise _Unsupported
+        return X
+
+    def transform(self, X):
+        if not (self.supported):
+            raise _Unsupported
+        X = self._as_array(X)
+        return np.hstack(
+            [column.transform(X[:, j]) for j, column in enumerate(self.columns)]
+        )
+
+    def inverse_transform(self, Xt):
+        """Inverse transform of ``Xt``, returns one column per dimension."""
+        columns = []
+        start = 0
+        for column in self.columns:
+            if column is None:
+                raise _Unsupported
+            columns.append(column.inverse_transform(Xt[:, start : start + column.size]))
+            start += column.size
+        return columns
+
+    def sample(self, n_samples, random_state):
+        """Draw ``n_samples`` as a 2-D object array in the original space."""
+        if not (self.supported):
+            raise _Unsupported
+        X = np.empty((n_samples, len(self.columns)), dtype=object)
+        for j, column in enumerate(self.columns):
+            X[:, j] = column.sample(n_samples, random_state)
+        return X
+
+
+def _points_to_array(points, n_dims):
+    """2-D object array of a list of points."""
+    X = np.empty((len(points), n_dims), dtype=object)
+    for i, point in enumerate(points):
+        for j, value in enumerate(point):
+            X[i, j] = value
+    return X
+
+
+def _object_array(values):
+    """1-D object array of values (which can be sequences)."""
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+_CONDITION_COMPARISONS = {
+    CS.EqualsCondition: np.equal,
+    CS.NotEqualsCondition: np.not_equal,
+    CS.LessThanCondition: np.less,
+    CS.GreaterThanCondition: np.greater,
+}
+
+
+class _ConfigSpaceSampler(object):
+    """Vectorized sampling of a ``ConfigurationSpace`` with conditions and
+    forbidden clauses.
+
+    Configurations are sampled in the vector representation of ConfigSpace,
+    a 2-D float array with one column per hyperparameter and ``nan`` for
+    inactive hyperparameters. Conditions are evaluated as array predicates
+    on the columns of the parents (in topological order) and forbidden
+    clauses as boolean masks, instead of building one ``Configuration`` per
+    sample. The random draws and the rejection loop follow
+    ``ConfigurationSpace.sample_configuration`` so that the same
+    configurations are sampled for the same seed. ``_Unsupported`` is raised
+    when a condition or forbidden clause cannot be vectorized (e.g.,
+    forbidden relations).
+
+    Parameters
+    ----------
+    config_space : ConfigurationSpace
+        The configuration space.
+
+    placeholders : list
+        The value of each hyperparameter when it is inactive.
+    """
+
+    def __init__(self, config_space, placeholders):
+        self.config_space = config_space
+        self.hyperparameters = config_space.get_hyperparameters()
+        self.placeholders = list(placeholders)
+        self.index = {hp.name: i for i, hp in enumerate(self.hyperparameters)}
+
+        self.choices = {}
+        for i, hp in enumerate(self.hyperparameters):
+            if isinstance(hp, CS.CategoricalHyperparameter):
+                self.choices[i] = _object_array(hp.choices)
+            elif isinstance(hp, CS.OrdinalHyperparameter):
+                self.choices[i] = _object_array(hp.sequence)
+
+        # predicates of the conditions of each child in topological order
+        conditions = {}
+        for condition in config_space.get_conditions():
+            child = condition.get_children()[0].name
+            conditions.setdefault(self.index[child], []).append(
+                self._compile_condition(condition)
+            )
+        self.conditions = [
+            (i, predicate) for i in sorted(conditions) for predicate in conditions[i]
+        ]
+        self.forbiddens = [
+            self._compile_forbidden(forbidden)
+            for forbidden in config_space.get_forbiddens()
+        ]
+
+    def _compile_condition(self, condition):
+        if isinstance(condition, (CS.AndConjunction, CS.OrConjunction)):
+            reduce = (
+                np.logical_and.reduce
+                if isinstance(condition, CS.AndConjunction)
+                else np.logical_or.reduce
+            )
+            predicates = [self._compile_condition(c) for c in condition.components]
+            return lambda V: reduce([predicate(V) for predicate in predicates])
+
+        j = self.index[condition.parent.name]
+        if type(condition) is CS.InCondition:
+            values = np.array(sorted(condition.vector_values), dtype=float)
+            return lambda V: np.isin(V[:, j], values)
+
+        compare = _CONDITION_COMPARISONS.get(type(condition))
+        if compare is None:
+            raise _Unsupported
+        value = condition.vector_value
+        # an inactive parent never satisfies a condition
+        return lambda V: compare(V[:, j], value) & ~np.isnan(V[:, j])
+
+    def _compile_forbidden(self, forbidden):
+        if type(forbidden) is CS.ForbiddenAndConjunction:
+            predicates = [self._compile_forbidden(c) for c in forbidden.components]
+            return lambda V: np.logical_and.reduce(
+                [predicate(V) for predicate in predicates]
+            )
+
+        if type(forbidden) is CS.ForbiddenInClause:
+            j = self.index[forbidden.hyperparameter.name]
+            values = np.array(sorted(forbidden.vector_values), dtype=float)
+            return lambda V: np.isin(V[:, j], values)
+        elif type(forbidden) is CS.ForbiddenEqualsClause:
+            j = self.index[forbidden.hyperparameter.name]
+            value = forbidden.vector_value
+            return lambda V: V[:, j] == value
+        raise _Unsupported
+
+    def deactivate(self, V):
+        """Set the inactive hyperparameters of vectors to ``nan`` (inplace)."""
+        for i, predicate in self.conditions:
+            V[~predicate(V), i] = np.nan
+        return V
+
+    def is_forbidden(self, V):
+        """Returns a boolean mask of the vectors violating a forbidden clause."""
+        forbidden = np.zeros(len(V), dtype=bool)
+        for predicate in self.forbiddens:
+            forbidden |= predicate(V)
+        return forbidden
+
+    def sample_vectors(self, n_samples):
+        """Sample ``n_samples`` valid vectors with the random generator of the
+        configuration space."""
+        random = self.config_space.random
+        accepted = []
+        n_accepted = 0
+        n_rejected = 0
+        missing = n_samples
+        while n_accepted < n_samples:
+            if missing != n_samples:
+                missing = int(missing * 1.1)
+            V = np.empty((missing, len(self.hyperparameters)), dtype=float)
+            for i, hp in enumerate(self.hyperparameters):
+                V[:, i] = hp._sample(random, missing)
+            self.deactivate(V)
+            valid = ~self.is_forbidden(V)
+            n_rejected += missing - np.count_nonzero(valid)
+            if n_rejected >= n_samples * 100:
+                raise CS.exceptions.ForbiddenValueError(
+                    "Cannot sample valid configuration for %s" % self.config_space
+                )
+            accepted.append(V[valid])
+            n_accepted += len(accepted[-1])
+            missing = n_samples - n_accepted
+        return np.concatenate(accepted)[:n_samples]
+
+    def decode(self, V):
+        """Convert vectors to a 2-D object array of values."""
+        X = np.empty(V.shape, dtype=object)
+        for i, hp in enumerate(self.hyperparameters):
+            active = ~np.isnan(V[:, i])
+            column = np.full(len(V), self.placeholders[i], dtype=object)
+            if np.any(active):
+                vector = V[active, i]
+                if i in self.choices:
+                    column[active] = self.choices[i][vector.astype(int)]
+                else:
+                    values = np.asarray(hp._transform(vector), dtype=float)
+                    # the array and scalar transformations can differ by
+                    # rounding errors
+                    values = np.clip(values, hp.lower, hp.upper)
+                    if isinstance(
+                        hp,
+                        (
+                            CS.UniformIntegerHyperparameter,
+                            CS.NormalIntegerHyperparameter,
+                        ),
+                    ):
+                        values = np.round(values).astype(int)
+                    column[active] = values
+            X[:, i] = column
+        return X
+
+    def sample(self, n_samples):
+        """Sample ``n_samples`` configurations as a 2-D object array of shape
+        ``(n_samples, n_hyperparameters)``."""
+        return self.decode(self.sample_vectors(n_samples))
+
+    def deactivate_values(self, confs):
+        """Replace the values of inactive hyperparameters by their placeholder.
+
+        Parameters
+        ----------
+        confs : DataFrame
+            Configurations with one column per hyperparameter.
+
+        Returns
+        -------
+        X : array, shape=(n_samples, n_hyperparameters)
+            A 2-D object array, or ``None`` when a configuration has an
+            illegal value or violates a forbidden clause.
+        """
+        V = np.empty((len(confs), len(self.hyperparameters)), dtype=float)
+        X = np.empty(V.shape, dtype=object)
+        for i, hp in enumerate(self.hyperparameters):
+            values = confs[hp.name].tolist()
+            if not (all(hp.is_legal(v) for v in values)):
+                return None
+            if i in self.choices:
+                V[:, i] = pd.Index(self.choices[i], dtype=object).get_indexer(values)
+            else:
+                V[:, i] = [hp._inverse_transform(v) for v in values]
+            X[:, i] = values
+        self.deactivate(V)
+        if np.any(self.is_forbidden(V)):
+            return None
+        for i, placeholder in enumerate(self.placeholders):
+            X[np.isnan(V[:, i]), i] = placeholder
+        return X
+
+
 class Space(object):
     """Initialize a search space from given specifications.
 
@@ -1145,61 +1570,10 @@ class Space(object):
 
         rng = check_random_state(random_state)
         if self.is_config_space:
-            req_points = []
-
-            hps_names = self.config_space.get_hyperparameter_names()
-
-            if self.model_sdv is None:
-                confs = self.config_space.sample_configuration(n_samples)
-
-                if n_samples == 1:
-                    confs = [confs]
-            else:
-                confs = self.model_sdv.sample(n_samples)
-
-                sdv_names = confs.columns
-
-                new_hps_names = list(set(hps_names) - set(sdv_names))
-
-                # randomly sample the new hyperparameters
-                for name in new_hps_names:
-                    hp = self.config_space.get_hyperparameter(name)
-                    rvs = []
-                    for i in range(n_samples):
-                        v = hp._sample(rng)
-                        rv = hp._transform(v)
-                        rvs.append(rv)
-                    confs[name] = rvs
-
-                # reoder the column names
-                confs = confs[hps_names]
-
-                confs = confs.to_dict("records")
-                for idx, conf in enumerate(confs):
-                    cf = deactivate_inactive_hyperparameters(conf, self.config_space)
-                    confs[idx] = cf.get_dictionary()
-
-                    # TODO: remove because debug instructions
-                    # check if other conditions are not met; generate valid 1-exchange neighbor; need to test and develop the logic
-                    # print('conf invalid...generating valid 1-exchange neighbor')
-                    # neighborhood = get_one_exchange_neighbourhood(cf,1)
-                    # for new_config in neighborhood:
-                    #     print(new_config)
-                    #     print(new_config.is_valid_configuration())
-                    #     confs[idx] = new_config.get_dictionary()
-
-            for idx, conf in enumerate(confs):
-                point = []
-                for hps_name in hps_names:
-                    val = np.nan
-                    if self.hps_type[hps_name] == "Categorical":
-                        val = "NA"
-                    if hps_name in conf.keys():
-                        val = conf[hps_name]
-                    point.append(val)
-                req_points.append(point)
-
-            return req_points
+            X = self._rvs_config_space(n_samples, rng)
+            if X is not None:
+                return X.tolist()
+            return self._rvs_config_space_loop(n_samples, rng)
         else:
             if self.model_sdv is None:
                 # Draw
@@ -1222,6 +1596,120 @@ class Space(object):
                 # Transpose
                 return _transpose_list_array(columns)
 
+    def _get_config_space_sampler(self):
+        """Returns the ``_ConfigSpaceSampler`` of the configuration space or
+        ``None`` if its conditions or forbidden clauses are not supported."""
+        if not (hasattr(self, "_config_space_sampler")):
+            placeholders = [
+                "NA" if self.hps_type[name] == "Categorical" else np.nan
+                for name in self.config_space.get_hyperparameter_names()
+            ]
+            try:
+                sampler = _ConfigSpaceSampler(self.config_space, placeholders)
+            except _Unsupported:
+                sampler = None
+            self._config_space_sampler = sampler
+        return self._config_space_sampler
+
+    def _sample_sdv_new_hyperparameters(self, confs, n_samples, rng):
+        """Sample the hyperparameters which are not generated by the SDV model
+        and reorder the columns as the hyperparameters of the space."""
+        hps_names = self.config_space.get_hyperparameter_names()
+        sdv_names = confs.columns
+
+        new_hps_names = list(set(hps_names) - set(sdv_names))
+
+        # randomly sample the new hyperparameters
+        for name in new_hps_names:
+            hp = self.config_space.get_hyperparameter(name)
+            rvs = []
+            for i in range(n_samples):
+                v = hp._sample(rng)
+                rv = hp._transform(v)
+                rvs.append(rv)
+            confs[name] = rvs
+
+        # reoder the column names
+        return confs[hps_names]
+
+    def _rvs_config_space(self, n_samples, rng):
+        """Draw samples of the configuration space as a 2-D object array with
+        the ``_ConfigSpaceSampler``, returns ``None`` when it is not supported."""
+        sampler = self._get_config_space_sampler()
+        if sampler is None:
+            return None
+
+        if self.model_sdv is None:
+            return sampler.sample(n_samples)
+
+        confs = self.model_sdv.sample(n_samples)
+        confs = self._sample_sdv_new_hyperparameters(confs, n_samples, rng)
+        X = sampler.deactivate_values(confs)
+        if X is None:
+            # raises the same errors as the non vectorized sampling
+            X = _points_to_array(
+                self._deactivate_sdv_confs(confs.to_dict("records")), self.n_dims
+            )
+        return X
+
+    def _deactivate_sdv_confs(self, confs):
+        hps_names = self.config_space.get_hyperparameter_names()
+        for idx, conf in enumerate(confs):
+            cf = deactivate_inactive_hyperparameters(conf, self.config_space)
+            confs[idx] = cf.get_dictionary()
+        return self._confs_to_points(confs, hps_names)
+
+    def _confs_to_points(self, confs, hps_names):
+        req_points = []
+        for idx, conf in enumerate(confs):
+            point = []
+            for hps_name in hps_names:
+                val = np.nan
+                if self.hps_type[hps_name] == "Categorical":
+                    val = "NA"
+                if hps_name in conf.keys():
+                    val = conf[hps_name]
+                point.append(val)
+            req_points.append(point)
+        return req_points
+
+    def _rvs_config_space_loop(self, n_samples, rng):
+        """Draw samples of the configuration space one configuration at a time."""
+        hps_names = self.config_space.get_hyperparameter_names()
+
+        if self.model_sdv is None:
+            confs = self.config_space.sample_configuration(n_samples)
+
+            if n_samples == 1:
+                confs = [confs]
+            confs = [conf.get_dictionary() for conf in confs]
+        else:
+            confs = self.model_sdv.sample(n_samples)
+            confs = self._sample_sdv_new_hyperparameters(confs, n_samples, rng)
+            return self._deactivate_sdv_confs(confs.to_dict("records"))
+
+        return self._confs_to_points(confs, hps_names)
+
+    def _rvs_array(self, n_samples=1, random_state=None):
+        """Draw random samples as a 2-D object array of shape
+        ``(n_samples, n_dims)``. The samples are the same as the ones returned
+        by `rvs` for the same random state but are drawn column by column
+        without building lists of points when possible.
+        """
+        rng = check_random_state(random_state)
+        if self.is_config_space:
+            X = self._rvs_config_space(n_samples, rng)
+            if X is not None:
+                return X
+        elif self.model_sdv is None:
+            plan = self._get_plan()
+            if plan.supported:
+                return plan.sample(n_samples, rng)
+
+        return _points_to_array(
+            self.rvs(n_samples=n_samples, random_state=rng), self.n_dims
+        )
+
     def set_transformer(self, transform):
         """Sets the transformer of all dimension objects to `transform`
 
@@ -1259,6 +1747,14 @@ class Space(object):
         """Returns all transformers as list"""
         return [self.dimensions[j].transform_ for j in range(self.n_dims)]
 
+    def _get_plan(self):
+        """Returns the ``_TransformPlan`` of the current dimensions and transformers."""
+        plan = getattr(self, "_plan", None)
+        if plan is None or plan.key != _TransformPlan.key_of(self.dimensions):
+            plan = _TransformPlan(self.dimensions)
+            self._plan = plan
+        return plan
+
     def transform(self, X):
         """Transform samples from the original space into a warped space.
 
@@ -1267,7 +1763,7 @@ class Space(object):
 
         Parameters
         ----------
-        X : list of lists, shape=(n_samples, n_dims)
+        X : list of lists or array, shape=(n_samples, n_dims)
             The samples to transform.
 
         Returns
@@ -1275,6 +1771,11 @@ class Space(object):
         Xt : array of floats, shape=(n_samples, transformed_n_dims)
             The transformed samples.
         """
+        try:
+            return self._get_plan().transform(X)
+        except _Unsupported:
+            pass
+
         # Pack by dimension
         columns = []
         for dim in self.dimensions:
@@ -1312,8 +1813,12 @@ class Space(object):
         X : list of lists, shape=(n_samples, n_dims)
             The original samples.
         """
+        Xt = self.impute_inverse(Xt)
 
-        Xt = self.imp_const_inv.fit_transform(Xt)
+        try:
+            return _transpose_list_array(self._get_plan().inverse_transform(Xt))
+        except _Unsupported:
+            pass
 
         # Inverse transform
         columns = []
@@ -1333,6 +1838,46 @@ class Space(object):
         # Transpose
         return _transpose_list_array(columns)
 
+    def impute(self, Xt):
+        """Replace the missing values (``nan``) of transformed samples by the
+        constant ``-1000`` (same as ``imp_const.fit_transform``).
+
+        Parameters
+        ----------
+        Xt : array of floats, shape=(n_samples, transformed_n_dims)
+            The transformed samples.
+
+        Returns
+        -------
+        Xt : array of floats, shape=(n_samples, transformed_n_dims)
+            A copy of the samples without missing values.
+        """
+        Xt = np.array(Xt, dtype=float)
+        Xt[np.isnan(Xt)] = -1000
+        return Xt
+
+    def impute_inverse(self, Xt):
+        """Replace the constant ``-1000`` of imputed samples by ``nan`` (same
+        as ``imp_const_inv.fit_transform``).
+
+        Parameters
+        ----------
+        Xt : array of floats, shape=(n_samples, transformed_n_dims)
+            The imputed samples.
+
+        Returns
+        -------
+        Xt : array of floats, shape=(n_samples, transformed_n_dims)
+            A copy of the samples with missing values.
+        """
+        Xt = np.array(Xt, dtype=float)
+        if Xt.ndim != 2:
+            raise ValueError(
+                "Expected 2D array, got {}D array instead.".format(Xt.ndim)
+            )
+        Xt[Xt == -1000] = np.nan
+        return Xt
+
     @property
     def n_dims(self):
         """The dimensionality of the original space."""
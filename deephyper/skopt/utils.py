@@ -12,6 +12,7 @@ from .learning import ExtraTreesRegressor
 from .learning import GaussianProcessRegressor
 from .learning import GradientBoostingQuantileRegressor
 from .learning import RandomForestRegressor
+from .learning import SparseGaussianProcessRegressor
 from .learning.gaussian_process.kernels import ConstantKernel
 from .learning.gaussian_process.kernels import HammingKernel
 from .learning.gaussian_process.kernels import Matern
@@ -354,13 +355,14 @@ def cook_estimator(base_estimator, space=None, **kwargs):
 
     Parameters
     ----------
-    base_estimator : "GP", "RF", "ET", "GBRT", "DUMMY" or sklearn regressor
+    base_estimator : "GP", "SGP", "RF", "ET", "GBRT", "DUMMY" or sklearn regressor
         Should inherit from `sklearn.base.RegressorMixin`.
         In addition the `predict` method should have an optional `return_std`
         argument, which returns `std(Y | x)`` along with `E[Y | x]`.
         If base_estimator is one of ["GP", "RF", "ET", "GBRT", "DUMMY"], a
         surrogate model corresponding to the relevant `X_minimize` function
-        is created.
+        is created. "SGP" is a sparse Gaussian process with inducing points
+        and the same kernel as "GP" for large numbers of observations.
 
     space : Space instance
         Has to be provided if the base_estimator is a gaussian process.
@@ -371,16 +373,16 @@ def cook_estimator(base_estimator, space=None, **kwargs):
     """
     if isinstance(base_estimator, str):
         base_estimator = base_estimator.upper()
-        if base_estimator not in ["GP", "ET", "RF", "GBRT", "DUMMY"]:
+        if base_estimator not in ["GP", "SGP", "ET", "RF", "GBRT", "DUMMY"]:
             raise ValueError(
                 "Valid strings for the base_estimator parameter "
-                " are: 'RF', 'ET', 'GP', 'GBRT' or 'DUMMY' not "
+                " are: 'RF', 'ET', 'GP', 'SGP', 'GBRT' or 'DUMMY' not "
                 "%s." % base_estimator
             )
     elif not is_regressor(base_estimator):
         raise ValueError("base_estimator has to be a regressor.")
 
-    if base_estimator == "GP":
+    if base_estimator in ["GP", "SGP"]:
         if space is not None:
             space = Space(space)
             space = Space(normalize_dimensions(space.dimensions))
@@ -400,12 +402,20 @@ def cook_estimator(base_estimator, space=None, **kwargs):
                 nu=2.5,
             )
 
-        base_estimator = GaussianProcessRegressor(
-            kernel=cov_amplitude * other_kernel,
-            normalize_y=True,
-            noise="gaussian",
-            n_restarts_optimizer=2,
-        )
+        if base_estimator == "GP":
+            base_estimator = GaussianProcessRegressor(
+                kernel=cov_amplitude * other_kernel,
+                normalize_y=True,
+                noise="gaussian",
+                n_restarts_optimizer=2,
+            )
+        else:
+            base_estimator = SparseGaussianProcessRegressor(
+                kernel=cov_amplitude * other_kernel,
+                normalize_y=True,
+                noise="gaussian",
+                n_restarts_optimizer=2,
+            )
     elif base_estimator == "RF":
         base_estimator = RandomForestRegressor(n_estimators=100, min_samples_leaf=3)
     elif base_estimator == "ET":
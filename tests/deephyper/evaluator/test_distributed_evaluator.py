@@ -50,6 +50,37 @@ def _test_mpi_distributed_evaluator():
         assert len(results) == (evaluator.size) * len(configs)
 
 
+def _test_mpi_distributed_evaluator_exchange():
+    from deephyper.evaluator._serial import SerialEvaluator
+    from deephyper.evaluator._distributed import distributed
+
+    from mpi4py import MPI
+
+    if not MPI.Is_initialized():
+        MPI.Init_thread()
+
+    for exchange in ["tree", "gossip"]:
+        # with 4 ranks and a fanout of 3 gossip delivers to every rank
+        evaluator = distributed(backend="mpi")(SerialEvaluator)(
+            run, comm=MPI.COMM_WORLD.Dup(), exchange=exchange, gossip_fanout=3
+        )
+
+        evaluator.submit([{"i": 0, "r": -1}])
+        local_results, other_results = evaluator.gather("ALL")
+        assert len(local_results) == 1
+
+        # messages are forwarded by intermediate ranks when they receive
+        t_start = time.time()
+        while len(other_results) < evaluator.size - 1 and time.time() - t_start < 10:
+            other_results.extend(evaluator.receive())
+        assert len(other_results) == evaluator.size - 1
+        assert sorted(job.rank for job in other_results) == [
+            i for i in range(evaluator.size) if i != evaluator.rank
+        ]
+        evaluator.comm.Barrier()
+        evaluator.close_exchange()
+
+
 @pytest.mark.fast
 @pytest.mark.hps
 @pytest.mark.mpi
@@ -58,6 +89,14 @@ def test_mpi_distributed_evaluator():
     result = deephyper.test.run(command, live_output=False)
 
 
+@pytest.mark.fast
+@pytest.mark.hps
+@pytest.mark.mpi
+def test_mpi_distributed_evaluator_exchange():
+    command = f"mpirun -np 4 {PYTHON} {SCRIPT} _test_mpi_distributed_evaluator_exchange"
+    result = deephyper.test.run(command, live_output=False)
+
+
 if __name__ == "__main__":
     func = sys.argv[-1]
     func = globals()[func]
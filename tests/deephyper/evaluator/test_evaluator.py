@@ -13,6 +13,21 @@ def run_many_results(config, y=0):
     return {"x": config["x"], "y": y}
 
 
+def run_sleep(config):
+    import time
+
+    time.sleep(config["x"])
+    return config["x"]
+
+
+def run_pid(config):
+    import os
+
+    if config["x"] < 0:
+        raise ValueError("x should be positive")
+    return {"objective": config["x"], "pid": os.getpid()}
+
+
 class TestEvaluator(unittest.TestCase):
     @pytest.mark.fast
     @pytest.mark.hps
@@ -207,11 +222,92 @@ class TestEvaluator(unittest.TestCase):
         counter = Counter(results["objective_0"])
         assert counter["42.0"] == 5 and counter["F_out_of_memory"] == 5
 
-    def execute_evaluator(self, method):
+    @pytest.mark.fast
+    @pytest.mark.hps
+    def test_results_sinks(self):
+        import os
+        import tempfile
+
+        from deephyper.evaluator import CSVResultsSink, ResultsSink, SerialEvaluator
+
+        configs = [{"x": i} for i in range(10)]
+
+        def run(config):
+            if config["x"] < 5:
+                return 42.0
+            else:
+                return "F_out_of_memory"
+
+        sinks = ["csv"]
+        try:
+            import pyarrow  # noqa: F401
+
+            sinks.append("arrow")
+        except ImportError:
+            pass
+
+        for sink in sinks:
+            with tempfile.TemporaryDirectory() as log_dir:
+                evaluator = SerialEvaluator(run)
+                evaluator.set_results_sink(sink)
+                for _ in range(2):
+                    evaluator.submit(configs)
+                    evaluator.gather(type="ALL")
+                    evaluator.dump_evals(log_dir=log_dir)
+
+                results = evaluator.load_evals(log_dir=log_dir)
+                assert all(
+                    results.columns
+                    == [
+                        "p:x",
+                        "objective",
+                        "job_id",
+                        "timestamp_submit",
+                        "timestamp_gather",
+                    ]
+                )
+                assert len(results) == 20
+                assert sorted(results["job_id"]) == list(range(20))
+
+                counter = Counter(results["objective"])
+                assert counter["42.0"] == 10 and counter["F_out_of_memory"] == 10
+                evaluator._results_sink.close()
+
+        with pytest.raises(ValueError):
+            evaluator.set_results_sink("json")
+
+        # the base sink is abstract
+        with pytest.raises(TypeError):
+            ResultsSink()
+
+        # custom sink with parameters loading a file it is not bound to
+        class PrefixedCSVResultsSink(CSVResultsSink):
+            def __init__(self, prefix):
+                super().__init__()
+                self.prefix = prefix
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            evaluator = SerialEvaluator(run)
+            evaluator.set_results_sink(PrefixedCSVResultsSink("p"))
+            evaluator.submit(configs)
+            evaluator.gather(type="ALL")
+            evaluator.dump_evals(log_dir=log_dir, filename="first.csv")
+            evaluator.submit(configs[:3])
+            evaluator.gather(type="ALL")
+            evaluator.dump_evals(log_dir=log_dir, filename="second.csv")
+
+            results = evaluator.load_evals(log_dir=log_dir, filename="first.csv")
+            assert len(results) == 10
+            assert evaluator._results_sink.path == os.path.join(log_dir, "second.csv")
+            assert (
+                len(evaluator.load_evals(log_dir=log_dir, filename="second.csv")) == 3
+            )
+
+    def execute_evaluator(self, method, **kwargs):
         from deephyper.evaluator import Evaluator
 
         # without kwargs
-        method_kwargs = {"num_workers": 1}
+        method_kwargs = {"num_workers": 1, **kwargs}
         if method == "ray":
             import os
             import sys
@@ -237,7 +333,11 @@ class TestEvaluator(unittest.TestCase):
         evaluator = Evaluator.create(
             run,
             method=method,
-            method_kwargs={"num_workers": 1, "run_function_kwargs": {"y": 1}},
+            method_kwargs={
+                "num_workers": 1,
+                "run_function_kwargs": {"y": 1},
+                **kwargs,
+            },
         )
 
         configs = [{"x": i} for i in range(10)]
@@ -258,6 +358,7 @@ class TestEvaluator(unittest.TestCase):
             method=method,
             method_kwargs={
                 "num_workers": 1,
+                **kwargs,
             },
         )
 
@@ -271,6 +372,78 @@ class TestEvaluator(unittest.TestCase):
             assert job.result["x"] == config["x"]
             assert job.result["y"] == 0
 
+    @pytest.mark.fast
+    @pytest.mark.hps
+    def test_gather_batch(self):
+        from deephyper.evaluator import Evaluator
+
+        evaluator = Evaluator.create(
+            run, method="thread", method_kwargs={"num_workers": 4}
+        )
+        evaluator.submit([{"x": i} for i in range(20)])
+
+        jobs = []
+        while len(jobs) < 20:
+            batch = evaluator.gather("BATCH", size=1)
+            assert len(batch) >= 1
+            jobs.extend(batch)
+        assert sorted(job.id for job in jobs) == list(range(20))
+        assert len(evaluator._tasks_running) == 0
+
+        with pytest.raises(ValueError):
+            evaluator.gather("ALL")
+
+        # completed tasks are kept when another one failed
+        evaluator.submit([{"x": 0}, {"x": "a"}, {"x": 2}])
+        jobs = []
+        with pytest.raises(TypeError):
+            jobs.extend(evaluator.gather("ALL"))
+        jobs.extend(evaluator.gather("ALL"))
+        assert sorted(job.result for job in jobs) == [0, 2]
+
+    @pytest.mark.slow
+    @pytest.mark.hps
+    def test_timeout(self):
+        from deephyper.core.exceptions import SearchTerminationError
+        from deephyper.evaluator import Evaluator
+
+        backends = [
+            ("process", {}),
+            ("subprocess", {}),
+            ("subprocess", {"persistent": True}),
+        ]
+        for method, method_kwargs in backends:
+            evaluator = Evaluator.create(
+                run_sleep,
+                method=method,
+                method_kwargs={"num_workers": 2, **method_kwargs},
+            )
+
+            # jobs exceeding their own time budget are reported as timed out
+            evaluator.set_job_timeout(5)
+            evaluator.submit([{"x": 0}, {"x": 30}])
+            jobs = evaluator.gather("ALL")
+            assert sorted(str(job.result) for job in jobs) == ["0", "F_timeout"]
+
+            # the worker is available again (the jobs would exceed their time budget
+            # waiting for the timed out job)
+            evaluator.submit([{"x": 0}, {"x": 0}])
+            jobs = evaluator.gather("ALL")
+            assert [job.result for job in jobs] == [0, 0]
+
+            # the running jobs are reported when the timeout of the evaluator expires
+            evaluator.set_job_timeout(None)
+            evaluator.set_timeout(1)
+            evaluator.submit([{"x": 30}, {"x": 30}])
+            with pytest.raises(SearchTerminationError):
+                evaluator.gather("BATCH", size=1)
+            assert [job.result for job in evaluator.jobs_done[-2:]] == [
+                "F_timeout",
+                "F_timeout",
+            ]
+            with pytest.raises(SearchTerminationError):
+                evaluator.submit([{"x": 0}])
+
     @pytest.mark.fast
     @pytest.mark.hps
     def test_serial(self):
@@ -291,6 +464,34 @@ class TestEvaluator(unittest.TestCase):
     def test_subprocess(self):
         self.execute_evaluator("subprocess")
 
+    @pytest.mark.fast
+    @pytest.mark.hps
+    def test_subprocess_persistent(self):
+        self.execute_evaluator("subprocess", persistent=True)
+
+        from deephyper.evaluator import Evaluator
+
+        with Evaluator.create(
+            run_pid,
+            method="subprocess",
+            method_kwargs={
+                "num_workers": 1,
+                "persistent": True,
+                "max_jobs_per_worker": 3,
+            },
+        ) as evaluator:
+            evaluator.submit([{"x": i} for i in range(10)])
+            jobs = evaluator.gather("ALL")
+            assert sorted(job.result for job in jobs) == list(range(10))
+
+            # the worker is replaced every 3 jobs
+            assert len({job.other["pid"] for job in jobs}) == 4
+
+            # errors of the run-function are raised in the main process
+            evaluator.submit([{"x": -1}])
+            with pytest.raises(RuntimeError):
+                evaluator.gather("ALL")
+
     @pytest.mark.fast
     @pytest.mark.hps
     @pytest.mark.ray
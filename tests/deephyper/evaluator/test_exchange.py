@@ -0,0 +1,93 @@
+import pickle
+import random
+
+import pytest
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+def test_encode_jobs():
+    from deephyper.evaluator import Job
+    from deephyper.evaluator._exchange import decode_jobs, encode_jobs
+
+    jobs = []
+    for i in range(100):
+        job = Job(i, {"x": i, "y": "a"}, run_function=None)
+        job.config = job.config.without("job_id")
+        job.rank = 1
+        job.result = -float(i) if i % 10 else "F"
+        job.timestamp_submit, job.timestamp_gather = 1.0, 2.0
+        job.status = Job.DONE
+        jobs.append(job)
+    jobs.append(Job(100, {"z": 0.5}, run_function=None))
+
+    data = encode_jobs(jobs)
+    assert len(data) < len(pickle.dumps(jobs))
+
+    decoded = decode_jobs(data)
+    assert len(decoded) == len(jobs)
+    for job, other in zip(jobs, decoded):
+        assert other.id == job.id
+        assert other.rank == job.rank
+        assert other.config == job.config
+        assert other.result == job.result
+        assert other.timestamp_gather == job.timestamp_gather
+        assert other.run_function is None
+        cfg, obj = other
+        assert cfg is other.config and obj == job.result
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+def test_dissemination_topologies():
+    from deephyper.evaluator._exchange import (
+        binomial_tree_children,
+        decode_message,
+        encode_message,
+        gossip_peers,
+        with_hops,
+    )
+
+    message = encode_message(3, 7, 0, b"payload")
+    assert decode_message(with_hops(message, 2)) == (3, 7, 2, b"payload")
+
+    # each rank receives the message of the root exactly once
+    for size in [1, 2, 5, 16, 513]:
+        for root in [0, size // 2, size - 1]:
+            received = [root]
+            for rank in received:
+                children = binomial_tree_children(rank, root, size)
+                assert len(children) <= max(1, size - 1).bit_length()
+                received.extend(children)
+            assert sorted(received) == list(range(size))
+
+    rng = random.Random(0)
+    for _ in range(100):
+        peers = gossip_peers(4, 8, 3, rng)
+        assert len(set(peers)) == 3
+        assert all(0 <= p < 8 and p != 4 for p in peers)
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+def test_received_messages():
+    from deephyper.evaluator._exchange import ReceivedMessages
+
+    received = ReceivedMessages(window=8)
+
+    # out of order messages are received once
+    assert received.add(0, 2)
+    assert received.add(0, 0)
+    assert received.add(1, 0)
+    assert not (received.add(0, 2))
+    assert not (received.add(0, 0))
+    assert received.add(0, 1)
+    assert not (received.add(0, 1))
+
+    # only a window of sequences is kept per origin
+    assert received.add(0, 100)
+    assert not (received.add(0, 50))
+    assert received.add(0, 95)
+    assert not (received.add(0, 95))
+    assert received._received[0][1] < 1 << 8
+    assert len(received._received) == 2
@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+def test_job_config():
+    from deephyper.evaluator import Job, JobConfig
+
+    config = {"x": 1, "y": [1, 2]}
+    job = Job(0, config, run_function=None)
+
+    # the configuration is not copied and job_id is added
+    assert job.config == {"x": 1, "y": [1, 2], "job_id": 0}
+    assert job.config["y"] is config["y"]
+    assert "job_id" not in config
+    assert list(job.config.values()) == [1, [1, 2], 0]
+
+    cfg, res = job
+    assert cfg is job.config and res is None
+
+    # the configuration is immutable
+    with pytest.raises(TypeError):
+        job.config["x"] = 2
+    with pytest.raises(AttributeError):
+        job.config.foo = 2
+
+    assert job.config.without("job_id") == config
+
+    # configurations with the same keys share them
+    other = Job(1, {"x": 2, "y": [3]}, run_function=None)
+    assert other.config.keys() == job.config.keys()
+    jobs = pickle.loads(pickle.dumps([job, other]))
+    assert jobs[0].config == job.config and jobs[1].config == other.config
+    assert isinstance(jobs[0].config, JobConfig)
+    assert jobs[0].config._keys is jobs[1].config._keys
+
+    # the shared keys are bounded
+    for i in range(JobConfig._MAX_SHARED_KEYS + 10):
+        JobConfig({f"x{i}": i})
+    assert len(JobConfig._SHARED_KEYS) == JobConfig._MAX_SHARED_KEYS
+    assert JobConfig({"x0": 1})["x0"] == 1
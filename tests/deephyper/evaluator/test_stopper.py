@@ -0,0 +1,38 @@
+import pytest
+
+
+@pytest.mark.fast
+@pytest.mark.hps
+def test_successive_halving_stopper(tmp_path):
+    from deephyper.evaluator import Stopper, SuccessiveHalvingStopper
+
+    with pytest.raises(ValueError):
+        SuccessiveHalvingStopper(max_budget=1, min_budget=2)
+    with pytest.raises(ValueError):
+        SuccessiveHalvingStopper(max_budget=9, reduction_factor=1)
+
+    stopper = SuccessiveHalvingStopper(max_budget=9, path=str(tmp_path))
+    assert [stopper.rung(b) for b in [0.5, 1, 2, 3, 8, 9]] == [-1, 0, 0, 1, 1, 2]
+
+    # the stopper of a job is created from its configuration
+    assert Stopper.from_config({"x": 0, "job_id": 0}) is None
+
+    def new_stopper(job_id):
+        config = {"x": 0, "job_id": job_id, "stopper": stopper.to_json()}
+        return Stopper.from_config(config)
+
+    # the first job continues while it is the best of each rung
+    first = new_stopper(0)
+    assert isinstance(first, SuccessiveHalvingStopper) and first.job_id == 0
+    assert not (first.report(1, 0.5)) and not (first.report(2, 0.1))
+    assert not (first.report(3, 0.6)) and first.report(9, 0.7)
+
+    # a job which is not in the top 1/3 of a rung is stopped
+    assert new_stopper(1).report(1, 0.4)
+    assert not (new_stopper(2).report(1, 0.9))
+    # with 4 jobs at the rung the best one continues
+    assert new_stopper(3).report(1, 0.6)
+    # a stopped job remains stopped and failures are stopped
+    job = new_stopper(4)
+    assert job.report(1, 0.0) and job.report(2, 1.0)
+    assert new_stopper(5).report(1, "F") and new_stopper(6).report(1, float("nan"))
@@ -0,0 +1,26 @@
+import pytest
+import numpy as np
+
+
+def load_data(n=10):
+    X = np.random.rand(n, 2)
+    y = np.random.rand(n, 1)
+    return ([X, X], y), (X, y)
+
+
+@pytest.mark.nas
+def test_data_cache(tmp_path):
+    from deephyper.nas.run._data_cache import clear_data_cache, load_data_cached
+
+    data = load_data_cached(load_data, {"n": 5}, cache_dir=str(tmp_path))
+    assert load_data_cached(load_data, {"n": 5}) is data
+    assert load_data_cached(load_data, {"n": 6}) is not data
+    assert type(data[0][0][0]) is np.ndarray
+    assert not data[0][0][0].flags.writeable
+
+    # the other processes map the same files instead of loading new data
+    clear_data_cache()
+    other = load_data_cached(load_data, {"n": 5}, cache_dir=str(tmp_path))
+    assert np.array_equal(other[0][1], data[0][1])
+    assert np.array_equal(other[1][0], data[1][0])
+    assert len(list(tmp_path.iterdir())) == 1
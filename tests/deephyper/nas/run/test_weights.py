@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+
+
+@pytest.mark.nas
+def test_inherit_weights(tmp_path):
+    import tensorflow as tf
+    from deephyper.nas import KSearchSpace
+    from deephyper.nas.node import ConstantNode, VariableNode
+    from deephyper.nas.operation import operation
+    from deephyper.nas.run._util import HistorySaver, get_weights_path, load_weights
+
+    Dense = operation(tf.keras.layers.Dense)
+
+    class TestSpace(KSearchSpace):
+        def build(self):
+            vnode1 = VariableNode()
+            self.connect(self.input_nodes[0], vnode1)
+            vnode1.add_op(Dense(10))
+            vnode1.add_op(Dense(20))
+
+            vnode2 = VariableNode()
+            self.connect(vnode1, vnode2)
+            vnode2.add_op(Dense(5, activation="relu"))
+            vnode2.add_op(Dense(5, activation="tanh"))
+
+            out = ConstantNode(op=Dense(1))
+            self.connect(vnode2, out)
+            return self
+
+    space = TestSpace((3,), (1,)).build()
+
+    parent_layers = {}
+    space.sample([0, 0], node_layers=parent_layers)
+    saver = HistorySaver({"job_id": 0}, save_dir=str(tmp_path / "save"))
+    saver.write_weights(parent_layers)
+    assert saver.weights_path == get_weights_path(str(tmp_path), 0)
+
+    # the second node is mutated, the first node and the output are unchanged
+    child_layers = {}
+    space.sample([0, 1], node_layers=child_layers)
+    loaded = load_weights(saver.weights_path, child_layers)
+    assert len(loaded) == 2 and len(child_layers) == 3
+    for key in loaded:
+        for w, parent_w in zip(
+            child_layers[key].get_weights(), parent_layers[key].get_weights()
+        ):
+            assert np.array_equal(w, parent_w)
+
+    # the shapes of the weights of the second node change
+    child_layers = {}
+    space.sample([1, 0], node_layers=child_layers)
+    assert len(load_weights(saver.weights_path, child_layers)) == 1
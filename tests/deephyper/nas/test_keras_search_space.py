@@ -82,3 +82,58 @@ class TestKSearchSpace(unittest.TestCase):
 
         space = TestSpace([(5,), (5,)], (1,)).build()
         model = space.sample()
+
+    def test_sample_compiled(self):
+        import copy
+
+        import tensorflow as tf
+        from deephyper.nas import KSearchSpace
+        from deephyper.nas.node import ConstantNode, MimeNode, VariableNode
+        from deephyper.nas.operation import Concatenate, Connect, Zero, operation
+
+        Dense = operation(tf.keras.layers.Dense)
+
+        class TestSpace(KSearchSpace):
+            def __init__(self, input_shape, output_shape):
+                super().__init__(input_shape, output_shape)
+
+            def build(self):
+                vnode1 = VariableNode()
+                self.connect(self.input_nodes[0], vnode1)
+                vnode1.add_op(Dense(10))
+                vnode1.add_op(Dense(20))
+
+                mnode = MimeNode(vnode1)
+                mnode.add_op(Dense(5))
+                mnode.add_op(Dense(7))
+                self.connect(vnode1, mnode)
+
+                skip = VariableNode()
+                skip.add_op(Zero())
+                skip.add_op(Connect(self, self.input_nodes[0]))
+
+                merge = ConstantNode(op=Concatenate(self))
+                self.connect(mnode, merge)
+                self.connect(skip, merge)
+
+                out = ConstantNode(op=Dense(1))
+                self.connect(merge, out)
+
+                return self
+
+        space = TestSpace((5,), (1,)).build()
+        n_edges = space.graph.number_of_edges()
+
+        for choice in [[0, 0], [1, 0], [0, 1], [1, 1]]:
+            model = space.sample(choice)
+
+            space_copy = copy.deepcopy(space)
+            space_copy.set_ops(choice)
+            expected = space_copy.create_model()
+
+            assert model.count_params() == expected.count_params()
+            assert len(model.layers) == len(expected.layers)
+
+        # the graph is not modified and the compiled search space is reused
+        assert space.graph.number_of_edges() == n_edges
+        assert space.compile() is space.compile()
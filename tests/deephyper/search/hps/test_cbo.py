@@ -231,6 +231,90 @@ class CBOTest(unittest.TestCase):
         duration = time.time() - t1
         assert duration < 1.5
 
+    def test_adaptive_batching(self):
+        import time
+        from deephyper.evaluator import Evaluator
+        from deephyper.problem import HpProblem
+        from deephyper.search.hps import CBO
+        from deephyper.search.hps._cbo import _AdaptiveBatching
+
+        # without measures the policy updates at each result without buffer
+        policy = _AdaptiveBatching(num_workers=8)
+        assert policy.batch_size == 1 and policy.buffer_size == 0
+
+        # 4 evaluations complete per second and an update takes 1 second
+        policy.observe_latency(1.0)
+        policy._num_completed, policy._duration = 4, 1.0
+        assert policy.batch_size == 4 and policy.buffer_size == 8
+        policy.pending_y = [0] * 3
+        assert not (policy.should_update(0)) and policy.should_update(1)
+
+        policy.buffer = [{"x": i} for i in range(3)]
+        assert policy.pop(2) == [{"x": 0}, {"x": 1}] and len(policy.buffer) == 1
+
+        problem = HpProblem()
+        problem.add_hyperparameter((0.0, 10.0), "x")
+
+        def run(config):
+            time.sleep(0.01)
+            return config["x"]
+
+        evaluator = Evaluator.create(
+            run, method="thread", method_kwargs={"num_workers": 8}
+        )
+        search = CBO(
+            problem,
+            evaluator,
+            random_state=42,
+            n_initial_points=5,
+            adaptive_batching=True,
+        )
+        results = search.search(max_evals=50)
+        assert len(results) >= 50
+        assert results["job_id"].is_unique
+
+    def test_stopper(self):
+        import os
+        import tempfile
+        from deephyper.evaluator import Evaluator, Stopper, SuccessiveHalvingStopper
+        from deephyper.problem import HpProblem
+        from deephyper.search.hps import CBO
+
+        problem = HpProblem()
+        problem.add_hyperparameter((-10.0, 10.0), "x")
+
+        def run(config):
+            stopper = Stopper.from_config(config)
+            for epoch in range(1, 10):
+                objective = -(config["x"] ** 2) - 1 / epoch
+                if stopper.report(epoch, objective):
+                    break
+            return {"objective": objective, "budget": epoch}
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            # the jobs still running when the search returns are waited for when
+            # exiting the evaluator, before the stopper files are removed
+            with Evaluator.create(
+                run, method="thread", method_kwargs={"num_workers": 4}
+            ) as evaluator:
+                stopper = SuccessiveHalvingStopper(max_budget=9)
+                search = CBO(
+                    problem,
+                    evaluator,
+                    random_state=42,
+                    log_dir=log_dir,
+                    stopper=stopper,
+                )
+                results = search.search(max_evals=40)
+
+            assert stopper.path == os.path.join(search._log_dir, "stopper")
+            assert "p:stopper" not in results.columns
+
+        # the budgets are rungs and some evaluations are stopped early
+        assert set(results["budget"]) <= {1, 3, 9}
+        assert (results["budget"] < 9).sum() > 0
+        assert (results["budget"] == 9).sum() > 0
+
 
 if __name__ == "__main__":
     test = CBOTest()
@@ -46,3 +46,52 @@ class RegevoTest(unittest.TestCase):
         res2_array = res2[["arch_seq"]].to_numpy()
 
         assert np.array_equal(res1_array, res2_array)
+
+    def test_regevo_duplicates(self):
+        import os
+        import tempfile
+
+        from deephyper.test.nas import linearReg
+        from deephyper.evaluator import Evaluator
+        from deephyper.nas.run import run_debug_arch
+        from deephyper.search.nas import RegularizedEvolution
+
+        create_evaluator = lambda: Evaluator.create(run_debug_arch, method="serial")
+
+        # the search space of linearReg has a single variable node
+        ((_, high),) = linearReg.Problem.build_search_space().choices()
+        num_archs = high + 1
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            search = RegularizedEvolution(
+                linearReg.Problem,
+                create_evaluator(),
+                random_state=42,
+                log_dir=log_dir,
+                duplicates="resample",
+            )
+            res = search.search(max_evals=num_archs)
+            assert len(set(res["arch_seq"])) == num_archs
+            assert os.path.exists(os.path.join(log_dir, "arch_cache.jsonl"))
+
+            # the cache is loaded back when the search is restarted
+            search = RegularizedEvolution(
+                linearReg.Problem,
+                create_evaluator(),
+                random_state=42,
+                log_dir=log_dir,
+                duplicates="reuse",
+            )
+            assert len(search._cache) == num_archs
+
+            # the space is exhausted: the duplicates are submitted without being
+            # resampled and each cached architecture joins the population once
+            res = search.search(max_evals=2 * num_archs)
+            assert len(res) == 2 * num_archs
+            reused = [
+                search._cache_key(individual[0])
+                for individual in search._population
+                if isinstance(individual, tuple)
+            ]
+            assert len(reused) > 0
+            assert len(reused) == len(set(reused)) == len(search._reused_keys)
@@ -176,3 +176,48 @@ def test_acquisition_per_second_gradient(acq_func):
         mor = MultiOutputRegressor(gpr)
         mor.fit(X, y)
         check_gradient_correctness(X_new, mor, acq_func, 1.5)
+
+
+@pytest.mark.hps
+def test_acquisition_gradient_batch():
+    from deephyper.skopt.optimizer._lbfgs import fmin_l_bfgs_b_batched
+
+    rng = np.random.RandomState(0)
+    X = rng.randn(20, 5)
+    y = np.vstack((X[:, 0], np.abs(X[:, 0]) ** 3)).T
+    X_new = rng.randn(4, 5)
+    bounds = [(-5.0, 5.0)] * 5
+
+    for acq_func in ["LCB", "PI", "EI", "EIps", "PIps"]:
+        gpr = cook_estimator("GP", Space(((-5.0, 5.0),)), random_state=0)
+        model = MultiOutputRegressor(gpr) if acq_func.endswith("ps") else gpr
+        model.fit(X, y if acq_func.endswith("ps") else y[:, 0])
+
+        # the gradients of several samples are the stacked gradients of each sample
+        values, grad = _gaussian_acquisition(
+            X_new, model, 0.5, acq_func=acq_func, return_grad=True
+        )
+        for x, value, x_grad in zip(X_new, values, grad):
+            value_1D, grad_1D = gaussian_acquisition_1D(x, model, 0.5, acq_func)
+            assert_array_almost_equal(value, value_1D[0])
+            assert_array_almost_equal(x_grad, grad_1D)
+
+        # the restarts run in lockstep follow the steps of independent runs
+        xs, fs = fmin_l_bfgs_b_batched(
+            lambda Z: _gaussian_acquisition(
+                Z, model, 0.5, acq_func=acq_func, return_grad=True
+            ),
+            X_new,
+            bounds=bounds,
+            maxiter=20,
+        )
+        for x0, x, f in zip(X_new, xs, fs):
+            x_1D, f_1D, _ = optimize.fmin_l_bfgs_b(
+                gaussian_acquisition_1D,
+                x0,
+                args=(model, 0.5, acq_func),
+                bounds=bounds,
+                maxiter=20,
+            )
+            assert_array_almost_equal(x, x_1D)
+            assert_array_almost_equal(f, f_1D)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+
+@pytest.mark.hps
+def test_pareto_archive():
+    from deephyper.skopt.moo import (
+        ParetoArchive,
+        hypervolume,
+        non_dominated_set,
+        non_dominated_set_ranked,
+    )
+
+    rng = np.random.RandomState(42)
+    for n_objectives in [2, 3]:
+        y = rng.rand(300, n_objectives)
+        ref = np.full(n_objectives, 0.9)
+        archive = ParetoArchive(n_objectives, ref=ref)
+        for i in range(len(y)):
+            archive.add(y[i])
+            if i % 50 == 49:
+                assert np.array_equal(
+                    archive.non_dominated_set(), non_dominated_set(y[: i + 1])
+                )
+                # hypervolume assumes that the points dominate the reference
+                y_ref = y[: i + 1][np.all(y[: i + 1] < ref, axis=1)]
+                assert archive.hypervolume() == pytest.approx(hypervolume(y_ref, ref))
+        for fraction in [0.0, 0.1, 0.5, 1.0]:
+            assert np.array_equal(
+                archive.non_dominated_set_ranked(fraction),
+                non_dominated_set_ranked(y, fraction),
+            )
+        assert np.array_equal(archive.pareto_front(), y[non_dominated_set(y)])
+
+    # duplicates belong to the next fronts
+    archive = ParetoArchive(2)
+    archive.extend([[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [0.5, 0.5], [1.0, 1.0]])
+    assert archive.ranks.tolist() == [0, 0, 1, 0, 2]
+    with pytest.raises(ValueError):
+        archive.hypervolume()
+
+
+@pytest.mark.hps
+def test_hypervolume():
+    from deephyper.skopt.moo import (
+        hypervolume,
+        hypervolume_monte_carlo,
+        non_dominated_set,
+    )
+    from deephyper.skopt.moo._hv import _HyperVolume
+
+    rng = np.random.RandomState(42)
+    for n_objectives in [1, 2, 3, 4]:
+        for y in [
+            rng.rand(100, n_objectives),
+            rng.randint(0, 4, size=(100, n_objectives)).astype(float),
+        ]:
+            ref = np.full(n_objectives, 2.5)
+            # the dimension-sweep algorithm on the non-dominated points
+            y_ref = y[np.all(y < ref, axis=1)]
+            expected = _HyperVolume(ref).compute(y_ref[non_dominated_set(y_ref)])
+            assert hypervolume(y, ref) == pytest.approx(expected)
+
+    y = rng.rand(50, 4)
+    ref = np.ones(4)
+    expected = hypervolume(y, ref)
+    estimate, (lower, upper) = hypervolume_monte_carlo(
+        y, ref, n_samples=20_000, random_state=0
+    )
+    assert lower <= estimate <= upper
+    assert lower <= expected <= upper
+    assert hypervolume(y, ref, n_samples=20_000, random_state=0) == estimate
+
+
+@pytest.mark.hps
+def test_scalarize_many():
+    from deephyper.skopt.moo import (
+        MoAugmentedChebyshevFunction,
+        MoChebyshevFunction,
+        MoLinearFunction,
+        MoPBIFunction,
+        MoQuadraticFunction,
+    )
+
+    rng = np.random.RandomState(42)
+    y = rng.randn(100, 3)
+    for moo_function in [
+        MoLinearFunction,
+        MoChebyshevFunction,
+        MoPBIFunction,
+        MoAugmentedChebyshevFunction,
+        MoQuadraticFunction,
+    ]:
+        f = moo_function(n_objectives=3, random_state=42)
+        f.normalize(y[:10].tolist())
+        f.normalize(y[:60].tolist(), incremental=True)
+        f.normalize(y.tolist(), incremental=True)
+        assert np.allclose(f._utopia_point, np.min(y, axis=0))
+        assert np.allclose(f._scaling, 1 / (np.max(y, axis=0) - np.min(y, axis=0)))
+        assert np.allclose(f.scalarize_many(y), [f.scalarize(yi) for yi in y])
+
+        f.resample_weight()
+        assert np.allclose(f.scalarize_many(y), [f.scalarize(yi) for yi in y])
+
+        with pytest.raises(ValueError):
+            f.scalarize_many(y[:, :2])
@@ -25,6 +25,7 @@ ACQ_FUNCS_PS = ["EIps", "PIps"]
 ACQ_FUNCS_MIXED = ["EI", "EIps"]
 ESTIMATOR_STRINGS = [
     "GP",
+    "SGP",
     "RF",
     "ET",
     "GBRT",
@@ -362,7 +363,7 @@ def test_exhaust_initial_calls(base_estimator):
 def test_optimizer_base_estimator_string_invalid():
     with pytest.raises(ValueError) as e:
         Optimizer([(-2.0, 2.0)], base_estimator="rtr", n_initial_points=1)
-    assert "'RF', 'ET', 'GP', 'GBRT' or 'DUMMY'" in str(e.value)
+    assert "'RF', 'ET', 'GP', 'SGP', 'GBRT' or 'DUMMY'" in str(e.value)
 
 
 @pytest.mark.hps
@@ -482,3 +483,160 @@ def test_categorical_only2():
     opt.tell(next_x, [linalg.norm(x) for x in next_x])
     next_x = opt.ask(n_points=4)
     assert len(next_x) == 4
+
+
+@pytest.mark.hps
+def test_filter_duplicated():
+    from deephyper.skopt.optimizer._sampled_index import SampledIndex
+    from deephyper.skopt.space import Categorical, Integer
+
+    space = [Integer(0, 2), Categorical(["a", "b"])]
+    opt = Optimizer(space, n_initial_points=12, acq_optimizer="sampling")
+
+    # the 6 unique points of the space are sampled without duplicates
+    X = opt.ask(n_points=6)
+    assert len(X) == 6
+    assert len({tuple(x) for x in X}) == 6
+    assert len(opt.sampled) == 6
+
+    # duplicates within candidates and with the sampled history are removed
+    samples = [[0, "a"], [0.0, "a"], [1, "a"], [np.int64(1), "b"]]
+    opt.sampled = SampledIndex([True, False])
+    opt.sampled.add([[1, "a"]])
+    assert opt._filter_duplicated(samples) == [[0, "a"], [np.int64(1), "b"]]
+
+
+@pytest.mark.hps
+def test_refit_period():
+    base_estimator = RandomForestRegressor(n_estimators=10, random_state=2)
+    opt = Optimizer(
+        [(-2.0, 2.0)],
+        base_estimator,
+        n_initial_points=2,
+        acq_optimizer="sampling",
+        acq_optimizer_kwargs={"n_points": 100, "refit_period": 5},
+    )
+    opt.run(bench1, n_iter=4)
+
+    # the transformed design matrix is cached
+    assert opt._Xi_transformed.shape == (4, 1)
+
+    # 2 trees out of 10 are re-fitted at each tell
+    first, second = opt.models[-2:]
+    assert first is not second
+    n_shared = sum(a is b for a, b in zip(first.estimators_, second.estimators_))
+    assert n_shared == 8
+
+    with pytest.raises(ValueError):
+        Optimizer([(-2.0, 2.0)], acq_optimizer_kwargs={"refit_period": 0})
+
+
+@pytest.mark.hps
+def test_constant_liar_fantasize():
+    for base_estimator in ["RF", "ET", "GP"]:
+        opt = Optimizer(
+            [(-2.0, 2.0), (-2.0, 2.0)],
+            base_estimator,
+            n_initial_points=5,
+            acq_optimizer="sampling",
+            acq_optimizer_kwargs={"n_points": 100},
+            random_state=1,
+        )
+        X = opt.ask(10)
+        opt.tell(X, [bench1(x) for x in X])
+
+        est = opt.models[-1]
+        X_c = np.random.RandomState(0).uniform(-2, 2, size=(10, 2))
+        y_c = est.predict(X_c)
+
+        for strategy in ["cl_min", "cl_mean", "cl_max"]:
+            X = opt.ask(5, strategy=strategy)
+            assert len(X) == 5
+            assert len({tuple(x) for x in X}) == 5
+
+        # the lies do not modify the fitted surrogate model
+        assert len(opt.Xi) == 10
+        assert np.allclose(est.predict(X_c), y_c)
+
+        # the batch starts from the point proposed by the last tell
+        opt.tell(X, [bench1(x) for x in X])
+        next_x = opt._next_x
+        assert opt.ask(3)[0] == next_x
+        assert opt.ask() == next_x
+
+    # the gains of gp_hedge are updated with the proposals of the whole batch
+    opt = Optimizer(
+        [(-2.0, 2.0), (-2.0, 2.0)],
+        "GP",
+        n_initial_points=5,
+        acq_func="gp_hedge",
+        acq_optimizer="sampling",
+        acq_optimizer_kwargs={"n_points": 100},
+        random_state=1,
+    )
+    X = opt.ask(10)
+    opt.tell(X, [bench1(x) for x in X])
+    X = opt.ask(4)
+    assert len(opt.next_xs_) == len(opt.gains_)
+    assert all(np.shape(xs) == (4, 2) for xs in opt.next_xs_)
+    gains = np.copy(opt.gains_)
+    opt.tell(X, [bench1(x) for x in X])
+    assert np.shape(opt.gains_) == np.shape(gains)
+    assert not np.allclose(opt.gains_, gains)
+
+
+@pytest.mark.hps
+def test_candidate_generator():
+    from deephyper.skopt.space import Categorical, Integer, Real
+
+    dimensions = [(-5.0, 10.0), (0.0, 15.0)]
+    for generator in ["sobol", "halton"]:
+        opt = Optimizer(
+            dimensions,
+            "GP",
+            n_initial_points=5,
+            acq_optimizer="sampling",
+            acq_optimizer_kwargs={"n_points": 200, "candidate_generator": generator},
+            random_state=1,
+        )
+        opt.run(branin, n_iter=8)
+
+        # the pool is refreshed incrementally and completed by local candidates
+        pool = opt._candidate_pool
+        assert pool.generator == generator
+        X_pool = pool._X.copy()
+        X_c = opt._sample_candidates()
+        assert np.sum(np.any(X_pool != pool._X, axis=1)) == 16
+        assert 160 < len(X_c) <= 200
+        assert np.all((X_c >= 0) & (X_c <= 1))
+
+        # the candidates are not duplicates of the evaluated points
+        for x in opt.Xi:
+            assert not np.any(np.all(X_c == opt.space.transform([x]), axis=1))
+
+    # the candidates of a mixed space are within its bounds, including the points
+    # of the boundary of the unit hypercube (e.g., local candidates clipped to it)
+    dimensions = [
+        Real(1e-4, 1, prior="log-uniform"),
+        Integer(1, 10),
+        Categorical(["a", "b"]),
+        Categorical([True, False]),
+    ]
+    opt = Optimizer(
+        dimensions,
+        "RF",
+        n_initial_points=3,
+        acq_optimizer="sampling",
+        acq_optimizer_kwargs={"n_points": 200, "candidate_generator": "sobol"},
+        random_state=1,
+    )
+    rng = np.random.RandomState(0)
+    for _ in range(10):
+        x = opt.ask()
+        assert x in opt.space
+        opt.tell(x, rng.rand())
+    X_corners, _ = opt._candidate_pool._draw(np.array([[0.0] * 4, [1.0] * 4]))
+    assert X_corners.tolist() == [[1e-4, 1, "a", False], [1, 10, "b", True]]
+
+    with pytest.raises(ValueError):
+        Optimizer(dimensions, acq_optimizer_kwargs={"candidate_generator": "lhs"})
@@ -854,3 +854,127 @@ def test_normalize_bounds():
         check_limits(x[0][0], -999, 189000)
         y = space.transform(x)
         check_limits(y, 0.0, 1.0)
+
+
+@pytest.mark.hps
+def test_transform_plan_matches_dimensions():
+    def make_space():
+        return Space(
+            [
+                Real(1e-3, 1.0, prior="log-uniform"),
+                Real(-5.0, 5.0),
+                Integer(1, 100),
+                Integer(1, 1000, prior="log-uniform"),
+                Categorical(["a", "b", "c", "d"]),
+                Categorical([True, False]),
+                Categorical([1, 2, 3]),
+                Categorical(["x"]),
+                Categorical([0.5, "m", 3]),
+            ]
+        )
+
+    def per_dimension(space, X):
+        Xt = np.hstack(
+            [
+                np.asarray(dim.transform([x[j] for x in X])).reshape((len(X), -1))
+                for j, dim in enumerate(space.dimensions)
+            ]
+        )
+        columns, start = [], 0
+        for dim in space.dimensions:
+            offset = dim.transformed_size
+            if offset == 1:
+                columns.append(dim.inverse_transform(Xt[:, start]))
+            else:
+                columns.append(dim.inverse_transform(Xt[:, start : start + offset]))
+            start += offset
+        return Xt, [list(x) for x in zip(*columns)]
+
+    for transform in [None, "normalize"]:
+        space = make_space()
+        if transform is not None:
+            space.set_transformer(transform)
+
+        X = space.rvs(n_samples=200, random_state=1)
+        X_array = space._rvs_array(n_samples=200, random_state=1)
+        assert X_array.tolist() == X
+
+        Xt_ref, X_ref = per_dimension(space, X)
+        Xt = space.transform(X)
+        assert Xt.shape == Xt_ref.shape
+        assert_array_almost_equal(Xt, Xt_ref)
+        assert_array_almost_equal(space.transform(X_array), Xt_ref)
+
+        X_inv = space.inverse_transform(Xt)
+        assert X_inv == X_ref
+        assert [list(map(type, x)) for x in X_inv] == [
+            list(map(type, x)) for x in X_ref
+        ]
+
+    # unknown categories fall back to the transformers of the dimensions
+    space = Space([Real(0.0, 1.0), Categorical(["a", "b"])])
+    with pytest.raises(KeyError):
+        space.transform([[0.5, "c"]])
+
+
+@pytest.mark.hps
+def test_config_space_sampling_matches_sample_configuration():
+    import ConfigSpace as CS
+
+    def make_config_space():
+        config_space = CS.ConfigurationSpace(seed=42)
+        model = CS.CategoricalHyperparameter("model", ["svm", "rf", "mlp"])
+        C = CS.UniformFloatHyperparameter("C", 1e-3, 1e3, log=True)
+        kernel = CS.CategoricalHyperparameter("kernel", ["rbf", "poly", "linear"])
+        degree = CS.UniformIntegerHyperparameter("degree", 2, 5)
+        depth = CS.OrdinalHyperparameter("depth", [1, 2, 4, 8])
+        lr = CS.UniformFloatHyperparameter("lr", 1e-4, 1e-1, log=True)
+        units = CS.UniformIntegerHyperparameter("units", 8, 512)
+        config_space.add_hyperparameters([model, C, kernel, degree, depth, lr, units])
+        config_space.add_conditions(
+            [
+                CS.EqualsCondition(C, model, "svm"),
+                CS.EqualsCondition(kernel, model, "svm"),
+                CS.AndConjunction(
+                    CS.EqualsCondition(degree, kernel, "poly"),
+                    CS.EqualsCondition(degree, model, "svm"),
+                ),
+                CS.InCondition(depth, model, ["rf"]),
+                CS.NotEqualsCondition(lr, model, "svm"),
+                CS.GreaterThanCondition(units, lr, 1e-3),
+            ]
+        )
+        config_space.add_forbidden_clauses(
+            [
+                CS.ForbiddenEqualsClause(kernel, "linear"),
+                CS.ForbiddenAndConjunction(
+                    CS.ForbiddenEqualsClause(model, "rf"),
+                    CS.ForbiddenInClause(depth, [8]),
+                ),
+            ]
+        )
+        return config_space
+
+    config_space = make_config_space()
+    hps_names = config_space.get_hyperparameter_names()
+    confs = config_space.sample_configuration(200)
+
+    space = Space(make_config_space())
+    X = space.rvs(n_samples=200)
+    assert len(X) == 200
+    for conf, x in zip(confs, X):
+        for name, value in zip(hps_names, x):
+            if name not in conf:
+                if space.hps_type[name] == "Categorical":
+                    assert value == "NA"
+                else:
+                    assert np.isnan(value)
+            elif isinstance(conf[name], float):
+                assert value == pytest.approx(conf[name], rel=1e-12)
+            else:
+                assert value == conf[name] and type(value) is type(conf[name])
+
+    # candidates are transformed without missing values
+    Xt = space.impute(space.transform(space._rvs_array(n_samples=100)))
+    assert Xt.shape == (100, space.transformed_n_dims)
+    assert not np.any(np.isnan(Xt))